@@ -107,7 +107,7 @@ def register_template_context_processors(app):
     def inject_menu_items():
         """Make menu items and filtered admin menu available to all templates"""
         from flask_login import current_user
-        from app.utils import filter_admin_menu_by_roles
+        from app.members.utils import filter_admin_menu_by_roles
         
         filtered_admin_menu = filter_admin_menu_by_roles(current_user)
         return dict(
@@ -119,15 +119,10 @@ def register_template_context_processors(app):
     @app.context_processor
     def inject_footer_policy_pages():
         """Make footer policy pages available to all templates"""
-        import sqlalchemy as sa
-        from app.models import PolicyPage
+        from app.content.utils import get_footer_policy_pages
         
         try:
-            footer_policy_pages = db.session.scalars(
-                sa.select(PolicyPage)
-                .where(PolicyPage.is_active == True, PolicyPage.show_in_footer == True)
-                .order_by(PolicyPage.sort_order, PolicyPage.title)
-            ).all()
+            footer_policy_pages = get_footer_policy_pages()
         except Exception as e:
             # Handle database errors gracefully (e.g., during tests or initial setup)
             app.logger.debug(f"Could not load footer policy pages: {e}")
@@ -182,6 +177,10 @@ def register_template_filters(app):
 def register_middleware(app):
     """Register middleware functions"""
     
+    # Batch last_seen writes from track_user_activity
+    from app.activity import last_seen_buffer
+    last_seen_buffer.init_app(app)
+    
     @app.after_request
     def add_security_headers(response):
         """Add security headers to all responses"""
@@ -229,11 +228,11 @@ def register_middleware(app):
                 flash('Your account has been locked. Please contact the administrator.', 'error')
                 return redirect(url_for('login'))
             
-            # Update last_seen date
+            # Queue the last_seen date; the buffer writes it in bulk outside the request
             today = date.today()
             if current_user.last_seen != today:
-                current_user.last_seen = today
-                db.session.commit()
+                from app.activity import last_seen_buffer
+                last_seen_buffer.record(current_user.id, today)
 
 
 def register_routes(app):
@@ -257,10 +256,21 @@ def register_routes(app):
     app.register_blueprint(rollups_bp, url_prefix='/rollups')
     app.register_blueprint(api_bp)
     
+    # Size the calendar JSON cache from config
+    from app.bookings.cache import calendar_cache
+    calendar_cache.init_app(app)
+    
     # Register error handlers
     from app.errors import register_error_handlers
     register_error_handlers(app)
     
+    # Audit log index commands (`flask audit ...`)
+    from app.audit_index import audit_cli
+    app.cli.add_command(audit_cli)
+    
+    # Opt-in audit entries from session flush/commit events (AUDIT_SESSION_EVENTS)
+    from app import audit_events
+    
     # Import models to ensure they're loaded
     from app import models
 
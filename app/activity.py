@@ -0,0 +1,168 @@
+"""
+Write-behind buffer for member last_seen activity dates.
+
+track_user_activity records a member's first request of the day here instead of
+committing inside the request. Pending dates are written by a background thread
+every LAST_SEEN_FLUSH_SECONDS as one UPDATE ... WHERE id IN (...) per day, and once
+more when the process exits. Set LAST_SEEN_FLUSH_SECONDS to 0 to disable the thread
+and call flush() explicitly (tests do this).
+
+Each worker process keeps its own buffer, so a member may be written once per
+worker per day. A crash loses at most one interval of updates, which only affects
+the "last seen" date shown to admins.
+"""
+
+import atexit
+import os
+import threading
+from datetime import date
+from typing import Dict
+
+import sqlalchemy as sa
+
+from app import db
+from app.models import Member
+
+
+class LastSeenBuffer:
+    """Thread-safe buffer of member_id -> last_seen date, flushed in bulk."""
+
+    def __init__(self, flush_seconds: float = 60):
+        self.flush_seconds = flush_seconds
+        self._pending: Dict[int, date] = {}
+        self._recorded: Dict[int, date] = {}  # Latest date buffered per member in this process
+        self._lock = threading.Lock()
+        self._app = None
+        self._thread = None
+        self._thread_pid = None
+        self._atexit_registered = False
+        self._stop = threading.Event()
+        self.flushes = 0
+        self.rows_written = 0
+
+    def init_app(self, app):
+        """Configure the flush interval from the application config."""
+        self._app = app
+        self.flush_seconds = app.config.get('LAST_SEEN_FLUSH_SECONDS', self.flush_seconds)
+        with self._lock:
+            self._pending.clear()
+            self._recorded.clear()
+
+    def record(self, member_id: int, seen_on: date) -> bool:
+        """
+        Buffer a member's activity date.
+
+        Args:
+            member_id: Member ID
+            seen_on: Date of the activity
+
+        Returns:
+            True if the date was newly buffered, False if already recorded in this process
+        """
+        with self._lock:
+            if self._recorded.get(member_id, date.min) >= seen_on:
+                return False
+            self._recorded[member_id] = seen_on
+            self._pending[member_id] = seen_on
+        self._ensure_thread()
+        return True
+
+    def pending(self) -> Dict[int, date]:
+        """Get a copy of the buffered, unwritten dates."""
+        with self._lock:
+            return dict(self._pending)
+
+    def flush(self) -> int:
+        """
+        Write buffered dates with one UPDATE per distinct date.
+
+        Never moves a member's last_seen backwards. Must run inside an application
+        context, outside any open session transaction on the same connection.
+
+        Returns:
+            Number of members whose buffered date was written
+        """
+        with self._lock:
+            pending, self._pending = self._pending, {}
+        if not pending:
+            return 0
+
+        by_date: Dict[date, list] = {}
+        for member_id, seen_on in pending.items():
+            by_date.setdefault(seen_on, []).append(member_id)
+
+        try:
+            with db.engine.begin() as connection:
+                for seen_on, member_ids in by_date.items():
+                    connection.execute(
+                        sa.update(Member.__table__)
+                        .where(Member.__table__.c.id.in_(sorted(member_ids)))
+                        .where(sa.or_(Member.__table__.c.last_seen.is_(None),
+                                      Member.__table__.c.last_seen < seen_on))
+                        .values(last_seen=seen_on)
+                    )
+        except Exception:
+            # Put the dates back (unless newer ones arrived) so the next flush retries them
+            with self._lock:
+                for member_id, seen_on in pending.items():
+                    if self._pending.get(member_id, date.min) < seen_on:
+                        self._pending[member_id] = seen_on
+            raise
+
+        with self._lock:
+            self.flushes += 1
+            self.rows_written += len(pending)
+            today = date.today()
+            # Forget members whose recorded date has passed so the dict stays bounded
+            self._recorded = {k: v for k, v in self._recorded.items() if v >= today}
+        return len(pending)
+
+    def _ensure_thread(self) -> None:
+        """Start the background flusher in this process, once, if an interval is configured."""
+        if self.flush_seconds <= 0 or self._app is None:
+            return
+        pid = os.getpid()
+        if self._thread_pid == pid and self._thread is not None and self._thread.is_alive():
+            return
+        with self._lock:
+            # Re-checked under the lock; a forked worker starts its own thread
+            if self._thread_pid == pid and self._thread is not None and self._thread.is_alive():
+                return
+            self._stop = threading.Event()
+            self._thread = threading.Thread(target=self._run, name='last-seen-flusher', daemon=True)
+            self._thread_pid = pid
+            self._thread.start()
+            if not self._atexit_registered:
+                atexit.register(self._flush_at_exit)
+                self._atexit_registered = True
+
+    def _run(self) -> None:
+        """Flush every flush_seconds until stopped."""
+        while not self._stop.wait(self.flush_seconds):
+            self._flush_logged()
+
+    def _flush_at_exit(self) -> None:
+        """Stop the background thread and write what is left."""
+        self._stop.set()
+        self._flush_logged()
+
+    def _flush_logged(self) -> None:
+        """Flush in an application context, logging instead of raising."""
+        with self._app.app_context():
+            try:
+                self.flush()
+            except Exception as e:
+                self._app.logger.warning(f"Could not write last_seen updates: {e}")
+
+    def stats(self) -> dict:
+        """Get buffer size and flush counters."""
+        with self._lock:
+            return {
+                'pending': len(self._pending),
+                'flush_seconds': self.flush_seconds,
+                'flushes': self.flushes,
+                'rows_written': self.rows_written,
+            }
+
+
+last_seen_buffer = LastSeenBuffer()
@@ -1,4 +1,5 @@
 # API routes for the Bowls Club application
+from datetime import date, timedelta
 from flask import jsonify, request, current_app
 from flask_login import login_required, current_user
 import sqlalchemy as sa
@@ -93,8 +94,17 @@ def get_event(event_id):
 def get_booking(booking_id):
     """
     Get booking details (AJAX endpoint)
+    Supports conditional GET via the bookings change-version ETag.
     """
     try:
+        from app.bookings.versioning import bookings_etag, not_modified_response, with_etag
+        
+        # Answer conditional requests from the change-version stamp alone
+        etag = bookings_etag()
+        not_modified = not_modified_response(etag)
+        if not_modified:
+            return not_modified
+        
         booking = db.session.get(Booking, booking_id)
         if not booking:
             return jsonify({
@@ -113,20 +123,20 @@ def get_booking(booking_id):
                 'id': booking.organizer.id,
                 'name': f"{booking.organizer.firstname} {booking.organizer.lastname}",
                 'email': booking.organizer.email
-            },
+            } if booking.organizer else None,
             'organizer_notes': booking.organizer_notes,
             'vs': booking.vs,
             'home_away': booking.home_away
         }
         
-        # Add event details if it's an event booking
-        if booking.event:
+        # Add event details if it's an event booking (the booking IS the event)
+        if booking.booking_type == 'event':
             booking_data['event'] = {
-                'id': booking.event.id,
-                'name': booking.event.name,
-                'event_type': booking.event.event_type,
-                'event_gender': booking.event.event_gender,
-                'event_format': booking.event.event_format
+                'id': booking.id,
+                'name': booking.name,
+                'event_type': booking.event_type,
+                'event_gender': booking.gender,
+                'event_format': booking.format
             }
         
         # Add team details if they exist
@@ -153,13 +163,15 @@ def get_booking(booking_id):
             
             booking_data['teams'] = teams
         
-        # Add roll-up players if it's a roll-up booking
+        # Add roll-up players (members of the roll-up team) if it's a roll-up booking
         elif booking.booking_type == 'rollup':
-            from app.models import BookingPlayer
+            from app.models import Team, TeamMember
             players = db.session.scalars(
-                sa.select(BookingPlayer)
-                .where(BookingPlayer.booking_id == booking_id)
-                .order_by(BookingPlayer.member.firstname, BookingPlayer.member.lastname)
+                sa.select(TeamMember)
+                .join(Team, TeamMember.team_id == Team.id)
+                .join(Member, TeamMember.member_id == Member.id)
+                .where(Team.booking_id == booking_id)
+                .order_by(Member.firstname, Member.lastname)
             ).all()
             
             booking_data['players'] = []
@@ -168,15 +180,15 @@ def get_booking(booking_id):
                     'id': player.id,
                     'member_id': player.member_id,
                     'member_name': f"{player.member.firstname} {player.member.lastname}",
-                    'status': player.status,
-                    'response_at': player.response_at.isoformat() if player.response_at else None,
+                    'status': player.availability_status,
+                    'response_at': player.confirmed_at.isoformat() if player.confirmed_at else None,
                     'is_organizer': player.member_id == booking.organizer_id
                 })
         
-        return jsonify({
+        return with_etag(jsonify({
             'success': True,
             'booking': booking_data
-        })
+        }), etag)
         
     except Exception as e:
         current_app.logger.error(f"Error in get_booking API: {str(e)}")
@@ -208,15 +220,9 @@ def get_availability(selected_date, session_id):
         )
         bookings = db.session.scalars(query).all()
         
-        # Import home games filter utility
-        from app.bookings.utils import add_home_games_filter
-        
-        # Get bookings that use rinks (exclude away games)
-        home_bookings_query = add_home_games_filter(query)
-        home_bookings = db.session.scalars(home_bookings_query).all()
-        
-        # Calculate used rinks (only from home games)
-        used_rinks = sum(booking.rink_count for booking in home_bookings)
+        # Used rinks (home games only) come from the occupancy index
+        from app.bookings.occupancy import get_used_rinks
+        used_rinks = get_used_rinks(booking_date, session_id)
         available_rinks = total_rinks - used_rinks
         
         # Format booking details
@@ -263,52 +269,76 @@ def get_upcoming_events():
     """
     Get upcoming events with pool registration enabled
     Returns user's registration status for each event
+    
+    Query parameters:
+        start_date, end_date: Date window (YYYY-MM-DD); defaults to today plus UPCOMING_EVENTS_WINDOW_DAYS
+        page, per_page: Pagination (per_page capped at 100)
     """
     try:
-        # Get all bookings that have pools enabled
-        events_with_pools = db.session.scalars(
-            sa.select(Booking)
-            .join(Pool, Booking.id == Pool.booking_id)
-            .where(Booking.has_pool == True)
-            .order_by(Booking.created_at.desc())
-        ).all()
+        from app.bookings.utils import get_upcoming_pool_events
+        
+        try:
+            start_date = date.fromisoformat(request.args['start_date']) if request.args.get('start_date') else date.today()
+            end_date = (date.fromisoformat(request.args['end_date']) if request.args.get('end_date')
+                        else start_date + timedelta(days=current_app.config.get('UPCOMING_EVENTS_WINDOW_DAYS', 180)))
+        except ValueError:
+            return jsonify({
+                'success': False,
+                'error': 'Invalid date format. Use YYYY-MM-DD'
+            }), 400
+        
+        page = max(request.args.get('page', 1, type=int), 1)
+        per_page = min(max(request.args.get('per_page', current_app.config.get('UPCOMING_EVENTS_PER_PAGE', 25), type=int), 1), 100)
+        
+        result = get_upcoming_pool_events(current_user, start_date, end_date,
+                                          page=page, per_page=per_page, load_managers=True)
         
         # Format events data
         events_data = []
-        for event in events_with_pools:
+        for row in result['events']:
+            event = row['booking']
             event_info = {
                 'id': event.id,
                 'name': event.name,
+                'booking_date': event.booking_date.isoformat(),
+                'session': event.session,
                 'event_type': event.get_event_type_name(),
                 'gender': event.get_gender_name(),
                 'format': event.get_format_name(),
                 'scoring': event.scoring,
                 'created_at': event.created_at.isoformat(),
-                'pool_open': event.is_pool_open(),
-                'pool_count': event.get_pool_member_count(),
+                'pool_open': row['pool_open'],
+                'pool_count': row['pool_count'],
                 'registration_status': 'not_registered',
                 'managers': [
                     {
                         'id': manager.id,
                         'name': f"{manager.firstname} {manager.lastname}"
                     }
-                    for manager in event.event_managers
+                    for manager in event.booking_managers
                 ]
             }
             
             # Check if user is registered
-            if event.pool:
-                user_registration = event.pool.get_member_registration(current_user.id)
-                if user_registration:
-                    event_info['registration_status'] = 'registered'  # All pool registrations are 'registered'
-                    event_info['registered_at'] = user_registration.registered_at.isoformat()
+            if row['registration']:
+                event_info['registration_status'] = 'registered'  # All pool registrations are 'registered'
+                event_info['registered_at'] = row['registration'].registered_at.isoformat()
             
             events_data.append(event_info)
         
+        total_pages = (result['total'] + per_page - 1) // per_page
         return jsonify({
             'success': True,
             'events': events_data,
-            'count': len(events_data)
+            'count': len(events_data),
+            'pagination': {
+                'page': page,
+                'per_page': per_page,
+                'total': result['total'],
+                'total_pages': total_pages,
+                'has_prev': page > 1,
+                'has_next': page < total_pages
+            }
         })
         
     except Exception as e:
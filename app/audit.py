@@ -15,52 +15,205 @@ Usage:
     
     # For deletions
     audit_log_delete('Member', member_id, f'Deleted member: {username}')
+
+Entries are written to instance/logs/audit.log as JSON lines holding every field
+passed in (model, record ID, user, changes, additional data). The file rolls over at
+AUDIT_LOG_MAX_BYTES into gzip archives named audit-<UTC timestamp>.log.gz, and
+`flask audit search` looks entries up through the sidecar index in app/audit_index.py.
 """
 
+import atexit
+import glob
+import gzip
+import json
 import logging
 import os
-from datetime import datetime
+import shutil
+import threading
+import uuid
+from datetime import datetime, timezone
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
+from queue import Full, Queue
 from typing import Optional, Dict, Any, Union
-from flask import current_app
+from flask import current_app, has_request_context
 from flask_login import current_user
 
 
+# Seconds a caller waits for room in a full audit queue before writing the entry itself
+AUDIT_QUEUE_PUT_TIMEOUT = 5
+
+# Queue, listener and file handler of the background writer, per process
+_audit_writer = {'pid': None, 'queue': None, 'listener': None, 'file_handler': None}
+_audit_writer_lock = threading.Lock()
+_audit_shutdown_registered = False
+
+
+AUDIT_LOG_FILENAME = 'audit.log'
+AUDIT_ARCHIVE_PATTERN = 'audit-*.log.gz'
+
+
+def audit_log_dir() -> str:
+    """Get the directory holding audit.log and its archives."""
+    return os.path.join(current_app.instance_path, 'logs')
+
+
+def format_audit_timestamp(moment: datetime) -> str:
+    """Format a timestamp the way audit entries store it (UTC, microseconds, sortable)."""
+    return moment.astimezone(timezone.utc).strftime('%Y-%m-%dT%H:%M:%S.%fZ')
+
+
+class JsonLinesFormatter(logging.Formatter):
+    """
+    Format a record as one JSON object: timestamp, level, structured audit fields and message.
+
+    A record carrying `audit_batch` (see audit_log_batch) becomes one line per entry.
+    """
+
+    def format(self, record):
+        batch = getattr(record, 'audit_batch', None)
+        if batch is not None:
+            # One line per entry, so a committed transaction is a single write
+            ts = format_audit_timestamp(datetime.fromtimestamp(record.created, timezone.utc))
+            return '\n'.join(
+                json.dumps({'ts': ts, 'level': record.levelname, **entry}, default=str, ensure_ascii=False)
+                for entry in batch
+            )
+        entry = {
+            'ts': format_audit_timestamp(datetime.fromtimestamp(record.created, timezone.utc)),
+            'level': record.levelname,
+        }
+        entry.update(getattr(record, 'audit', None) or {})
+        entry['message'] = record.getMessage()
+        return json.dumps(entry, default=str, ensure_ascii=False)
+
+
+class GzipRotatingFileHandler(RotatingFileHandler):
+    """
+    Size-rotated log file whose full segments are gzipped under unique timestamped names.
+
+    Archives are never renamed once written, so the audit index can refer to them by
+    name. backupCount > 0 keeps only that many archives; 0 keeps them all.
+    """
+
+    def archive_path(self) -> str:
+        """Get an unused archive path for the segment being rolled."""
+        stamp = datetime.now(timezone.utc).strftime('%Y%m%dT%H%M%S%fZ')
+        directory = os.path.dirname(self.baseFilename)
+        path = os.path.join(directory, f'audit-{stamp}.log.gz')
+        suffix = 1
+        while os.path.exists(path):
+            path = os.path.join(directory, f'audit-{stamp}-{suffix}.log.gz')
+            suffix += 1
+        return path
+
+    def doRollover(self):
+        if self.stream:
+            self.stream.close()
+            self.stream = None
+        if os.path.exists(self.baseFilename) and os.path.getsize(self.baseFilename) > 0:
+            archive = self.archive_path()
+            with open(self.baseFilename, 'rb') as source, gzip.open(archive + '.tmp', 'wb') as target:
+                shutil.copyfileobj(source, target)
+            os.replace(archive + '.tmp', archive)
+            os.remove(self.baseFilename)
+            if self.backupCount > 0:
+                archives = sorted(glob.glob(os.path.join(os.path.dirname(self.baseFilename), AUDIT_ARCHIVE_PATTERN)))
+                for old_archive in archives[:-self.backupCount]:
+                    os.remove(old_archive)
+        if not self.delay:
+            self.stream = self._open()
+
+
+class BlockingQueueHandler(QueueHandler):
+    """QueueHandler that waits for space in a bounded queue instead of dropping records."""
+
+    def __init__(self, record_queue, fallback_handler):
+        super().__init__(record_queue)
+        self.fallback_handler = fallback_handler
+
+    def enqueue(self, record):
+        try:
+            self.queue.put(record, timeout=AUDIT_QUEUE_PUT_TIMEOUT)
+        except Full:
+            # The writer has stalled; write in the caller rather than lose the entry
+            self.fallback_handler.handle(record)
+
+
 # Configure audit logger
 def setup_audit_logger():
-    """Setup and configure the audit logger with proper formatting and file handling."""
-    # Create audit logger
+    """
+    Get the audit logger, starting its background writer on first use in this process.
+
+    Records go onto a bounded queue (AUDIT_LOG_QUEUE_SIZE) and a QueueListener thread
+    writes them as JSON lines to instance/logs/audit.log, so callers never wait on disk
+    unless the queue is full. Pending records are written on interpreter exit.
+    """
+    global _audit_shutdown_registered
     audit_logger = logging.getLogger('audit')
-    audit_logger.setLevel(logging.INFO)
-    
-    # Prevent duplicate log entries
-    if audit_logger.hasHandlers():
+    if _audit_writer['pid'] == os.getpid():
         return audit_logger
-    
-    # Create logs directory if it doesn't exist
-    log_dir = os.path.join(current_app.instance_path, 'logs')
-    os.makedirs(log_dir, exist_ok=True)
-    
-    # Create file handler for audit.log
-    log_file = os.path.join(log_dir, 'audit.log')
-    file_handler = logging.FileHandler(log_file, mode='a', encoding='utf-8')
-    file_handler.setLevel(logging.INFO)
-    
-    # Create formatter
-    formatter = logging.Formatter(
-        '%(asctime)s | %(levelname)s | %(message)s',
-        datefmt='%Y-%m-%d %H:%M:%S'
-    )
-    file_handler.setFormatter(formatter)
-    
-    # Add handler to logger
-    audit_logger.addHandler(file_handler)
-    
-    # Prevent propagation to root logger
-    audit_logger.propagate = False
-    
+
+    with _audit_writer_lock:
+        if _audit_writer['pid'] == os.getpid():
+            return audit_logger
+
+        # A forked worker inherits the handler but not the writer thread, so replace both
+        for handler in list(audit_logger.handlers):
+            if isinstance(handler, BlockingQueueHandler):
+                audit_logger.removeHandler(handler)
+
+        # Create logs directory if it doesn't exist
+        log_dir = audit_log_dir()
+        os.makedirs(log_dir, exist_ok=True)
+
+        # Create the rotating JSON-lines file handler, used only by the writer thread
+        file_handler = GzipRotatingFileHandler(
+            os.path.join(log_dir, AUDIT_LOG_FILENAME), mode='a', encoding='utf-8',
+            maxBytes=current_app.config.get('AUDIT_LOG_MAX_BYTES', 10 * 1024 * 1024),
+            backupCount=current_app.config.get('AUDIT_LOG_BACKUP_COUNT', 0)
+        )
+        file_handler.setLevel(logging.INFO)
+        file_handler.setFormatter(JsonLinesFormatter())
+
+        record_queue = Queue(maxsize=current_app.config.get('AUDIT_LOG_QUEUE_SIZE', 10000))
+        listener = QueueListener(record_queue, file_handler, respect_handler_level=True)
+        listener.start()
+
+        audit_logger.setLevel(logging.INFO)
+        audit_logger.addHandler(BlockingQueueHandler(record_queue, file_handler))
+        # Prevent propagation to root logger
+        audit_logger.propagate = False
+
+        _audit_writer.update(pid=os.getpid(), queue=record_queue, listener=listener, file_handler=file_handler)
+        if not _audit_shutdown_registered:
+            atexit.register(shutdown_audit_logger)
+            _audit_shutdown_registered = True
+
     return audit_logger
 
 
+def flush_audit_log():
+    """Block until every queued audit record has been written to the log file."""
+    if _audit_writer['pid'] != os.getpid():
+        return
+    _audit_writer['queue'].join()
+    _audit_writer['file_handler'].flush()
+
+
+def shutdown_audit_logger():
+    """Write any queued audit records, then stop the writer thread and close the file."""
+    with _audit_writer_lock:
+        if _audit_writer['pid'] != os.getpid():
+            return
+        audit_logger = logging.getLogger('audit')
+        for handler in list(audit_logger.handlers):
+            if isinstance(handler, BlockingQueueHandler):
+                audit_logger.removeHandler(handler)
+        _audit_writer['listener'].stop()
+        _audit_writer['file_handler'].close()
+        _audit_writer.update(pid=None, queue=None, listener=None, file_handler=None)
+
+
 def get_current_user_info() -> str:
     """Get current user information for audit logging."""
     if current_user.is_authenticated:
@@ -68,6 +221,26 @@ def get_current_user_info() -> str:
     return "SYSTEM"
 
 
+def _audit_fields(user: Optional[str] = None, **fields) -> Dict[str, Any]:
+    """
+    Build the `extra` for an audit record: its structured fields, minus empty ones.
+
+    Args:
+        user: Username to record; defaults to the current user (or SYSTEM)
+        **fields: Entry fields (event, model, record_id, description, changes, data, ...)
+    """
+    if user is None:
+        if current_user.is_authenticated:
+            fields['user'], fields['user_id'] = current_user.username, current_user.id
+        else:
+            fields['user'] = 'SYSTEM'
+    else:
+        fields['user'] = user
+    if fields.get('record_id') is not None:
+        fields['record_id'] = str(fields['record_id'])
+    return {'audit': {key: value for key, value in fields.items() if value is not None and value != {}}}
+
+
 def audit_log_create(model_name: str, record_id: Union[int, str], description: str, 
                     additional_data: Optional[Dict[str, Any]] = None):
     """
@@ -85,7 +258,9 @@ def audit_log_create(model_name: str, record_id: Union[int, str], description: s
         
         log_message = f"CREATE | {model_name} | ID: {record_id} | User: {user_info} | {description}"
         
-        logger.info(log_message)
+        logger.info(log_message, extra=_audit_fields(
+            event='CREATE', model=model_name, record_id=record_id, description=description,
+            data=additional_data))
     except Exception as e:
         # Audit logging should never break application functionality
         # But we should still log the failure for debugging
@@ -116,7 +291,9 @@ def audit_log_update(model_name: str, record_id: Union[int, str], description: s
     
     log_message = f"UPDATE | {model_name} | ID: {record_id} | User: {user_info} | {description}"
     
-    logger.info(log_message)
+    logger.info(log_message, extra=_audit_fields(
+        event='UPDATE', model=model_name, record_id=record_id, description=description,
+        changes=changes, data=additional_data))
 
 
 def audit_log_delete(model_name: str, record_id: Union[int, str], description: str,
@@ -135,7 +312,9 @@ def audit_log_delete(model_name: str, record_id: Union[int, str], description: s
     
     log_message = f"DELETE | {model_name} | ID: {record_id} | User: {user_info} | {description}"
     
-    logger.info(log_message)
+    logger.info(log_message, extra=_audit_fields(
+        event='DELETE', model=model_name, record_id=record_id, description=description,
+        data=additional_data))
 
 
 def audit_log_bulk_operation(operation: str, model_name: str, count: int, description: str,
@@ -155,7 +334,9 @@ def audit_log_bulk_operation(operation: str, model_name: str, count: int, descri
     
     log_message = f"{operation} | {model_name} | Count: {count} | User: {user_info} | {description}"
     
-    logger.info(log_message)
+    logger.info(log_message, extra=_audit_fields(
+        event=operation, model=model_name, count=count, description=description,
+        data=additional_data))
 
 
 def audit_log_authentication(event_type: str, username: str, success: bool, 
@@ -174,7 +355,8 @@ def audit_log_authentication(event_type: str, username: str, success: bool,
     status = "SUCCESS" if success else "FAILURE"
     log_message = f"AUTH | {event_type} | {status} | User: {username}"
     
-    logger.info(log_message)
+    logger.info(log_message, extra=_audit_fields(
+        user=username, event='AUTH', type=event_type, status=status, data=additional_data))
 
 
 def audit_log_security_event(event_type: str, description: str, 
@@ -192,7 +374,8 @@ def audit_log_security_event(event_type: str, description: str,
     
     log_message = f"SECURITY | {event_type} | User: {user_info} | {description}"
     
-    logger.warning(log_message)
+    logger.warning(log_message, extra=_audit_fields(
+        event='SECURITY', type=event_type, description=description, data=additional_data))
 
 
 def audit_log_system_event(event_type: str, description: str,
@@ -209,7 +392,8 @@ def audit_log_system_event(event_type: str, description: str,
     
     log_message = f"SYSTEM | {event_type} | {description}"
     
-    logger.info(log_message)
+    logger.info(log_message, extra=_audit_fields(
+        user='SYSTEM', event='SYSTEM', type=event_type, description=description, data=additional_data))
 
 
 def audit_log_file_operation(operation: str, filename: str, description: str,
@@ -228,7 +412,53 @@ def audit_log_file_operation(operation: str, filename: str, description: str,
     
     log_message = f"FILE | {operation} | File: {filename} | User: {user_info} | {description}"
     
-    logger.info(log_message)
+    logger.info(log_message, extra=_audit_fields(
+        event='FILE', type=operation, filename=filename, description=description, data=additional_data))
+
+
+def audit_log_batch(entries, description: Optional[str] = None):
+    """
+    Log the changes made by one committed transaction as a single batch.
+
+    Every entry becomes its own JSON line, tagged with a shared transaction ID, but the
+    batch is queued and written in one go.
+
+    Args:
+        entries: Entry fields (event, model, record_id, changes, data) as dictionaries
+        description: Optional description of the whole transaction
+    """
+    if not entries:
+        return
+    try:
+        logger = setup_audit_logger()
+        if has_request_context() and current_user.is_authenticated:
+            user_fields = {'user': current_user.username, 'user_id': current_user.id}
+            user_info = f"{current_user.username} (ID: {current_user.id})"
+        else:
+            user_fields = {'user': 'SYSTEM'}
+            user_info = 'SYSTEM'
+        txn = uuid.uuid4().hex[:12]
+
+        batch = []
+        for fields in entries:
+            entry = {'txn': txn, **fields, **user_fields, 'description': description}
+            if entry.get('record_id') is not None:
+                entry['record_id'] = str(entry['record_id'])
+            entry = {key: value for key, value in entry.items() if value is not None and value != {}}
+            entry['message'] = (f"{entry.get('event')} | {entry.get('model')} | "
+                                f"ID: {entry.get('record_id', '-')} | User: {user_info}")
+            batch.append(entry)
+
+        log_message = f"BATCH | {txn} | {len(batch)} entries | User: {user_info}"
+        if description:
+            log_message += f" | {description}"
+        logger.info(log_message, extra={'audit_batch': batch})
+    except Exception as e:
+        # Runs after the commit; a failure here must not surface as a failed request
+        try:
+            setup_audit_logger().error(f"AUDIT_FAILURE | Failed to log batch of {len(entries)} entries: {str(e)}")
+        except Exception:
+            pass
 
 
 def get_model_changes(model_instance, form_data: Dict[str, Any]) -> Dict[str, Any]:
@@ -0,0 +1,208 @@
+"""
+Audit entries captured from SQLAlchemy session events.
+
+Opt-in with AUDIT_SESSION_EVENTS. While enabled, an after_flush hook records every
+insert, update and delete of the models named in AUDIT_SESSION_MODELS, with the
+attribute history of updated columns. Objects expired by an earlier commit have no
+old values loaded, so before_flush reads their stored rows first (one SELECT per
+model). after_commit writes the whole transaction to the audit log as one batch
+(audit_log_batch). Rolled back transactions write nothing.
+
+ORM bulk inserts (session.execute(sa.insert(Model), rows)) are recorded by a
+do_orm_execute hook, one entry per row without a record ID since the statement
+returns none. Bulk UPDATE/DELETE statements bypass both hooks.
+
+Routes that commit many rows at once can describe the transaction with
+label_audit_batch instead of logging a separate summary.
+"""
+
+from typing import Any, Dict, FrozenSet, Optional
+
+import sqlalchemy as sa
+import sqlalchemy.orm as so
+from flask import current_app, has_app_context
+
+from app.audit import audit_log_batch
+from app.bookings.occupancy import bulk_insert_rows
+
+BATCH_KEY = 'audit_batch'
+COMMITTED_KEY = 'audit_committed_rows'
+DESCRIPTION_KEY = 'audit_batch_description'
+
+# Column values never written to the audit log
+REDACTED_ATTRIBUTES = {'password_hash', 'calendar_token'}
+
+
+def _audited_models() -> FrozenSet[str]:
+    """Get the model names audited from session events, empty when disabled."""
+    if not has_app_context() or not current_app.config.get('AUDIT_SESSION_EVENTS', False):
+        return frozenset()
+    return frozenset(current_app.config.get('AUDIT_SESSION_MODELS', ()))
+
+
+def label_audit_batch(session: so.Session, description: str) -> bool:
+    """
+    Describe the transaction in progress in its audit batch.
+
+    Args:
+        session: Session whose next commit the description applies to
+        description: Human-readable description of the transaction
+
+    Returns:
+        True if session events are audited (the batch replaces a manual summary), False otherwise
+    """
+    if not _audited_models():
+        return False
+    session.info[DESCRIPTION_KEY] = description
+    return True
+
+
+def _redact(key: str, value: Any) -> Any:
+    return '[redacted]' if key in REDACTED_ATTRIBUTES and value is not None else value
+
+
+def _column_values(state, committed: Dict[str, Any]) -> Dict[str, Any]:
+    """Column values of an object, from what is loaded or else its committed row."""
+    values = dict(committed)
+    values.update((attr.key, state.dict[attr.key]) for attr in state.mapper.column_attrs if attr.key in state.dict)
+    return {key: _redact(key, value) for key, value in values.items() if value is not None}
+
+
+def _column_changes(state, committed: Dict[str, Any]) -> Dict[str, Dict[str, Any]]:
+    """Changed columns of a flushed object as {'field': {'old': ..., 'new': ...}}."""
+    changes = {}
+    for attr in state.mapper.column_attrs:
+        history = state.attrs[attr.key].history
+        if history.has_changes():
+            changes[attr.key] = {
+                'old': _redact(attr.key, history.deleted[0] if history.deleted else committed.get(attr.key)),
+                'new': _redact(attr.key, history.added[0] if history.added else None),
+            }
+    return changes
+
+
+def _needs_committed_row(state, deleting: bool) -> bool:
+    """Whether the values to audit were never loaded (e.g. the object expired on commit)."""
+    for attr in state.mapper.column_attrs:
+        if deleting:
+            if attr.key not in state.dict:
+                return True
+        else:
+            history = state.attrs[attr.key].history
+            if history.has_changes() and not history.deleted:
+                return True
+    return False
+
+
+def _load_committed_rows(session: so.Session, states) -> Dict[Any, Dict[str, Any]]:
+    """Read the stored rows of objects about to be updated or deleted, one SELECT per model."""
+    by_mapper = {}
+    for state in states:
+        by_mapper.setdefault(state.mapper, []).append(state)
+
+    rows = {}
+    connection = session.connection()
+    for mapper, mapper_states in by_mapper.items():
+        primary_key = list(mapper.primary_key)
+        columns = [attr.columns[0].label(attr.key) for attr in mapper.column_attrs]
+        identities = [state.identity for state in mapper_states]
+        if len(primary_key) == 1:
+            condition = primary_key[0].in_([identity[0] for identity in identities])
+        else:
+            condition = sa.tuple_(*primary_key).in_(identities)
+        key_attrs = [mapper.get_property_by_column(column).key for column in primary_key]
+        stored = {
+            tuple(row[key] for key in key_attrs): row
+            for row in connection.execute(sa.select(*columns).where(condition)).mappings()
+        }
+        for state in mapper_states:
+            row = stored.get(tuple(state.identity))
+            if row is not None:
+                rows[state] = {attr.key: row[attr.key] for attr in mapper.column_attrs}
+    return rows
+
+
+def _record_id(state) -> Optional[Any]:
+    identity = state.identity
+    if not identity:
+        return None
+    return identity[0] if len(identity) == 1 else '/'.join(str(value) for value in identity)
+
+
+@sa.event.listens_for(so.Session, 'before_flush')
+def _capture_committed_values(session, flush_context, instances):
+    """Load old values that history cannot supply, before the flush overwrites them."""
+    models = _audited_models()
+    if not models:
+        return
+
+    states = []
+    for deleting, objects in ((False, session.dirty), (True, session.deleted)):
+        for obj in objects:
+            state = sa.inspect(obj)
+            if (state.mapper.class_.__name__ in models and state.identity
+                    and _needs_committed_row(state, deleting)):
+                states.append(state)
+    if states:
+        session.info[COMMITTED_KEY] = _load_committed_rows(session, states)
+
+
+@sa.event.listens_for(so.Session, 'after_flush')
+def _capture_flushed_changes(session, flush_context):
+    """Record audited inserts, updates and deletes; history is still available here."""
+    committed_rows = session.info.pop(COMMITTED_KEY, {})
+    models = _audited_models()
+    if not models:
+        return
+
+    entries = []
+    for event, objects in (('CREATE', session.new), ('UPDATE', session.dirty), ('DELETE', session.deleted)):
+        for obj in objects:
+            state = sa.inspect(obj)
+            model = state.mapper.class_.__name__
+            if model not in models:
+                continue
+            committed = committed_rows.get(state, {})
+            if event == 'UPDATE':
+                changes = _column_changes(state, committed)
+                if not changes:
+                    continue  # Only relationship collections changed
+                entries.append({'event': event, 'model': model, 'record_id': _record_id(state), 'changes': changes})
+            else:
+                entries.append({'event': event, 'model': model, 'record_id': _record_id(state),
+                                'data': _column_values(state, committed)})
+
+    if entries:
+        session.info.setdefault(BATCH_KEY, []).extend(entries)
+
+
+@sa.event.listens_for(so.Session, 'do_orm_execute')
+def _capture_bulk_inserts(orm_execute_state):
+    """Record rows added by ORM bulk INSERT, which skips the flush hook."""
+    models = _audited_models()
+    mapper = orm_execute_state.bind_mapper
+    if not models or mapper is None or mapper.class_.__name__ not in models:
+        return
+    entries = [
+        {'event': 'CREATE', 'model': mapper.class_.__name__,
+         'data': {key: _redact(key, value) for key, value in row.items() if value is not None}}
+        for row in bulk_insert_rows(orm_execute_state, mapper.class_)
+    ]
+    if entries:
+        orm_execute_state.session.info.setdefault(BATCH_KEY, []).extend(entries)
+
+
+@sa.event.listens_for(so.Session, 'after_commit')
+def _write_audit_batch(session):
+    """Write the committed transaction's entries as one audit batch."""
+    entries = session.info.pop(BATCH_KEY, None)
+    description = session.info.pop(DESCRIPTION_KEY, None)
+    if entries:
+        audit_log_batch(entries, description)
+
+
+@sa.event.listens_for(so.Session, 'after_rollback')
+def _discard_audit_batch(session):
+    """Rolled back changes never reached the database."""
+    session.info.pop(BATCH_KEY, None)
+    session.info.pop(DESCRIPTION_KEY, None)
@@ -0,0 +1,294 @@
+"""
+Sidecar index for the JSON-lines audit log.
+
+The index is a SQLite file (instance/logs/audit_index.sqlite) holding, for every
+audit entry, the segment file it lives in, its byte offset in the uncompressed
+segment, and the fields we search on: timestamp, event, model, record ID and user.
+Lookups such as "everything that touched Booking 123" are an index seek followed by
+reading just the matching lines.
+
+Updates are incremental. The live audit.log is indexed from the last offset seen.
+When it rolls over, its gzip archive has the same bytes. The archive is recognised
+by the fingerprint of its first line, and the entries already indexed are moved to
+the archive's name rather than re-read.
+
+Commands (registered as `flask audit ...`):
+    flask audit index [--rebuild]
+    flask audit search --model Booking --record-id 123 [--user NAME] [--since DATE] [--until DATE]
+"""
+
+import glob
+import gzip
+import hashlib
+import json
+import os
+import sqlite3
+from datetime import datetime, timedelta
+from typing import Dict, Iterable, List, Optional
+
+import click
+from flask.cli import AppGroup
+
+from app.audit import (AUDIT_ARCHIVE_PATTERN, AUDIT_LOG_FILENAME, audit_log_dir, flush_audit_log,
+                       format_audit_timestamp)
+
+INDEX_FILENAME = 'audit_index.sqlite'
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS segments (
+    name TEXT PRIMARY KEY,
+    fingerprint TEXT,
+    indexed_offset INTEGER NOT NULL DEFAULT 0
+);
+CREATE TABLE IF NOT EXISTS entries (
+    segment TEXT NOT NULL,
+    offset INTEGER NOT NULL,
+    ts TEXT NOT NULL,
+    event TEXT,
+    model TEXT,
+    record_id TEXT,
+    username TEXT,
+    user_id INTEGER,
+    PRIMARY KEY (segment, offset)
+);
+CREATE INDEX IF NOT EXISTS ix_entries_model_record ON entries (model, record_id, ts);
+CREATE INDEX IF NOT EXISTS ix_entries_username ON entries (username, ts);
+CREATE INDEX IF NOT EXISTS ix_entries_user_id ON entries (user_id, ts);
+CREATE INDEX IF NOT EXISTS ix_entries_ts ON entries (ts);
+"""
+
+
+def _connect(log_dir: str) -> sqlite3.Connection:
+    """Open (creating if needed) the index next to the audit log."""
+    connection = sqlite3.connect(os.path.join(log_dir, INDEX_FILENAME))
+    connection.executescript(SCHEMA)
+    return connection
+
+
+def _open_segment(path: str):
+    """Open a segment for binary reading; offsets are into the uncompressed bytes."""
+    return gzip.open(path, 'rb') if path.endswith('.gz') else open(path, 'rb')
+
+
+def _fingerprint(path: str) -> Optional[str]:
+    """Hash of the segment's first complete line, or None if it has none yet."""
+    try:
+        with _open_segment(path) as segment:
+            first_line = segment.readline()
+    except FileNotFoundError:
+        return None
+    if not first_line.endswith(b'\n'):
+        return None
+    return hashlib.sha1(first_line).hexdigest()
+
+
+def _index_segment(connection: sqlite3.Connection, log_dir: str, name: str, start: int) -> int:
+    """
+    Index the complete lines of a segment from a byte offset.
+
+    Returns:
+        Offset just past the last complete line read
+    """
+    rows = []
+    offset = start
+    with _open_segment(os.path.join(log_dir, name)) as segment:
+        segment.seek(start)
+        for line in segment:
+            if not line.endswith(b'\n'):
+                break  # Still being written
+            try:
+                entry = json.loads(line)
+            except ValueError:
+                entry = None  # Lines from before the JSON format are skipped
+            if isinstance(entry, dict) and entry.get('ts'):
+                user_id = entry.get('user_id')
+                rows.append((
+                    name, offset, entry['ts'], entry.get('event'), entry.get('model'),
+                    entry.get('record_id'), entry.get('user'),
+                    user_id if isinstance(user_id, int) else None,
+                ))
+            offset += len(line)
+    connection.executemany('INSERT OR REPLACE INTO entries VALUES (?, ?, ?, ?, ?, ?, ?, ?)', rows)
+    return offset
+
+
+def update_audit_index(log_dir: str, rebuild: bool = False) -> Dict[str, int]:
+    """
+    Bring the index up to date with audit.log and its archives.
+
+    Args:
+        log_dir: Directory holding the audit log
+        rebuild: Discard the index and read every segment again
+
+    Returns:
+        Counts of segments read and entries now indexed
+    """
+    connection = _connect(log_dir)
+    try:
+        with connection:
+            if rebuild:
+                connection.execute('DELETE FROM entries')
+                connection.execute('DELETE FROM segments')
+            segments = {name: (fingerprint, indexed_offset) for name, fingerprint, indexed_offset
+                        in connection.execute('SELECT name, fingerprint, indexed_offset FROM segments')}
+            active = segments.get(AUDIT_LOG_FILENAME)
+            read = 0
+
+            archives = sorted(os.path.basename(path) for path in glob.glob(os.path.join(log_dir, AUDIT_ARCHIVE_PATTERN)))
+            for name in archives:
+                if name in segments:
+                    continue  # Archives never change once written
+                start = 0
+                fingerprint = _fingerprint(os.path.join(log_dir, name))
+                if active is not None and active[0] == fingerprint:
+                    # This is the live segment that rolled over: keep what was already indexed
+                    connection.execute('UPDATE entries SET segment = ? WHERE segment = ?', (name, AUDIT_LOG_FILENAME))
+                    connection.execute('DELETE FROM segments WHERE name = ?', (AUDIT_LOG_FILENAME,))
+                    start, active = active[1], None
+                end = _index_segment(connection, log_dir, name, start)
+                connection.execute('INSERT INTO segments VALUES (?, ?, ?)', (name, fingerprint, end))
+                read += 1
+
+            # Forget archives removed by AUDIT_LOG_BACKUP_COUNT or by hand
+            for name in set(segments) - set(archives) - {AUDIT_LOG_FILENAME}:
+                connection.execute('DELETE FROM entries WHERE segment = ?', (name,))
+                connection.execute('DELETE FROM segments WHERE name = ?', (name,))
+
+            live_path = os.path.join(log_dir, AUDIT_LOG_FILENAME)
+            fingerprint = _fingerprint(live_path)
+            size = os.path.getsize(live_path) if os.path.exists(live_path) else 0
+            if active is not None and (active[0] != fingerprint or size < active[1]):
+                # Rolled over since the last run and its archive is already indexed above
+                connection.execute('DELETE FROM entries WHERE segment = ?', (AUDIT_LOG_FILENAME,))
+                active = None
+            if fingerprint is not None:
+                end = _index_segment(connection, log_dir, AUDIT_LOG_FILENAME, active[1] if active else 0)
+                connection.execute('INSERT OR REPLACE INTO segments VALUES (?, ?, ?)',
+                                   (AUDIT_LOG_FILENAME, fingerprint, end))
+                read += 1
+            else:
+                connection.execute('DELETE FROM segments WHERE name = ?', (AUDIT_LOG_FILENAME,))
+
+        total = connection.execute('SELECT COUNT(*) FROM entries').fetchone()[0]
+        return {'segments_read': read, 'entries': total}
+    finally:
+        connection.close()
+
+
+def search_audit_log(log_dir: str, model: Optional[str] = None, record_id: Optional[str] = None,
+                     user: Optional[str] = None, since: Optional[str] = None, until: Optional[str] = None,
+                     limit: int = 1000) -> List[dict]:
+    """
+    Find audit entries through the index, oldest first.
+
+    Args:
+        log_dir: Directory holding the audit log
+        model: Model name, e.g. 'Booking'
+        record_id: Record ID (compared as text)
+        user: Username, or a numeric member ID
+        since: Earliest timestamp (inclusive), in the stored UTC format or a prefix of it
+        until: Latest timestamp (exclusive), same format
+        limit: Maximum entries returned
+
+    Returns:
+        Matching entries as dictionaries
+    """
+    clauses, params = [], []
+    if model:
+        clauses.append('model = ?')
+        params.append(model)
+    if record_id is not None:
+        clauses.append('record_id = ?')
+        params.append(str(record_id))
+    if user:
+        if str(user).isdigit():
+            clauses.append('user_id = ?')
+            params.append(int(user))
+        else:
+            clauses.append('username = ?')
+            params.append(user)
+    if since:
+        clauses.append('ts >= ?')
+        params.append(since)
+    if until:
+        clauses.append('ts < ?')
+        params.append(until)
+    where = f"WHERE {' AND '.join(clauses)}" if clauses else ''
+
+    connection = _connect(log_dir)
+    try:
+        hits = connection.execute(
+            f'SELECT segment, offset FROM entries {where} ORDER BY ts, segment, offset LIMIT ?',
+            params + [limit]
+        ).fetchall()
+    finally:
+        connection.close()
+
+    return [entry for entry in _read_entries(log_dir, hits) if entry is not None]
+
+
+def _read_entries(log_dir: str, hits: Iterable[tuple]) -> List[Optional[dict]]:
+    """Read the indexed lines, visiting each segment once in offset order."""
+    hits = list(hits)
+    by_segment: Dict[str, List[int]] = {}
+    for segment, offset in hits:
+        by_segment.setdefault(segment, []).append(offset)
+
+    lines = {}
+    for segment, offsets in by_segment.items():
+        try:
+            with _open_segment(os.path.join(log_dir, segment)) as source:
+                for offset in sorted(offsets):
+                    source.seek(offset)
+                    lines[(segment, offset)] = json.loads(source.readline())
+        except (OSError, ValueError):
+            continue  # Segment rolled or removed since indexing; rerun `flask audit index`
+    return [lines.get(hit) for hit in hits]
+
+
+def _parse_bound(value: Optional[str], end: bool = False) -> Optional[str]:
+    """Turn a --since/--until date or datetime into the stored timestamp format."""
+    if not value:
+        return None
+    try:
+        moment = datetime.fromisoformat(value)
+    except ValueError:
+        raise click.BadParameter(f'{value!r} is not an ISO date or datetime')
+    if len(value) == 10 and end:
+        moment += timedelta(days=1)  # --until 2026-10-16 includes that whole day
+    if moment.tzinfo is None:
+        return moment.strftime('%Y-%m-%dT%H:%M:%S.%fZ')
+    return format_audit_timestamp(moment)
+
+
+audit_cli = AppGroup('audit', help='Audit log index and search.')
+
+
+@audit_cli.command('index')
+@click.option('--rebuild', is_flag=True, help='Discard the index and read every segment again.')
+def index_command(rebuild):
+    """Update the audit log index with new entries and rolled segments."""
+    flush_audit_log()
+    result = update_audit_index(audit_log_dir(), rebuild=rebuild)
+    click.echo(f"Indexed {result['segments_read']} segment(s); {result['entries']} entries in the index.")
+
+
+@audit_cli.command('search')
+@click.option('--model', help='Model name, e.g. Booking.')
+@click.option('--record-id', help='Record ID.')
+@click.option('--user', help='Username or member ID.')
+@click.option('--since', help='Earliest date/time (ISO, UTC).')
+@click.option('--until', help='Latest date/time (ISO, UTC); a bare date includes the whole day.')
+@click.option('--limit', default=1000, show_default=True, help='Maximum entries to show.')
+@click.option('--no-update', is_flag=True, help='Search the index as it is, without indexing new entries first.')
+def search_command(model, record_id, user, since, until, limit, no_update):
+    """Print matching audit entries as JSON lines, oldest first."""
+    log_dir = audit_log_dir()
+    if not no_update:
+        flush_audit_log()
+        update_audit_index(log_dir)
+    entries = search_audit_log(log_dir, model=model, record_id=record_id, user=user,
+                               since=_parse_bound(since), until=_parse_bound(until, end=True), limit=limit)
+    for entry in entries:
+        click.echo(json.dumps(entry, ensure_ascii=False))
+    click.echo(f'{len(entries)} entr{"y" if len(entries) == 1 else "ies"} found.', err=True)
@@ -2,4 +2,4 @@ from flask import Blueprint
 
 bp = Blueprint('bookings', __name__, template_folder='templates')
 
-from app.bookings import routes
\ No newline at end of file
+from app.bookings import routes, occupancy, versioning, cache, cli, ical, series
@@ -0,0 +1,273 @@
+"""
+In-process cache for serialized calendar JSON.
+
+Entries are keyed by endpoint and date window and hold the JSON text returned by
+get_bookings / get_bookings_range. They are bounded by CALENDAR_CACHE_MAX_ENTRIES
+(least recently used entries are evicted first) and CALENDAR_CACHE_TTL_SECONDS.
+
+Invalidation is driven by the session: every flush (and ORM bulk insert) records the dates of bookings
+that were created, edited, moved, duplicated or deleted (including changes to their
+teams and team members, and the organiser's name), and on commit exactly the entries
+whose window covers one of those dates are dropped.
+
+The cache also tracks the bookings version (see versioning) its entries reflect.
+Commits in this process advance it along with their date invalidation. A lookup that
+sees any other version means another process wrote bookings, whose dates are
+unknown here, so the whole cache is dropped before the payload is rebuilt.
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from datetime import date
+from typing import Hashable, Iterable, Optional
+
+import sqlalchemy as sa
+import sqlalchemy.orm as so
+
+from app.bookings.versioning import VERSION_CHANGE_KEY, member_name_changed
+from app.models import Booking, Member, Team, TeamMember
+
+DIRTY_DATES_KEY = 'calendar_cache_dirty_dates'
+
+
+class CalendarCache:
+    """Thread-safe LRU cache with TTL, date-window invalidation and hit/miss counters."""
+
+    def __init__(self, max_entries: int = 256, ttl_seconds: float = 60):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._entries = OrderedDict()  # key -> (start_date, end_date, expires_at, payload)
+        self._lock = threading.Lock()
+        self._generation = 0
+        self._version = None  # Bookings version the entries reflect
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+
+    def init_app(self, app):
+        """Configure bounds from the application config."""
+        self.max_entries = app.config.get('CALENDAR_CACHE_MAX_ENTRIES', self.max_entries)
+        self.ttl_seconds = app.config.get('CALENDAR_CACHE_TTL_SECONDS', self.ttl_seconds)
+        self.clear()
+
+    @property
+    def enabled(self) -> bool:
+        return self.max_entries > 0 and self.ttl_seconds > 0
+
+    @property
+    def generation(self) -> int:
+        """Counter bumped by every invalidation; pass it back to set() to avoid caching stale data."""
+        return self._generation
+
+    def get(self, key: Hashable, version: Hashable = None) -> Optional[str]:
+        """
+        Get a cached payload.
+
+        Args:
+            key: Cache key
+            version: Current bookings version; any other than the cache's own drops every entry
+
+        Returns:
+            Cached JSON text, or None on a miss or expired entry
+        """
+        with self._lock:
+            if version != self._version:
+                # Written by another process: which dates changed is unknown here
+                self._drop_all()
+                self._version = version
+            entry = self._entries.get(key)
+            if entry is None or entry[2] <= time.monotonic():
+                if entry is not None:
+                    del self._entries[key]
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[3]
+
+    def set(self, key: Hashable, payload: str, start_date: date, end_date: date, generation: int,
+            version: Hashable = None) -> None:
+        """
+        Store a payload covering a date window.
+
+        Args:
+            key: Cache key
+            payload: Serialized JSON text
+            start_date: First date covered by the payload
+            end_date: Last date covered by the payload
+            generation: Value of `generation` read before the payload was built; the entry is
+                discarded if an invalidation happened in between
+            version: Bookings version the payload was built at
+        """
+        if not self.enabled:
+            return
+        with self._lock:
+            if generation != self._generation or version != self._version:
+                return
+            self._entries[key] = (start_date, end_date, time.monotonic() + self.ttl_seconds, payload)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def invalidate_dates(self, dates: Iterable[date]) -> int:
+        """
+        Drop every entry whose window covers any of the given dates.
+
+        Args:
+            dates: Booking dates that changed
+
+        Returns:
+            Number of entries dropped
+        """
+        with self._lock:
+            return self._drop_dates(dates)
+
+    def commit_version(self, dates: Iterable[date], previous_version: Hashable, version: Hashable) -> int:
+        """
+        Apply a transaction committed by this process.
+
+        Args:
+            dates: Booking dates it changed
+            previous_version: Bookings version before the transaction
+            version: Bookings version it committed
+
+        Returns:
+            Number of entries dropped
+        """
+        with self._lock:
+            if previous_version != self._version:
+                # Another process wrote in between: drop everything, as get() would
+                dropped = self._drop_all()
+            else:
+                dropped = self._drop_dates(dates)
+            self._version = version
+            return dropped
+
+    def _drop_dates(self, dates: Iterable[date]) -> int:
+        """Drop entries covering any of the dates; the lock must be held."""
+        dates = [d for d in dates if isinstance(d, date)]
+        if not dates:
+            return 0
+        self._generation += 1
+        stale = [
+            key for key, (start_date, end_date, _, _) in self._entries.items()
+            if any(start_date <= d <= end_date for d in dates)
+        ]
+        for key in stale:
+            del self._entries[key]
+        self.invalidations += len(stale)
+        return len(stale)
+
+    def _drop_all(self) -> int:
+        """Drop every entry as invalidated; the lock must be held."""
+        dropped = len(self._entries)
+        self._generation += 1
+        self._entries.clear()
+        self.invalidations += dropped
+        return dropped
+
+    def clear(self) -> None:
+        """Drop all entries."""
+        with self._lock:
+            self._generation += 1
+            self._entries.clear()
+            self._version = None
+
+    def stats(self) -> dict:
+        """Get hit/miss counters and current size."""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                'entries': len(self._entries),
+                'max_entries': self.max_entries,
+                'ttl_seconds': self.ttl_seconds,
+                'hits': self.hits,
+                'misses': self.misses,
+                'hit_rate': round(self.hits / lookups, 3) if lookups else 0.0,
+                'evictions': self.evictions,
+                'invalidations': self.invalidations,
+            }
+
+
+calendar_cache = CalendarCache()
+
+
+def _changed_booking_dates(session: so.Session) -> set:
+    """Collect the booking dates affected by the pending flush."""
+    dates = set()
+    booking_ids = set()
+    renamed_member_ids = set()
+
+    def add_booking(booking):
+        state = sa.inspect(booking)
+        dates.add(booking.booking_date)
+        history = state.attrs.booking_date.history
+        dates.update(history.deleted)
+
+    for obj in list(session.new) + list(session.dirty) + list(session.deleted):
+        if isinstance(obj, Booking):
+            add_booking(obj)
+        elif isinstance(obj, Team):
+            if obj.booking is not None:
+                add_booking(obj.booking)
+            elif obj.booking_id:
+                booking_ids.add(obj.booking_id)
+        elif isinstance(obj, TeamMember):
+            team = obj.team
+            if team is not None and team.booking is not None:
+                add_booking(team.booking)
+        elif isinstance(obj, Member) and obj.id and member_name_changed(obj):
+            renamed_member_ids.add(obj.id)
+
+    if booking_ids:
+        dates.update(session.execute(
+            sa.select(Booking.booking_date).where(Booking.id.in_(booking_ids))
+        ).scalars())
+    if renamed_member_ids:
+        # Payloads show organiser names
+        dates.update(session.execute(
+            sa.select(Booking.booking_date).where(Booking.organizer_id.in_(renamed_member_ids)).distinct()
+        ).scalars())
+    return dates
+
+
+@sa.event.listens_for(so.Session, 'before_flush')
+def _record_calendar_changes(session, flush_context, instances):
+    """Remember which dates this transaction touches."""
+    if not calendar_cache.enabled:
+        return
+    dates = _changed_booking_dates(session)
+    if dates:
+        session.info.setdefault(DIRTY_DATES_KEY, set()).update(dates)
+
+
+@sa.event.listens_for(so.Session, 'do_orm_execute')
+def _record_calendar_bulk_inserts(orm_execute_state):
+    """Remember the dates of bookings added by ORM bulk INSERT, which skips the flush hook."""
+    from app.bookings.occupancy import bulk_insert_rows
+
+    if not calendar_cache.enabled:
+        return
+    dates = {row.get('booking_date') for row in bulk_insert_rows(orm_execute_state, Booking)}
+    if dates:
+        orm_execute_state.session.info.setdefault(DIRTY_DATES_KEY, set()).update(dates)
+
+
+@sa.event.listens_for(so.Session, 'after_commit')
+def _invalidate_calendar_cache(session):
+    """Drop cached windows covering dates changed by the committed transaction."""
+    dates = session.info.pop(DIRTY_DATES_KEY, None) or ()
+    version_change = session.info.pop(VERSION_CHANGE_KEY, None)
+    if version_change:
+        calendar_cache.commit_version(dates, *version_change)
+    elif dates:
+        calendar_cache.invalidate_dates(dates)
+
+
+@sa.event.listens_for(so.Session, 'after_rollback')
+def _discard_calendar_changes(session):
+    """Rolled back changes never reached the database."""
+    session.info.pop(DIRTY_DATES_KEY, None)
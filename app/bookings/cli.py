@@ -0,0 +1,58 @@
+"""
+Booking maintenance commands.
+Registered on the bookings blueprint, e.g. `flask bookings occupancy-verify`.
+"""
+
+import click
+
+from app.bookings import bp
+
+
+@bp.cli.command('occupancy-rebuild')
+def occupancy_rebuild():
+    """Recompute the rink occupancy index from the bookings table."""
+    from app.bookings.occupancy import rebuild_rink_occupancy
+
+    slots = rebuild_rink_occupancy()
+    click.echo(f'Rebuilt rink occupancy index: {slots} occupied slot(s).')
+
+
+@bp.cli.command('occupancy-verify')
+def occupancy_verify():
+    """Check the rink occupancy index against the bookings table."""
+    from app.bookings.occupancy import verify_rink_occupancy
+
+    mismatches = verify_rink_occupancy()
+    if not mismatches:
+        click.echo('Rink occupancy index is consistent with bookings.')
+        return
+
+    for booking_date, session, indexed, actual in mismatches:
+        click.echo(f'{booking_date.isoformat()} session {session}: indexed {indexed}, actual {actual}')
+    click.echo(f'{len(mismatches)} mismatched slot(s). Run `flask bookings occupancy-rebuild` to repair.')
+    raise SystemExit(1)
+
+
+@bp.cli.command('series-rebuild')
+def series_rebuild():
+    """Recompute the booking_series table from the bookings table."""
+    from app.bookings.series import rebuild_series
+
+    count = rebuild_series()
+    click.echo(f'Rebuilt series table: {count} series.')
+
+
+@bp.cli.command('series-verify')
+def series_verify():
+    """Check the booking_series table against the bookings table."""
+    from app.bookings.series import verify_series
+
+    mismatches = verify_series()
+    if not mismatches:
+        click.echo('Series table is consistent with bookings.')
+        return
+
+    for series_id in mismatches:
+        click.echo(f'Series {series_id} is out of date')
+    click.echo(f'{len(mismatches)} mismatched series. Run `flask bookings series-rebuild` to repair.')
+    raise SystemExit(1)
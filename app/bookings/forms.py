@@ -52,23 +52,11 @@ class BookingForm(FlaskForm):
         for the given date and session.
         """
         if self.booking_date.data and self.session.data:
-            from app.models import Booking
-            from app import db
             from flask import current_app
-            import sqlalchemy as sa
+            from app.bookings.occupancy import get_used_rinks
             
-            # Calculate total existing bookings for this date/session
-            # Exclude away games from rink availability calculations
-            from app.bookings.utils import add_home_games_filter
-            
-            existing_query = sa.select(sa.func.sum(Booking.rink_count)).where(
-                Booking.booking_date == self.booking_date.data,
-                Booking.session == self.session.data
-            )
-            # Apply home games filter to exclude away games
-            existing_query = add_home_games_filter(existing_query)
-            
-            existing_rinks = db.session.scalar(existing_query) or 0
+            # Rinks already used by home games for this date/session (away games excluded)
+            existing_rinks = get_used_rinks(self.booking_date.data, self.session.data)
             
             # Get the maximum available rinks
             max_rinks = int(current_app.config.get('RINKS', 6))
@@ -154,8 +142,11 @@ class LeagueScheduleForm(FlaskForm):
     create_all = SubmitField('Create All Games')
     cancel = SubmitField('Cancel')
     
+    # Rinks each game needs; set by the view so the whole schedule can be capacity-checked
+    rink_count = None
+    
     def validate_games(self, field):
-        """Validate that at least one game has a date and no duplicate dates"""
+        """Validate that at least one game has a date, no duplicate dates and rinks are free"""
         valid_games = [game for game in field.data if game.get('date')]
         
         if not valid_games:
@@ -167,4 +158,22 @@ class LeagueScheduleForm(FlaskForm):
             game_date = game.get('date')
             if game_date in dates_seen:
                 raise ValidationError(f'Duplicate date found: {game_date.strftime("%Y-%m-%d")}')
-            dates_seen.add(game_date)
\ No newline at end of file
+            dates_seen.add(game_date)
+        
+        if self.rink_count:
+            from app.bookings.occupancy import check_slot_availability
+            
+            # Check every fixture against current occupancy in one query
+            slots = [
+                (game['date'], game['session'], self.rink_count, game.get('venue'))
+                for game in valid_games if game.get('session')
+            ]
+            results = check_slot_availability(slots, current_app.config.get('RINKS', 6))
+            conflicts = [
+                f"{result['date']} session {result['session']} ({result['available']} free)"
+                for result in results if not result['ok']
+            ]
+            if conflicts:
+                raise ValidationError(
+                    f'Not enough rinks available for {self.rink_count} rink(s) on: {", ".join(conflicts)}'
+                )
@@ -0,0 +1,259 @@
+"""
+Per-member iCalendar (.ics) feeds.
+
+Each member can subscribe to a secret feed URL covering their team assignments,
+roll-up invitations and pool registrations. The generated text is stored in
+member_calendar_feeds and served as-is; a session before_flush hook deletes the
+stored feed of every member affected by a change to their TeamMember or
+PoolRegistration rows, or to a Booking/Team they are linked to, so only those
+members' feeds are rebuilt on the next poll. A stored feed is also rebuilt once a
+day so past games drop out of the window.
+"""
+
+import re
+import secrets
+from datetime import date, datetime, time, timedelta
+from typing import Iterable, Optional, Set, Tuple
+
+import sqlalchemy as sa
+import sqlalchemy.orm as so
+from flask import current_app
+
+from app import db
+from app.models import Booking, Member, MemberCalendarFeed, Pool, PoolRegistration, Team, TeamMember
+
+# How far back the feed keeps past games
+FEED_HISTORY_DAYS = 30
+
+# Domain part of event UIDs; must stay stable so calendar apps update rather than duplicate events
+UID_DOMAIN = 'bowls-club'
+
+_SESSION_TIME = re.compile(r'(\d{1,2}):(\d{2})\s*([ap]m)', re.IGNORECASE)
+
+
+def get_or_create_calendar_token(member: Member) -> str:
+    """
+    Get a member's calendar feed token, creating one if needed (caller commits).
+
+    Args:
+        member: Member instance
+
+    Returns:
+        URL-safe secret token
+    """
+    if not member.calendar_token:
+        member.calendar_token = secrets.token_urlsafe(32)
+    return member.calendar_token
+
+
+def reset_calendar_token(member: Member) -> str:
+    """Replace a member's calendar token so old subscription URLs stop working (caller commits)."""
+    member.calendar_token = secrets.token_urlsafe(32)
+    return member.calendar_token
+
+
+def _session_times(label: str) -> Optional[Tuple[time, time]]:
+    """Parse a DAILY_SESSIONS label such as '10:00am - 1:00pm' into start and end times."""
+    matches = _SESSION_TIME.findall(label or '')
+    if len(matches) != 2:
+        return None
+    parsed = []
+    for hour, minute, meridiem in matches:
+        hour = int(hour) % 12 + (12 if meridiem.lower() == 'pm' else 0)
+        parsed.append(time(hour, int(minute)))
+    return parsed[0], parsed[1]
+
+
+def _escape(text: str) -> str:
+    """Escape a TEXT value (RFC 5545 section 3.3.11)."""
+    return (text or '').replace('\\', '\\\\').replace(';', '\\;').replace(',', '\\,').replace('\n', '\\n')
+
+
+def _fold(line: str) -> str:
+    """Fold a content line to 75 octets (RFC 5545 section 3.1)."""
+    encoded = line.encode('utf-8')
+    if len(encoded) <= 75:
+        return line
+    parts = []
+    while encoded:
+        limit = 75 if not parts else 74
+        chunk = encoded[:limit]
+        # Do not split a multi-byte character
+        while chunk and (chunk[-1] & 0xC0) == 0x80 and len(chunk) < len(encoded):
+            chunk = chunk[:-1]
+        parts.append(chunk.decode('utf-8'))
+        encoded = encoded[len(chunk):]
+    return '\r\n '.join(parts)
+
+
+def _event_lines(booking: Booking, kind: str, status: str, stamp: str) -> list:
+    """Build the VEVENT lines for one booking."""
+    sessions = current_app.config.get('DAILY_SESSIONS', {})
+    label = sessions.get(booking.session, '')
+    times = _session_times(label)
+
+    if kind == 'rollup':
+        summary = f"Roll-up ({label})" if label else 'Roll-up'
+    else:
+        summary = booking.name + (f" vs {booking.vs}" if booking.vs else '')
+    description = {'team': f'Team selection: {status}',
+                   'rollup': f'Roll-up invitation: {status}',
+                   'pool': f'Pool registration: {status}'}[kind]
+
+    lines = [
+        'BEGIN:VEVENT',
+        f'UID:booking-{booking.id}@{UID_DOMAIN}',
+        f'DTSTAMP:{stamp}',
+    ]
+    if times:
+        lines.append(f'DTSTART:{datetime.combine(booking.booking_date, times[0]).strftime("%Y%m%dT%H%M%S")}')
+        lines.append(f'DTEND:{datetime.combine(booking.booking_date, times[1]).strftime("%Y%m%dT%H%M%S")}')
+    else:
+        lines.append(f'DTSTART;VALUE=DATE:{booking.booking_date.strftime("%Y%m%d")}')
+    lines.append(f'SUMMARY:{_escape(summary)}')
+    lines.append(f'DESCRIPTION:{_escape(description)}')
+    if booking.home_away == 'away':
+        lines.append('LOCATION:Away')
+    if status in ('unavailable', 'declined'):
+        lines.append('STATUS:CANCELLED')
+    lines.append('END:VEVENT')
+    return lines
+
+
+def build_member_calendar(member_id: int) -> str:
+    """
+    Generate the iCalendar text for a member's games.
+
+    Args:
+        member_id: Member ID
+
+    Returns:
+        iCalendar document (CRLF line endings)
+    """
+    since = date.today() - timedelta(days=FEED_HISTORY_DAYS)
+
+    # One row per booking the member is in a team for (roll-ups included)
+    team_rows = db.session.execute(
+        sa.select(Booking, TeamMember.availability_status)
+        .join(Team, Team.booking_id == Booking.id)
+        .join(TeamMember, TeamMember.team_id == Team.id)
+        .where(TeamMember.member_id == member_id, Booking.booking_date >= since)
+        .order_by(Booking.booking_date, Booking.session)
+    ).all()
+
+    # Pool registrations for bookings the member is not yet in a team for
+    pool_rows = db.session.execute(
+        sa.select(Booking, PoolRegistration.status)
+        .join(Pool, Pool.booking_id == Booking.id)
+        .join(PoolRegistration, PoolRegistration.pool_id == Pool.id)
+        .where(PoolRegistration.member_id == member_id, Booking.booking_date >= since)
+        .order_by(Booking.booking_date, Booking.session)
+    ).all()
+
+    stamp = datetime.utcnow().strftime('%Y%m%dT%H%M%SZ')
+    lines = [
+        'BEGIN:VCALENDAR',
+        'VERSION:2.0',
+        'PRODID:-//Bowls Club//Member Games//EN',
+        'CALSCALE:GREGORIAN',
+        'METHOD:PUBLISH',
+        'X-WR-CALNAME:My Bowls Games',
+    ]
+    seen = set()
+    for booking, status in team_rows:
+        if booking.id in seen:
+            continue
+        seen.add(booking.id)
+        kind = 'rollup' if booking.booking_type == 'rollup' else 'team'
+        lines.extend(_event_lines(booking, kind, status, stamp))
+    for booking, status in pool_rows:
+        if booking.id in seen:
+            continue
+        seen.add(booking.id)
+        lines.extend(_event_lines(booking, 'pool', status, stamp))
+    lines.append('END:VCALENDAR')
+
+    return '\r\n'.join(_fold(line) for line in lines) + '\r\n'
+
+
+def get_member_calendar(member_id: int) -> MemberCalendarFeed:
+    """
+    Get a member's stored feed, rebuilding it if it was invalidated or is from a previous day.
+
+    Args:
+        member_id: Member ID
+
+    Returns:
+        MemberCalendarFeed with the current body
+    """
+    feed = db.session.get(MemberCalendarFeed, member_id)
+    if feed is not None and feed.generated_at.date() == datetime.utcnow().date():
+        return feed
+
+    body = build_member_calendar(member_id)
+    if feed is None:
+        feed = MemberCalendarFeed(member_id=member_id, body=body, generated_at=datetime.utcnow())
+        db.session.add(feed)
+    else:
+        feed.body = body
+        feed.generated_at = datetime.utcnow()
+    try:
+        db.session.commit()
+    except sa.exc.IntegrityError:
+        # A concurrent poll stored it first; serve what we built
+        db.session.rollback()
+        feed = MemberCalendarFeed(member_id=member_id, body=body, generated_at=datetime.utcnow())
+    return feed
+
+
+def _old_and_new(obj, attr: str) -> Iterable:
+    """Get an attribute's current value and any value it had before this flush."""
+    history = sa.inspect(obj).attrs[attr].history
+    return [value for value in (list(history.deleted) + [getattr(obj, attr)]) if value is not None]
+
+
+def _affected_member_ids(session: so.Session) -> Set[int]:
+    """Collect the members whose feed the pending flush changes."""
+    member_ids = set()
+    booking_ids = set()
+    team_ids = set()
+
+    for obj in list(session.new) + list(session.dirty) + list(session.deleted):
+        if isinstance(obj, (TeamMember, PoolRegistration)):
+            member_ids.update(_old_and_new(obj, 'member_id'))
+            if obj.member_id is None and obj.member is not None:
+                member_ids.add(obj.member.id)
+        elif isinstance(obj, Booking) and obj.id is not None:
+            booking_ids.add(obj.id)
+        elif isinstance(obj, Team) and obj.id is not None:
+            team_ids.add(obj.id)
+
+    connection = session.connection()
+    if booking_ids:
+        member_ids.update(connection.execute(
+            sa.select(TeamMember.member_id)
+            .join(Team, Team.id == TeamMember.team_id)
+            .where(Team.booking_id.in_(booking_ids))
+            .union(
+                sa.select(PoolRegistration.member_id)
+                .join(Pool, Pool.id == PoolRegistration.pool_id)
+                .where(Pool.booking_id.in_(booking_ids))
+            )
+        ).scalars())
+    if team_ids:
+        member_ids.update(connection.execute(
+            sa.select(TeamMember.member_id).where(TeamMember.team_id.in_(team_ids))
+        ).scalars())
+    return member_ids
+
+
+@sa.event.listens_for(so.Session, 'before_flush')
+def _invalidate_member_calendars(session, flush_context, instances):
+    """Drop stored feeds of members affected by this flush, in the same transaction."""
+    if not any(isinstance(obj, (Booking, Team, TeamMember, PoolRegistration))
+               for obj in list(session.new) + list(session.dirty) + list(session.deleted)):
+        return
+    member_ids = _affected_member_ids(session)
+    if member_ids:
+        table = MemberCalendarFeed.__table__
+        session.connection().execute(sa.delete(table).where(table.c.member_id.in_(member_ids)))
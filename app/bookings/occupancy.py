@@ -0,0 +1,409 @@
+"""
+Rink occupancy index maintenance.
+
+The rink_occupancy table holds the number of rinks used by home bookings for each
+(booking_date, session). It is kept in step with the bookings table by a session
+before_flush hook, so every ORM insert, edit, move or delete of a Booking adjusts the
+affected slots inside the same transaction.
+
+ORM bulk inserts (session.execute(sa.insert(Booking), rows)) are counted by a
+do_orm_execute hook. Bulk UPDATE/DELETE statements bypass both hooks; use
+`flask bookings occupancy-rebuild` after any such maintenance.
+"""
+
+from collections import defaultdict
+from datetime import date
+from typing import Dict, Iterable, List, Optional, Tuple
+
+import sqlalchemy as sa
+import sqlalchemy.orm as so
+
+from app import db
+from app.models import Booking, RinkOccupancy
+
+OccupancyKey = Tuple[date, int]
+
+
+def _slot_for(booking_date, session, rink_count, home_away) -> Optional[Tuple[OccupancyKey, int]]:
+    """
+    Return the ((date, session), rinks) a booking occupies, or None if it uses no rinks.
+    Mirrors add_home_games_filter: away games never occupy a home rink.
+    """
+    if booking_date is None or session is None or home_away == 'away':
+        return None
+    return (booking_date, session), (rink_count if rink_count is not None else 1)
+
+
+def _old_value(state, attr: str):
+    """Get the value an attribute had when it was last loaded from the database."""
+    history = state.attrs[attr].history
+    if history.deleted:
+        return history.deleted[0]
+    return state.attrs[attr].value
+
+
+def _booking_slot(booking: Booking, old: bool = False):
+    """Get the occupancy slot for a booking's current or previously persisted values."""
+    if old:
+        state = sa.inspect(booking)
+        return _slot_for(_old_value(state, 'booking_date'), _old_value(state, 'session'),
+                         _old_value(state, 'rink_count'), _old_value(state, 'home_away'))
+    return _slot_for(booking.booking_date, booking.session, booking.rink_count, booking.home_away)
+
+
+def collect_occupancy_deltas(session: so.Session) -> Dict[OccupancyKey, int]:
+    """
+    Work out the net change in used rinks per slot for the pending flush.
+
+    Args:
+        session: Session about to be flushed
+
+    Returns:
+        Dictionary of {(booking_date, session): rink delta}, zero deltas omitted
+    """
+    deltas = defaultdict(int)
+
+    for obj in session.new:
+        if isinstance(obj, Booking):
+            slot = _booking_slot(obj)
+            if slot:
+                deltas[slot[0]] += slot[1]
+
+    for obj in session.deleted:
+        if isinstance(obj, Booking) and sa.inspect(obj).has_identity:
+            slot = _booking_slot(obj, old=True)
+            if slot:
+                deltas[slot[0]] -= slot[1]
+
+    for obj in session.dirty:
+        if isinstance(obj, Booking) and session.is_modified(obj, include_collections=False):
+            old_slot = _booking_slot(obj, old=True)
+            new_slot = _booking_slot(obj)
+            if old_slot == new_slot:
+                continue
+            if old_slot:
+                deltas[old_slot[0]] -= old_slot[1]
+            if new_slot:
+                deltas[new_slot[0]] += new_slot[1]
+
+    return {key: delta for key, delta in deltas.items() if delta}
+
+
+def _occupancy_upsert(connection):
+    """
+    Build an INSERT into rink_occupancy that adds to used_rinks when the slot row exists.
+
+    A single statement, so concurrent writers that both find a slot missing cannot
+    both insert it. SQLite and PostgreSQL share the ON CONFLICT syntax.
+    """
+    if connection.dialect.name == 'postgresql':
+        from sqlalchemy.dialects.postgresql import insert
+    else:
+        from sqlalchemy.dialects.sqlite import insert
+
+    table = RinkOccupancy.__table__
+    statement = insert(table)
+    return statement.on_conflict_do_update(
+        index_elements=[table.c.booking_date, table.c.session],
+        set_={'used_rinks': table.c.used_rinks + statement.excluded.used_rinks}
+    )
+
+
+def apply_occupancy_deltas(connection, deltas: Dict[OccupancyKey, int]) -> None:
+    """
+    Apply per-slot rink deltas to the occupancy index on the given connection.
+
+    Args:
+        connection: Connection bound to the current transaction
+        deltas: Dictionary of {(booking_date, session): rink delta}
+    """
+    if not deltas:
+        return
+    upsert = _occupancy_upsert(connection)
+    # Consistent slot order keeps concurrent writers from deadlocking on the index rows
+    ordered = sorted(deltas.items(), key=lambda item: (str(item[0][0]), item[0][1]))
+
+    # Dates given as SQL expressions cannot be sent as batch parameters; adjust those one by one
+    for (booking_date, session), delta in ordered:
+        if not isinstance(booking_date, date):
+            connection.execute(upsert.values(booking_date=booking_date, session=session, used_rinks=delta))
+
+    # One batched upsert however many slots change
+    rows = [
+        {'booking_date': booking_date, 'session': session, 'used_rinks': delta}
+        for (booking_date, session), delta in ordered if isinstance(booking_date, date)
+    ]
+    if rows:
+        connection.execute(upsert, rows)
+
+
+@sa.event.listens_for(so.Session, 'before_flush')
+def _maintain_rink_occupancy(session, flush_context, instances):
+    """Keep rink_occupancy in step with Booking changes in the same transaction."""
+    deltas = collect_occupancy_deltas(session)
+    if deltas:
+        apply_occupancy_deltas(session.connection(), deltas)
+
+
+def bulk_insert_rows(orm_execute_state: so.ORMExecuteState, model) -> List[dict]:
+    """
+    Get the parameter rows of an ORM bulk INSERT of a model (session.execute(sa.insert(Model), rows)).
+
+    Args:
+        orm_execute_state: State passed to a do_orm_execute listener
+        model: Mapped class to match
+
+    Returns:
+        List of parameter dictionaries, empty if the statement is not such an insert
+    """
+    if not orm_execute_state.is_insert or orm_execute_state.bind_mapper is not sa.inspect(model):
+        return []
+    parameters = orm_execute_state.parameters
+    if isinstance(parameters, dict):
+        return [parameters]
+    return list(parameters or [])
+
+
+@sa.event.listens_for(so.Session, 'do_orm_execute')
+def _maintain_rink_occupancy_bulk(orm_execute_state):
+    """Count bookings added by ORM bulk INSERT, which skips the flush hook."""
+    deltas = defaultdict(int)
+    for row in bulk_insert_rows(orm_execute_state, Booking):
+        slot = _slot_for(row.get('booking_date'), row.get('session'),
+                         row.get('rink_count'), row.get('home_away'))
+        if slot:
+            deltas[slot[0]] += slot[1]
+    if deltas:
+        apply_occupancy_deltas(orm_execute_state.session.connection(), deltas)
+
+
+def get_used_rinks(booking_date: date, session: int) -> int:
+    """
+    Get the number of rinks used by home bookings for a date and session.
+
+    Args:
+        booking_date: Date of the slot
+        session: Session number
+
+    Returns:
+        Number of rinks in use (0 if nothing is booked)
+    """
+    return db.session.scalar(
+        sa.select(RinkOccupancy.used_rinks).where(
+            RinkOccupancy.booking_date == booking_date,
+            RinkOccupancy.session == session
+        )
+    ) or 0
+
+
+def get_occupancy_for_range(start_date: date, end_date: date) -> Dict[str, Dict[int, int]]:
+    """
+    Get used rinks for every booked slot in a date range.
+
+    Args:
+        start_date: First date (inclusive)
+        end_date: Last date (inclusive)
+
+    Returns:
+        Dictionary of {iso_date: {session: used_rinks}} for slots with rinks in use
+    """
+    rows = db.session.execute(
+        sa.select(RinkOccupancy.booking_date, RinkOccupancy.session, RinkOccupancy.used_rinks)
+        .where(
+            RinkOccupancy.booking_date >= start_date,
+            RinkOccupancy.booking_date <= end_date,
+            RinkOccupancy.used_rinks != 0
+        )
+    ).all()
+
+    occupancy = {}
+    for booking_date, session, used_rinks in rows:
+        occupancy.setdefault(booking_date.isoformat(), {})[session] = used_rinks
+    return occupancy
+
+
+def check_slot_availability(slots: Iterable[Tuple[date, int, int, Optional[str]]],
+                            total_rinks: int, for_update: bool = False) -> List[dict]:
+    """
+    Check rink capacity for a batch of requested slots with one query.
+
+    Requests for the same slot within the batch are counted against each other in
+    order, so two fixtures on one session cannot both claim the last free rinks.
+    Away games never occupy a home rink and are always available.
+
+    Args:
+        slots: (booking_date, session, rinks_requested, home_away) tuples
+        total_rinks: Number of rinks at the club
+        for_update: Lock the occupancy rows read (SELECT ... FOR UPDATE where supported)
+
+    Returns:
+        One dictionary per input slot, in order, with date, session, requested,
+        used, available and ok keys
+    """
+    slots = list(slots)
+    home_slots = [(d, s) for d, s, _, home_away in slots if home_away != 'away']
+
+    used = {}
+    if home_slots:
+        query = (
+            sa.select(RinkOccupancy.booking_date, RinkOccupancy.session, RinkOccupancy.used_rinks)
+            .where(
+                RinkOccupancy.booking_date.in_({d for d, _ in home_slots}),
+                RinkOccupancy.session.in_({s for _, s in home_slots})
+            )
+        )
+        if for_update:
+            # Lock in a consistent order so concurrent reservations cannot deadlock
+            query = query.order_by(RinkOccupancy.booking_date, RinkOccupancy.session).with_for_update()
+        rows = db.session.execute(query).all()
+        used = {(d, s): used_rinks for d, s, used_rinks in rows}
+
+    results = []
+    for booking_date, session, requested, home_away in slots:
+        key = (booking_date, session)
+        slot_used = used.get(key, 0)
+        available = max(total_rinks - slot_used, 0)
+        if home_away == 'away':
+            ok = True
+        else:
+            ok = requested <= available
+            if ok:
+                used[key] = slot_used + requested
+        results.append({
+            'date': booking_date.isoformat(),
+            'session': session,
+            'requested': requested,
+            'used': slot_used,
+            'available': available,
+            'ok': ok
+        })
+    return results
+
+
+class RinkCapacityError(ValueError):
+    """Raised when a reservation asks for more rinks than a slot has free."""
+
+    def __init__(self, conflicts: List[dict]):
+        self.conflicts = conflicts
+        slots = ', '.join(f"{c['date']} session {c['session']} ({c['available']} free)" for c in conflicts)
+        super().__init__(f'Not enough rinks available on: {slots}')
+
+
+def _lock_slots(keys: List[OccupancyKey]) -> None:
+    """
+    Take the database lock that serialises capacity checks for the given slots.
+
+    SQLite has no row locks, so the transaction is upgraded to a write transaction
+    with BEGIN IMMEDIATE (other writers wait on the busy timeout). Elsewhere, missing
+    occupancy rows are created first so the SELECT ... FOR UPDATE in
+    check_slot_availability has a row to lock for every slot.
+    """
+    connection = db.session.connection()
+    dialect = connection.dialect.name
+
+    if dialect == 'sqlite':
+        dbapi_connection = connection.connection.dbapi_connection
+        # A transaction that has already written holds the write lock
+        if not dbapi_connection.in_transaction:
+            connection.exec_driver_sql('BEGIN IMMEDIATE')
+        return
+
+    if dialect == 'postgresql' and keys:
+        from sqlalchemy.dialects.postgresql import insert as pg_insert
+
+        connection.execute(
+            pg_insert(RinkOccupancy.__table__)
+            .values([{'booking_date': d, 'session': s, 'used_rinks': 0} for d, s in sorted(set(keys))])
+            .on_conflict_do_nothing()
+        )
+
+
+def reserve_rinks(slots: Iterable[Tuple[date, int, int, Optional[str]]],
+                  total_rinks: Optional[int] = None) -> List[dict]:
+    """
+    Atomically check capacity for slots about to be booked.
+
+    Locks the affected (date, session) slots for the rest of the current transaction,
+    so no other reservation can check or change them until this one commits or rolls
+    back. Call it before adding the bookings, then commit the session.
+
+    Args:
+        slots: (booking_date, session, rinks_requested, home_away) tuples
+        total_rinks: Number of rinks at the club (defaults to the RINKS setting)
+
+    Returns:
+        Availability results, as from check_slot_availability
+
+    Raises:
+        RinkCapacityError: If any slot lacks rinks; the caller should roll back
+    """
+    from flask import current_app
+
+    slots = list(slots)
+    if total_rinks is None:
+        total_rinks = current_app.config.get('RINKS', 6)
+
+    _lock_slots([(d, s) for d, s, _, home_away in slots if home_away != 'away'])
+    results = check_slot_availability(slots, total_rinks, for_update=True)
+    conflicts = [result for result in results if not result['ok']]
+    if conflicts:
+        raise RinkCapacityError(conflicts)
+    return results
+
+
+def compute_occupancy_from_bookings() -> Dict[OccupancyKey, int]:
+    """Recompute used rinks per slot directly from the bookings table."""
+    from app.bookings.utils import add_home_games_filter
+
+    query = add_home_games_filter(
+        sa.select(Booking.booking_date, Booking.session, sa.func.sum(Booking.rink_count))
+        .group_by(Booking.booking_date, Booking.session)
+    )
+    return {
+        (booking_date, session): used
+        for booking_date, session, used in db.session.execute(query).all()
+        if used
+    }
+
+
+def verify_rink_occupancy() -> List[Tuple[date, int, int, int]]:
+    """
+    Compare the occupancy index with the bookings table.
+
+    Returns:
+        List of (booking_date, session, indexed_rinks, actual_rinks) for every slot that differs
+    """
+    expected = compute_occupancy_from_bookings()
+    indexed = {
+        (row.booking_date, row.session): row.used_rinks
+        for row in db.session.scalars(sa.select(RinkOccupancy)).all()
+    }
+
+    mismatches = []
+    for key in sorted(set(expected) | set(indexed)):
+        actual = expected.get(key, 0)
+        stored = indexed.get(key, 0)
+        if actual != stored:
+            mismatches.append((key[0], key[1], stored, actual))
+    return mismatches
+
+
+def rebuild_rink_occupancy() -> int:
+    """
+    Rebuild the occupancy index from the bookings table and commit.
+
+    Returns:
+        Number of occupied slots written
+    """
+    expected = compute_occupancy_from_bookings()
+    db.session.execute(sa.delete(RinkOccupancy))
+    if expected:
+        db.session.execute(
+            sa.insert(RinkOccupancy),
+            [
+                {'booking_date': booking_date, 'session': session, 'used_rinks': used}
+                for (booking_date, session), used in sorted(expected.items())
+            ]
+        )
+    db.session.commit()
+    return len(expected)
@@ -5,16 +5,20 @@ All booking-related routes migrated from main, admin, and api blueprints.
 
 from datetime import date, datetime, timedelta
 import sqlalchemy as sa
+import sqlalchemy.orm as so
 from flask import render_template, flash, redirect, url_for, request, current_app, jsonify, abort
 from flask_login import login_required, current_user
 from flask_wtf import FlaskForm
 
 from app import db
 from app.bookings import bp
-from app.models import Booking, Member, Team
-from app.routes import role_required
+from app.models import Booking, Member, Series, Team
+from app.routes import role_required, admin_required
 from app.bookings.utils import add_home_games_filter
 from app.bookings.utils import can_user_manage_booking
+from app.bookings.versioning import bookings_etag, get_version, not_modified_response, with_etag
+from app.bookings.cache import calendar_cache
+from app.bookings.occupancy import reserve_rinks, RinkCapacityError
 from app.audit import audit_log_create, audit_log_update, audit_log_delete, audit_log_bulk_operation, audit_log_security_event, get_model_changes
 
 
@@ -48,6 +52,138 @@ def bookings():
                              locale=current_app.config.get('LOCALE', 'en-GB'))
 
 
+def _cached_calendar_response(cache_key, start_date, end_date, version, build_data):
+    """
+    Serve calendar JSON from the in-process cache, building and storing it on a miss.
+    
+    Args:
+        cache_key: Cache key for this endpoint and window
+        start_date: First date covered by the payload
+        end_date: Last date covered by the payload
+        version: Current bookings version, which the response ETag is derived from
+        build_data: Callable returning the response dictionary
+        
+    Returns:
+        JSON response with ETag headers
+    """
+    payload = calendar_cache.get(cache_key, version)
+    if payload is None:
+        generation = calendar_cache.generation
+        payload = current_app.json.dumps(build_data())
+        calendar_cache.set(cache_key, payload, start_date, end_date, generation, version)
+    
+    response = current_app.response_class(f"{payload}\n", mimetype='application/json')
+    return with_etag(response, bookings_etag(version))
+
+
+def _build_day_bookings_data(booking_date, selected_date):
+    """Build the get_bookings response dictionary for one date."""
+    # Get all bookings for this date
+    bookings = db.session.scalars(
+        sa.select(Booking)
+        .where(Booking.booking_date == booking_date)
+        .order_by(Booking.session)
+    ).all()
+    
+    # Format bookings for JSON response
+    bookings_data = []
+    for booking in bookings:
+        booking_info = {
+            'id': booking.id,
+            'session': booking.session,
+            'rink_count': booking.rink_count,
+            'booking_type': booking.booking_type,
+            'organizer': f"{booking.organizer.firstname} {booking.organizer.lastname}",
+            'organizer_notes': booking.organizer_notes
+        }
+        
+        if booking.booking_type == 'event':
+            booking_info['event_name'] = booking.name
+            booking_info['event_type'] = booking.event_type
+            booking_info['vs'] = booking.vs
+        
+        bookings_data.append(booking_info)
+    
+    return {
+        'success': True,
+        'bookings': bookings_data,
+        'date': selected_date,
+        'total_rinks': current_app.config.get('RINKS', 6)
+    }
+
+
+def _build_range_bookings_data(start_date_obj, end_date_obj):
+    """Build the get_bookings_range response dictionary from a fixed number of queries."""
+    range_filter = (
+        Booking.booking_date >= start_date_obj,
+        Booking.booking_date <= end_date_obj
+    )
+    
+    # Get all bookings in the range with organizer names joined in (no per-row lazy loads)
+    rows = db.session.execute(
+        sa.select(Booking, Member.firstname, Member.lastname)
+        .outerjoin(Member, Booking.organizer_id == Member.id)
+        .where(*range_filter)
+        .order_by(Booking.booking_date, Booking.session)
+    ).all()
+    
+    # Roll-up player counts from a single grouped count over team members
+    from app.models import TeamMember
+    player_counts = dict(db.session.execute(
+        sa.select(Team.booking_id, sa.func.count(TeamMember.id))
+        .join(TeamMember, TeamMember.team_id == Team.id)
+        .join(Booking, Team.booking_id == Booking.id)
+        .where(Booking.booking_type == 'rollup', *range_filter)
+        .group_by(Team.booking_id)
+    ).all())
+    
+    # Organize bookings by date and session
+    bookings_by_date = {}
+    for booking, organizer_firstname, organizer_lastname in rows:
+        date_str = booking.booking_date.isoformat()
+        if date_str not in bookings_by_date:
+            bookings_by_date[date_str] = {}
+        
+        session = booking.session
+        if session not in bookings_by_date[date_str]:
+            bookings_by_date[date_str][session] = []
+        
+        organizer_name = f"{organizer_firstname} {organizer_lastname}" if organizer_firstname is not None else "Unknown"
+        
+        booking_info = {
+            'id': booking.id,
+            'rink_count': booking.rink_count,
+            'booking_type': booking.booking_type,
+            'organizer': organizer_name,
+            'organizer_notes': booking.organizer_notes
+        }
+        
+        if booking.booking_type == 'rollup':
+            # For roll-ups, include player count from team members
+            booking_info['player_count'] = player_counts.get(booking.id, 0)
+        else:
+            # For regular events, include event details from booking (booking IS the event now)
+            booking_info['event_name'] = booking.name
+            booking_info['event_type'] = booking.event_type
+            booking_info['vs'] = booking.vs
+            booking_info['home_away'] = booking.home_away
+        
+        bookings_by_date[date_str][session].append(booking_info)
+    
+    # Used rinks per date/session (home games only) from the occupancy index
+    from app.bookings.occupancy import get_occupancy_for_range
+    occupancy = get_occupancy_for_range(start_date_obj, end_date_obj)
+    
+    return {
+        'success': True,
+        'bookings': bookings_by_date,
+        'occupancy': occupancy,
+        'rinks': current_app.config.get('RINKS', 6),
+        'sessions': current_app.config.get('DAILY_SESSIONS', {}),
+        'event_types': current_app.config.get('EVENT_TYPES', {})
+    }
+
+
 @bp.route('/get_bookings/<string:selected_date>')
 @login_required
 def get_bookings(selected_date):
@@ -58,38 +194,17 @@ def get_bookings(selected_date):
         # Parse the selected date
         booking_date = datetime.strptime(selected_date, '%Y-%m-%d').date()
         
-        # Get all bookings for this date
-        bookings = db.session.scalars(
-            sa.select(Booking)
-            .where(Booking.booking_date == booking_date)
-            .order_by(Booking.session)
-        ).all()
-        
-        # Format bookings for JSON response
-        bookings_data = []
-        for booking in bookings:
-            booking_info = {
-                'id': booking.id,
-                'session': booking.session,
-                'rink_count': booking.rink_count,
-                'booking_type': booking.booking_type,
-                'organizer': f"{booking.organizer.firstname} {booking.organizer.lastname}",
-                'organizer_notes': booking.organizer_notes
-            }
-            
-            if booking.booking_type == 'event':
-                booking_info['event_name'] = booking.name
-                booking_info['event_type'] = booking.event_type
-                booking_info['vs'] = booking.vs
-            
-            bookings_data.append(booking_info)
-        
-        return jsonify({
-            'success': True,
-            'bookings': bookings_data,
-            'date': selected_date,
-            'total_rinks': current_app.config.get('RINKS', 6)
-        })
+        # Answer conditional requests from the change-version stamp alone
+        version = get_version()
+        etag = bookings_etag(version)
+        not_modified = not_modified_response(etag)
+        if not_modified:
+            return not_modified
+        
+        return _cached_calendar_response(
+            ('day', selected_date), booking_date, booking_date, version,
+            lambda: _build_day_bookings_data(booking_date, selected_date)
+        )
     except Exception as e:
         current_app.logger.error(f"Error getting bookings for {selected_date}: {str(e)}")
         return jsonify({'success': False, 'error': str(e)}), 500
@@ -100,81 +215,119 @@ def get_bookings(selected_date):
 def get_bookings_range(start_date, end_date):
     """
     Get bookings for a date range (AJAX endpoint)
+    Served by a fixed number of queries however many bookings fall in the range.
     """
     try:
         # Parse dates
         start_date_obj = datetime.strptime(start_date, '%Y-%m-%d').date()
         end_date_obj = datetime.strptime(end_date, '%Y-%m-%d').date()
         
-        # Get all bookings in the range
-        bookings = db.session.scalars(
-            sa.select(Booking)
-            .where(
-                Booking.booking_date >= start_date_obj,
-                Booking.booking_date <= end_date_obj
-            )
-            .order_by(Booking.booking_date, Booking.session)
-        ).all()
+        # Answer conditional requests from the change-version stamp alone
+        version = get_version()
+        etag = bookings_etag(version)
+        not_modified = not_modified_response(etag)
+        if not_modified:
+            return not_modified
+        
+        return _cached_calendar_response(
+            ('range', start_date_obj, end_date_obj), start_date_obj, end_date_obj, version,
+            lambda: _build_range_bookings_data(start_date_obj, end_date_obj)
+        )
+    except Exception as e:
+        current_app.logger.error(f"Error getting bookings range {start_date} to {end_date}: {str(e)}")
+        return jsonify({'success': False, 'error': str(e)}), 500
+
+
+# Longest window the utilisation endpoint will serve in one request (a full season)
+MAX_UTILISATION_DAYS = 366
+
+
+def _build_utilisation_data(start_date_obj, end_date_obj):
+    """
+    Build a columnar used-rinks matrix for a date range from one grouped query.
+    
+    Args:
+        start_date_obj: First date (inclusive)
+        end_date_obj: Last date (inclusive)
         
-        # Organize bookings by date and session
-        bookings_by_date = {}
-        for booking in bookings:
-            date_str = booking.booking_date.isoformat()
-            if date_str not in bookings_by_date:
-                bookings_by_date[date_str] = {}
-            
-            session = booking.session
-            if session not in bookings_by_date[date_str]:
-                bookings_by_date[date_str][session] = []
-            
-            # Safely get organizer name
-            try:
-                organizer_name = f"{booking.organizer.firstname} {booking.organizer.lastname}" if booking.organizer else "Unknown"
-            except Exception as organizer_error:
-                current_app.logger.error(f"Error accessing organizer for booking {booking.id}: {str(organizer_error)}")
-                organizer_name = "Unknown"
-            
-            booking_info = {
-                'id': booking.id,
-                'rink_count': booking.rink_count,
-                'booking_type': booking.booking_type,
-                'organizer': organizer_name,
-                'organizer_notes': booking.organizer_notes
-            }
-            
-            if booking.booking_type == 'rollup':
-                # For roll-ups, include player count from team members
-                team_member_count = 0
-                try:
-                    if hasattr(booking, 'teams') and booking.teams:
-                        for team in booking.teams:
-                            if hasattr(team, 'members') and team.members:
-                                team_member_count += len(team.members)
-                except Exception as team_error:
-                    current_app.logger.error(f"Error counting team members for booking {booking.id}: {str(team_error)}")
-                    team_member_count = 0
-                booking_info['player_count'] = team_member_count
-            else:
-                # For regular events, include event details from booking (booking IS the event now)
-                booking_info['event_name'] = booking.name
-                booking_info['event_type'] = booking.event_type
-                booking_info['vs'] = booking.vs
-                booking_info['home_away'] = booking.home_away
-            
-            bookings_by_date[date_str][session].append(booking_info)
+    Returns:
+        Dictionary with a date axis, a session axis and a sessions-by-days matrix
+    """
+    query = add_home_games_filter(
+        sa.select(Booking.booking_date, Booking.session, sa.func.sum(Booking.rink_count))
+        .where(
+            Booking.booking_date >= start_date_obj,
+            Booking.booking_date <= end_date_obj
+        )
+    ).group_by(Booking.booking_date, Booking.session)
+    
+    day_count = (end_date_obj - start_date_obj).days + 1
+    dates = [(start_date_obj + timedelta(days=offset)).isoformat() for offset in range(day_count)]
+    sessions = sorted(current_app.config.get('DAILY_SESSIONS', {}))
+    session_rows = {session: index for index, session in enumerate(sessions)}
+    used = [[0] * day_count for _ in sessions]
+    
+    for booking_date, session, used_rinks in db.session.execute(query):
+        row = session_rows.get(session)
+        if row is not None:
+            used[row][(booking_date - start_date_obj).days] = int(used_rinks or 0)
+    
+    return {
+        'success': True,
+        'start': start_date_obj.isoformat(),
+        'end': end_date_obj.isoformat(),
+        'rinks': current_app.config.get('RINKS', 6),
+        'dates': dates,
+        'sessions': sessions,
+        'used': used
+    }
+
+
+@bp.route('/get_utilisation/<string:start_date>/<string:end_date>')
+@login_required
+def get_utilisation(start_date, end_date):
+    """
+    Get used rinks per date and session for a month or season overview (AJAX endpoint)
+    
+    Returns a compact columnar payload: `dates` is the day axis, `sessions` the
+    session axis and `used[i][j]` the home-game rinks in use for sessions[i] on dates[j].
+    """
+    try:
+        start_date_obj = datetime.strptime(start_date, '%Y-%m-%d').date()
+        end_date_obj = datetime.strptime(end_date, '%Y-%m-%d').date()
         
-        return jsonify({
-            'success': True,
-            'bookings': bookings_by_date,
-            'rinks': current_app.config.get('RINKS', 6),
-            'sessions': current_app.config.get('DAILY_SESSIONS', {}),
-            'event_types': current_app.config.get('EVENT_TYPES', {})
-        })
+        if end_date_obj < start_date_obj:
+            return jsonify({'success': False, 'error': 'End date must be on or after start date'}), 400
+        if (end_date_obj - start_date_obj).days + 1 > MAX_UTILISATION_DAYS:
+            return jsonify({'success': False, 'error': f'Date range cannot exceed {MAX_UTILISATION_DAYS} days'}), 400
+        
+        etag = bookings_etag()
+        not_modified = not_modified_response(etag)
+        if not_modified:
+            return not_modified
+        
+        return _cached_calendar_response(
+            ('utilisation', start_date_obj, end_date_obj), start_date_obj, end_date_obj, etag,
+            lambda: _build_utilisation_data(start_date_obj, end_date_obj)
+        )
     except Exception as e:
-        current_app.logger.error(f"Error getting bookings range {start_date} to {end_date}: {str(e)}")
+        current_app.logger.error(f"Error getting utilisation {start_date} to {end_date}: {str(e)}")
         return jsonify({'success': False, 'error': str(e)}), 500
 
 
+@bp.route('/admin/calendar_cache_stats')
+@login_required
+@admin_required
+def admin_calendar_cache_stats():
+    """
+    Calendar response cache hit/miss counters (JSON)
+    """
+    return jsonify({
+        'success': True,
+        'cache': calendar_cache.stats()
+    })
+
+
 # MOVED TO ROLLUPS BLUEPRINT: rollup functionality has been moved to the rollups blueprint
 # - Book rollup: /rollups/book
 # - Manage rollup: /rollups/manage/<id>
@@ -231,66 +384,57 @@ def my_games():
         # Get current date
         today = date.today()
         
-        # Get team assignments for current user (excluding rollups to avoid duplication)
-        assignments = db.session.scalars(
+        # Get all team memberships (games and roll-up invitations) in one query, with
+        # team, booking and organizer loaded alongside so the rows render without lazy loads
+        team_memberships = db.session.scalars(
             sa.select(TeamMember)
             .join(TeamMember.team)
             .join(Team.booking)
-            .where(
-                TeamMember.member_id == current_user.id,
-                Team.booking_id.isnot(None),  # Only teams with bookings
-                Booking.booking_type != 'rollup'  # Exclude rollups from regular assignments
+            .where(TeamMember.member_id == current_user.id)
+            .options(
+                so.contains_eager(TeamMember.team)
+                .contains_eager(Team.booking)
+                .joinedload(Booking.organizer)
             )
             .order_by(Booking.booking_date)
         ).all()
+        assignments = [tm for tm in team_memberships if tm.team.booking.booking_type != 'rollup']
+        roll_up_invitations = [tm for tm in team_memberships if tm.team.booking.booking_type == 'rollup']
         
-        # Get roll-up invitations for current user via team memberships
-        roll_up_invitations = db.session.scalars(
-            sa.select(TeamMember)
+        # Get pool registrations for current user (events they registered interest in),
+        # excluding bookings where they have already been assigned to a team
+        already_assigned = (
+            sa.select(TeamMember.id)
             .join(TeamMember.team)
-            .join(Team.booking)
             .where(
                 TeamMember.member_id == current_user.id,
-                Team.booking_id.isnot(None),  # Only teams with bookings
-                Booking.booking_type == 'rollup'
+                Team.booking_id == Pool.booking_id
+            )
+            .exists()
+        )
+        pool_registrations = db.session.scalars(
+            sa.select(PoolRegistration)
+            .join(PoolRegistration.pool)
+            .join(Pool.booking)
+            .where(
+                PoolRegistration.member_id == current_user.id,
+                PoolRegistration.status == 'registered',
+                ~already_assigned
+            )
+            .options(
+                so.contains_eager(PoolRegistration.pool)
+                .contains_eager(Pool.booking)
+                .joinedload(Booking.organizer),
+                so.contains_eager(PoolRegistration.pool)
+                .selectinload(Pool.registrations)
             )
             .order_by(Booking.booking_date)
         ).all()
         
-        # Get pool registrations for current user (events they registered interest in)
-        # Exclude pool registrations where user has already been assigned to a team for that booking
-        assigned_booking_ids = {assignment.team.booking_id for assignment in assignments}
-        assigned_booking_ids.update({invitation.team.booking_id for invitation in roll_up_invitations})
-        
-        current_app.logger.info(f"User {current_user.id} has team assignments for bookings: {assigned_booking_ids}")
-        
-        # Only show pool registrations for bookings where user is NOT already in a team
-        if assigned_booking_ids:
-            pool_registrations = db.session.scalars(
-                sa.select(PoolRegistration)
-                .join(PoolRegistration.pool)
-                .join(Pool.booking)
-                .where(
-                    PoolRegistration.member_id == current_user.id,
-                    PoolRegistration.status == 'registered',
-                    ~Pool.booking_id.in_(assigned_booking_ids)  # Exclude bookings where user is already assigned to a team
-                )
-                .order_by(Booking.booking_date)
-            ).all()
-        else:
-            # No team assignments, show all pool registrations
-            pool_registrations = db.session.scalars(
-                sa.select(PoolRegistration)
-                .join(PoolRegistration.pool)
-                .join(Pool.booking)
-                .where(
-                    PoolRegistration.member_id == current_user.id,
-                    PoolRegistration.status == 'registered'
-                )
-                .order_by(Booking.booking_date)
-            ).all()
-        
-        current_app.logger.info(f"User {current_user.id} has {len(pool_registrations)} pool registrations after filtering")
+        # Subscription link for the member's calendar feed, once they have asked for one
+        calendar_feed_url = None
+        if current_user.calendar_token:
+            calendar_feed_url = url_for('bookings.member_calendar_feed', token=current_user.calendar_token, _external=True)
         
         # Create CSRF form for POST actions
         csrf_form = FlaskForm()
@@ -300,6 +444,7 @@ def my_games():
                              roll_up_invitations=roll_up_invitations,
                              pool_registrations=pool_registrations,
                              today=today,
+                             calendar_feed_url=calendar_feed_url,
                              csrf_form=csrf_form)
                              
     except Exception as e:
@@ -310,9 +455,89 @@ def my_games():
                              roll_up_invitations=[],
                              pool_registrations=[],
                              today=date.today(),
+                             calendar_feed_url=None,
                              csrf_form=FlaskForm())
 
 
+@bp.route('/calendar/<token>.ics')
+def member_calendar_feed(token):
+    """
+    Serve a member's games as an iCalendar feed.
+    
+    No login is needed: calendar apps poll this URL and the secret token identifies
+    the member. The stored feed body is served unless a change to the member's games
+    has invalidated it.
+    """
+    from app.bookings.ical import get_member_calendar
+    
+    member = db.session.scalar(sa.select(Member).where(Member.calendar_token == token))
+    if member is None or member.lockout:
+        abort(404)
+    
+    feed = get_member_calendar(member.id)
+    etag = f"ical-{member.id}-{feed.generated_at.strftime('%Y%m%d%H%M%S%f')}"
+    not_modified = not_modified_response(etag)
+    if not_modified:
+        return not_modified
+    
+    response = current_app.response_class(feed.body, mimetype='text/calendar')
+    response.headers['Content-Disposition'] = 'inline; filename="my-games.ics"'
+    return with_etag(response, etag)
+
+
+@bp.route('/calendar/link', methods=['POST'])
+@login_required
+def create_calendar_feed():
+    """
+    Issue the member's calendar feed token so My Games can show their subscription link.
+    """
+    from app.bookings.ical import get_or_create_calendar_token
+    
+    form = FlaskForm()
+    if not form.validate_on_submit():
+        flash('Security validation failed. Please try again.', 'error')
+        return redirect(url_for('bookings.my_games'))
+    
+    try:
+        if not current_user.calendar_token:
+            get_or_create_calendar_token(current_user)
+            db.session.commit()
+            audit_log_security_event('CALENDAR_TOKEN_CREATED', f'Calendar feed link created by {current_user.username}')
+        flash('Your calendar link is ready. Add it to your calendar app as a subscription.', 'success')
+    except Exception as e:
+        db.session.rollback()
+        current_app.logger.error(f"Error creating calendar token: {str(e)}")
+        flash('An error occurred while creating your calendar link.', 'error')
+    
+    return redirect(url_for('bookings.my_games'))
+
+
+@bp.route('/calendar/reset', methods=['POST'])
+@login_required
+def reset_calendar_feed():
+    """
+    Issue a new calendar feed token so the old subscription URL stops working.
+    """
+    from app.bookings.ical import reset_calendar_token
+    
+    form = FlaskForm()
+    if not form.validate_on_submit():
+        flash('Security validation failed. Please try again.', 'error')
+        return redirect(url_for('bookings.my_games'))
+    
+    try:
+        reset_calendar_token(current_user)
+        db.session.commit()
+        audit_log_security_event('CALENDAR_TOKEN_RESET', f'Calendar feed link reset by {current_user.username}')
+        flash('Your calendar link has been reset. Update your calendar subscription with the new link.', 'success')
+    except Exception as e:
+        db.session.rollback()
+        current_app.logger.error(f"Error resetting calendar token: {str(e)}")
+        flash('An error occurred while resetting your calendar link.', 'error')
+    
+    return redirect(url_for('bookings.my_games'))
+
+
 # DELETED: admin_copy_teams_to_booking - EventTeam functionality has been removed
 # Teams are now managed independently in the teams blueprint
 
@@ -330,6 +555,12 @@ def api_get_booking(booking_id):
     Get booking details (AJAX endpoint)
     """
     try:
+        # Answer conditional requests from the change-version stamp alone
+        etag = bookings_etag()
+        not_modified = not_modified_response(etag)
+        if not_modified:
+            return not_modified
+        
         booking = db.session.get(Booking, booking_id)
         if not booking:
             return jsonify({
@@ -396,10 +627,10 @@ def api_get_booking(booking_id):
             
             booking_data['players'] = players
         
-        return jsonify({
+        return with_etag(jsonify({
             'success': True,
             'booking': booking_data
-        })
+        }), etag)
         
     except Exception as e:
         current_app.logger.error(f"Error getting booking {booking_id}: {str(e)}")
@@ -535,6 +766,73 @@ def api_delete_booking(booking_id):
         }), 500
 
 
+# Largest batch of slots the availability API will check in one request
+MAX_AVAILABILITY_SLOTS = 200
+
+
+@bp.route('/api/v1/availability', methods=['POST'])
+@login_required
+@role_required('Event Manager')
+def api_check_availability():
+    """
+    Check rink availability for a batch of slots via API
+    
+    Expects JSON {"slots": [{"date": "YYYY-MM-DD", "session": 1, "rinks": 2,
+    "home_away": "home"}, ...]} and answers every slot from one occupancy query.
+    """
+    try:
+        from app.bookings.occupancy import check_slot_availability
+        
+        data = request.get_json(silent=True) or {}
+        raw_slots = data.get('slots')
+        if not isinstance(raw_slots, list) or not raw_slots:
+            return jsonify({
+                'success': False,
+                'error': 'No slots provided'
+            }), 400
+        
+        if len(raw_slots) > MAX_AVAILABILITY_SLOTS:
+            return jsonify({
+                'success': False,
+                'error': f'Cannot check more than {MAX_AVAILABILITY_SLOTS} slots at once'
+            }), 400
+        
+        sessions = current_app.config.get('DAILY_SESSIONS', {})
+        slots = []
+        for index, raw in enumerate(raw_slots):
+            try:
+                slot_date = datetime.strptime(str(raw['date']), '%Y-%m-%d').date()
+                slot_session = int(raw['session'])
+                rinks = int(raw.get('rinks', 1))
+            except (KeyError, TypeError, ValueError):
+                return jsonify({
+                    'success': False,
+                    'error': f'Invalid slot at position {index}'
+                }), 400
+            if slot_session not in sessions or rinks < 1:
+                return jsonify({
+                    'success': False,
+                    'error': f'Invalid slot at position {index}'
+                }), 400
+            slots.append((slot_date, slot_session, rinks, raw.get('home_away')))
+        
+        results = check_slot_availability(slots, current_app.config.get('RINKS', 6))
+        
+        return jsonify({
+            'success': True,
+            'all_available': all(result['ok'] for result in results),
+            'slots': results,
+            'conflicts': [index for index, result in enumerate(results) if not result['ok']]
+        })
+        
+    except Exception as e:
+        current_app.logger.error(f"Error checking availability: {str(e)}")
+        return jsonify({
+            'success': False,
+            'error': str(e)
+        }), 500
+
+
 # Admin team management routes (migrated from admin blueprint)
 
 @bp.route('/admin/manage_teams/<int:booking_id>', methods=['GET', 'POST'])
@@ -1040,64 +1338,53 @@ def admin_manage_teams(booking_id):
 @role_required('Event Manager')
 def admin_list_bookings():
     """
-    List all bookings for Event Manager management (replaces events.list_events)
+    List bookings for Event Manager management (replaces events.list_events)
+    
+    Shows one page of bookings in a date window, by default from
+    ADMIN_BOOKINGS_PAST_DAYS ago onwards.
     """
     try:
+        from flask_paginate import Pagination
+        from app.bookings.utils import get_booking_list_stats
+        
         # Get filter parameters
         event_type_filter = request.args.get('type', type=int)
-        
-        # Get all bookings (events are now bookings) - closest events first
-        query = sa.select(Booking).order_by(Booking.booking_date.asc())
-        
+        try:
+            default_from = date.today() - timedelta(days=current_app.config.get('ADMIN_BOOKINGS_PAST_DAYS', 30))
+            date_from = date.fromisoformat(request.args['from']) if request.args.get('from') else default_from
+            date_to = date.fromisoformat(request.args['to']) if request.args.get('to') else None
+        except ValueError:
+            flash('Invalid date range. Showing the default window.', 'warning')
+            date_from, date_to = default_from, None
+        per_page = current_app.config.get('ADMIN_BOOKINGS_PER_PAGE', 50)
+        page = max(request.args.get('page', 1, type=int), 1)
+        
+        # Bookings in the window (events are now bookings) - closest events first
+        filters = [Booking.booking_date >= date_from]
+        if date_to:
+            filters.append(Booking.booking_date <= date_to)
         if event_type_filter:
-            query = query.where(Booking.event_type == event_type_filter)
+            filters.append(Booking.event_type == event_type_filter)
         
-        bookings = db.session.scalars(query).all()
+        total = db.session.scalar(sa.select(sa.func.count(Booking.id)).where(*filters))
+        bookings = db.session.scalars(
+            sa.select(Booking)
+            .where(*filters)
+            .order_by(Booking.booking_date.asc(), Booking.session.asc(), Booking.id.asc())
+            .offset((page - 1) * per_page)
+            .limit(per_page)
+        ).all()
         
         # Get event type options for filter
         event_types = current_app.config.get('EVENT_TYPES', {})
         
-        # Calculate statistics for each booking
-        booking_stats = {}
-        for booking in bookings:
-            try:
-                # Safely calculate team count
-                try:
-                    total_teams = len(booking.teams) if hasattr(booking, 'teams') and booking.teams else 0
-                except:
-                    total_teams = 0
-                
-                # Check for effective pool (own or shared)
-                effective_pool = booking.get_effective_pool()
-                has_own_pool = booking.pool is not None
-                has_shared_pool = effective_pool is not None and not has_own_pool
-                
-                # Safely calculate pool statistics using effective pool
-                try:
-                    pool_members = len(effective_pool.registrations) if effective_pool and hasattr(effective_pool, 'registrations') else 0
-                except:
-                    pool_members = 0
-                
-                booking_stats[booking.id] = {
-                    'total_teams': total_teams,
-                    'has_pool': effective_pool is not None,
-                    'has_own_pool': has_own_pool,
-                    'has_shared_pool': has_shared_pool,
-                    'pool_members': pool_members,
-                    'pool_selected': 0,  # Simplified for now
-                    'pool_available': pool_members,
-                }
-            except Exception as stats_error:
-                current_app.logger.error(f"Error calculating stats for booking {booking.id}: {str(stats_error)}")
-                booking_stats[booking.id] = {
-                    'total_teams': 0,
-                    'has_pool': False,
-                    'has_own_pool': False,
-                    'has_shared_pool': False,
-                    'pool_members': 0,
-                    'pool_selected': 0,
-                    'pool_available': 0,
-                }
+        # Team and pool statistics for the page in one grouped query
+        booking_stats = get_booking_list_stats(bookings)
+        
+        pagination = None
+        if total > per_page:
+            pagination = Pagination(page=page, total=total, per_page=per_page,
+                                    css_framework='bulma', record_name='events')
         
         # Group bookings by type and series
         regular_bookings = []
@@ -1120,7 +1407,10 @@ def admin_list_bookings():
                              rollup_bookings=rollup_bookings,
                              booking_stats=booking_stats,
                              event_types=event_types,
-                             current_filter=event_type_filter)
+                             current_filter=event_type_filter,
+                             date_from=date_from,
+                             date_to=date_to,
+                             pagination=pagination)
         
     except Exception as e:
         current_app.logger.error(f"Error in admin list bookings: {str(e)}")
@@ -1153,6 +1443,13 @@ def admin_create_booking():
                 has_pool=form.has_pool.data,
             )
             
+            try:
+                reserve_rinks([(booking.booking_date, booking.session, booking.rink_count, booking.home_away)])
+            except RinkCapacityError as e:
+                db.session.rollback()
+                flash(str(e), 'error')
+                return render_template('admin_create_booking.html', form=form)
+            
             db.session.add(booking)
             db.session.flush()  # Get booking ID
             
@@ -1241,34 +1538,22 @@ def admin_manage_booking(booking_id):
         # Create consolidated form with current booking data
         form = BookingManagementForm()
         
-        # Populate existing series dropdown
-        existing_series_query = db.session.scalars(
-            sa.select(Booking)
-            .where(Booking.series_id.isnot(None))
-            .where(Booking.series_id != booking.series_id)  # Exclude current booking's series
-        ).all()
-        
-        series_choices = [('', 'Select a series...')]
-        existing_series_names = {}
-        
-        for series_booking in existing_series_query:
-            if series_booking.series_id not in existing_series_names:
-                series_name = series_booking.get_series_name()
-                existing_series_names[series_booking.series_id] = series_name
-                series_choices.append((series_booking.series_id, series_name))
-        
-        form.existing_series.choices = series_choices
-        
-        # Debug: Log what series were found
-        current_app.logger.info(f"Populating series dropdown for booking {booking_id}")
-        current_app.logger.info(f"Found {len(series_choices)-1} existing series: {series_choices}")
-        if len(series_choices) == 1:
-            current_app.logger.info("No existing series found - dropdown will only show 'Select a series...'")
-        
-        # Debug: Log current booking's series status
-        current_app.logger.info(f"Current booking series_id: {booking.series_id}")
+        # Populate existing series dropdown from the series table, excluding the current series
+        primary = so.aliased(Booking)
+        series_query = (
+            sa.select(Series.id, Series.name, primary.name)
+            .outerjoin(primary, primary.id == Series.primary_booking_id)
+            .order_by(Series.name, Series.id)
+        )
         if booking.series_id:
-            current_app.logger.info(f"Current booking series name: {booking.get_series_name()}")
+            series_query = series_query.where(Series.id != booking.series_id)
+        form.existing_series.choices = [('', 'Select a series...')] + [
+            (series_id, series_name or f"{primary_name} (Series)")
+            for series_id, series_name, primary_name in db.session.execute(series_query).all()
+        ]
+        current_app.logger.debug(
+            f"Series dropdown for booking {booking_id}: {len(form.existing_series.choices) - 1} existing series"
+        )
         
         # Get series context
         is_primary = is_primary_booking_in_series(booking)
@@ -1304,10 +1589,10 @@ def admin_manage_booking(booking_id):
         if request.method == 'POST':
             # Check if this is a duplicate action from the modal
             action = request.form.get('action')
-            current_app.logger.info(f"POST request for booking {booking_id} with action: '{action}'")
-            current_app.logger.info(f"All form data keys: {list(request.form.keys())}")
+            current_app.logger.debug(f"POST request for booking {booking_id} with action: '{action}'")
+            current_app.logger.debug(f"All form data keys: {list(request.form.keys())}")
             for key, value in request.form.items():
-                current_app.logger.info(f"  {key}: '{value}'")
+                current_app.logger.debug(f"  {key}: '{value}'")
             
             if action == 'toggle_pool':
                 # Handle pool toggle - much simpler logic
@@ -1387,7 +1672,7 @@ def admin_manage_booking(booking_id):
 
             elif action == 'save_booking':
                 # Handle regular booking form save
-                current_app.logger.info(f"Processing save_booking action for booking {booking_id}")
+                current_app.logger.debug(f"Processing save_booking action for booking {booking_id}")
                 
                 # Process the main booking form normally
                 if form.validate_on_submit():
@@ -1422,7 +1707,7 @@ def admin_manage_booking(booking_id):
             elif action == 'save_series':
                 # Handle Series Management tab field updates
                 try:
-                    current_app.logger.info(f"Processing save_series action for booking {booking_id}")
+                    current_app.logger.debug(f"Processing save_series action for booking {booking_id}")
                     
                     # Simple CSRF validation for the series management form
                     from flask_wtf import FlaskForm
@@ -1563,7 +1848,9 @@ def admin_manage_booking(booking_id):
                         series_id=booking.series_id if hasattr(booking, 'series_id') and booking.series_id else None
                     )
                     
-                    # Add to database and commit
+                    # Hold the slot while checking capacity, then add and commit
+                    reserve_rinks([(duplicate_booking.booking_date, duplicate_booking.session,
+                                    duplicate_booking.rink_count, duplicate_booking.home_away)])
                     db.session.add(duplicate_booking)
                     db.session.commit()
                     
@@ -1590,6 +1877,9 @@ def admin_manage_booking(booking_id):
                     flash(f'Successfully created duplicate event for {duplicate_date}!', 'success')
                     return redirect(url_for('bookings.admin_manage_booking', booking_id=duplicate_booking.id))
                         
+                except RinkCapacityError as e:
+                    db.session.rollback()
+                    flash(str(e), 'error')
                 except Exception as e:
                     current_app.logger.error(f"Error creating duplicate booking: {str(e)}")
                     flash('An error occurred while creating the duplicate event.', 'error')
@@ -1602,26 +1892,83 @@ def admin_manage_booking(booking_id):
                                      is_primary_booking=is_primary,
                                      effective_organizer=effective_organizer,
                                      primary_booking=primary_booking)
+            
+            elif action == 'repeat':
+                # Handle modal-based recurrence: weekly/fortnightly copies up to an end date
+                try:
+                    from datetime import datetime
+                    from app.bookings.utils import expand_recurrence, create_recurring_bookings
+                    
+                    interval_days = request.form.get('repeat_interval', type=int)
+                    repeat_session = request.form.get('repeat_session', type=int) or booking.session
+                    try:
+                        repeat_until = datetime.strptime(request.form.get('repeat_until', ''), '%Y-%m-%d').date()
+                        skip_dates = [
+                            datetime.strptime(value.strip(), '%Y-%m-%d').date()
+                            for value in request.form.get('repeat_skip_dates', '').replace('\n', ',').split(',')
+                            if value.strip()
+                        ]
+                    except ValueError:
+                        flash('Please enter dates as YYYY-MM-DD.', 'error')
+                        return redirect(url_for('bookings.admin_manage_booking', booking_id=booking_id))
+                    
+                    if interval_days not in current_app.config.get('BOOKING_RECURRENCE_INTERVALS', {}).values():
+                        flash('Please choose how often the booking repeats.', 'error')
+                        return redirect(url_for('bookings.admin_manage_booking', booking_id=booking_id))
+                    
+                    # The booking itself is the first occurrence
+                    dates = expand_recurrence(booking.booking_date + timedelta(days=interval_days),
+                                              repeat_until, interval_days, skip_dates)
+                    max_occurrences = current_app.config.get('BOOKING_RECURRENCE_MAX_OCCURRENCES', 60)
+                    if not dates:
+                        flash('No dates fall between this booking and the end date.', 'error')
+                        return redirect(url_for('bookings.admin_manage_booking', booking_id=booking_id))
+                    if len(dates) > max_occurrences:
+                        flash(f'A repeat can create at most {max_occurrences} bookings.', 'error')
+                        return redirect(url_for('bookings.admin_manage_booking', booking_id=booking_id))
+                    
+                    result = create_recurring_bookings(booking, dates, repeat_session)
+                    if result['conflicts']:
+                        db.session.rollback()
+                        conflict_dates = ', '.join(conflict['date'] for conflict in result['conflicts'])
+                        flash(f'Not enough rinks available on: {conflict_dates}. No bookings were created.', 'error')
+                        return redirect(url_for('bookings.admin_manage_booking', booking_id=booking_id))
+                    
+                    db.session.commit()
+                    
+                    audit_log_bulk_operation('BULK_CREATE', 'Booking', result['created'],
+                                           f'Repeated booking {booking.id} ({booking.name}) every {interval_days} days '
+                                           f'from {result["dates"][0]} to {result["dates"][-1]} in series '
+                                           f'{result["series_id"]}: bookings {result["booking_ids"]}')
+                    
+                    flash(f'Created {result["created"]} repeat bookings for "{booking.name}".', 'success')
+                    return redirect(url_for('bookings.admin_manage_booking', booking_id=booking_id))
+                
+                except Exception as e:
+                    db.session.rollback()
+                    current_app.logger.error(f"Error repeating booking {booking_id}: {str(e)}")
+                    flash('An error occurred while creating the repeat bookings.', 'error')
+                    return redirect(url_for('bookings.admin_manage_booking', booking_id=booking_id))
                     
             # Debug: Log form submission details
-            current_app.logger.info(f"POST request received for booking {booking_id}")
-            current_app.logger.info(f"Form data - duplicate: {form.duplicate.data}")
-            current_app.logger.info(f"Form data - submit: {form.submit.data}")
-            current_app.logger.info(f"Form data - existing_series: '{form.existing_series.data}'")
-            current_app.logger.info(f"Form data - series_id: '{form.series_id.data}'")
-            current_app.logger.info(f"Form data - series_action: '{form.series_action.data}'")
-            current_app.logger.info(f"Form data - series_name: '{form.series_name.data}'")
-            current_app.logger.info(f"Form data - organizer_id: '{form.organizer_id.data}'")
-            current_app.logger.info(f"Form data - has_pool: {form.has_pool.data}")
-            current_app.logger.info(f"Current booking series_name in DB: '{booking.series_name}'")
-            current_app.logger.info(f"Current booking organizer_id in DB: '{booking.organizer_id}'")
-            current_app.logger.info(f"Is primary booking: {is_primary}")
-            current_app.logger.info(f"Action from request: '{request.form.get('action')}'")
+            current_app.logger.debug(f"POST request received for booking {booking_id}")
+            current_app.logger.debug(f"Form data - duplicate: {form.duplicate.data}")
+            current_app.logger.debug(f"Form data - submit: {form.submit.data}")
+            current_app.logger.debug(f"Form data - existing_series: '{form.existing_series.data}'")
+            current_app.logger.debug(f"Form data - series_id: '{form.series_id.data}'")
+            current_app.logger.debug(f"Form data - series_action: '{form.series_action.data}'")
+            current_app.logger.debug(f"Form data - series_name: '{form.series_name.data}'")
+            current_app.logger.debug(f"Form data - organizer_id: '{form.organizer_id.data}'")
+            current_app.logger.debug(f"Form data - has_pool: {form.has_pool.data}")
+            current_app.logger.debug(f"Current booking series_name in DB: '{booking.series_name}'")
+            current_app.logger.debug(f"Current booking organizer_id in DB: '{booking.organizer_id}'")
+            current_app.logger.debug(f"Is primary booking: {is_primary}")
+            current_app.logger.debug(f"Action from request: '{request.form.get('action')}'")
             
             # Log raw form data
-            current_app.logger.info(f"Raw form data keys: {list(request.form.keys())}")
+            current_app.logger.debug(f"Raw form data keys: {list(request.form.keys())}")
             for key, value in request.form.items():
-                current_app.logger.info(f"  {key}: '{value}'")
+                current_app.logger.debug(f"  {key}: '{value}'")
             
             if not form.validate_on_submit():
                 current_app.logger.warning(f"Form validation failed: {form.errors}")
@@ -1629,12 +1976,12 @@ def admin_manage_booking(booking_id):
             
             if form.validate_on_submit():
                 # Check which button was clicked
-                current_app.logger.info("Form validation passed - checking which button was clicked")
+                current_app.logger.debug("Form validation passed - checking which button was clicked")
                 try:
-                    current_app.logger.info(f"About to check form.duplicate.data: {form.duplicate.data}")
+                    current_app.logger.debug(f"About to check form.duplicate.data: {form.duplicate.data}")
                     if form.duplicate.data:
                         # Handle duplication/series creation
-                        current_app.logger.info("Handling duplication")
+                        current_app.logger.debug("Handling duplication")
                         duplicate_booking = create_booking_with_defaults(
                             name=form.name.data,
                             event_type=form.event_type.data,
@@ -1654,6 +2001,8 @@ def admin_manage_booking(booking_id):
                         # Preserve series relationship for duplicates
                         # The series_id is already copied from the original booking
                         
+                        reserve_rinks([(duplicate_booking.booking_date, duplicate_booking.session,
+                                        duplicate_booking.rink_count, duplicate_booking.home_away)])
                         db.session.add(duplicate_booking)
                         db.session.commit()
                         
@@ -1681,6 +2030,9 @@ def admin_manage_booking(booking_id):
                         flash(f'Event duplicated successfully! New event created for {duplicate_booking.booking_date}', 'success')
                         return redirect(url_for('bookings.admin_manage_booking', booking_id=duplicate_booking.id))
                 
+                except RinkCapacityError as e:
+                    db.session.rollback()
+                    flash(str(e), 'error')
                 except Exception as e:
                     current_app.logger.error(f"Error in duplication handling: {str(e)}")
                     db.session.rollback()
@@ -1688,7 +2040,7 @@ def admin_manage_booking(booking_id):
                     
                 else:
                     # Handle regular update
-                    current_app.logger.info("Handling regular update (not duplicate)")
+                    current_app.logger.debug("Handling regular update (not duplicate)")
                     changes = {}
                 
                     # Track all changes
@@ -1733,9 +2085,9 @@ def admin_manage_booking(booking_id):
                         booking.home_away = form.home_away.data
                     
                     # Handle organizer assignment changes (only for primary bookings or non-series bookings)
-                    current_app.logger.info(f"Checking organizer changes: is_primary={is_primary}, series_id={booking.series_id}, form.organizer_id.data={form.organizer_id.data}, booking.organizer_id={booking.organizer_id}")
+                    current_app.logger.debug(f"Checking organizer changes: is_primary={is_primary}, series_id={booking.series_id}, form.organizer_id.data={form.organizer_id.data}, booking.organizer_id={booking.organizer_id}")
                     if (is_primary or not booking.series_id) and form.organizer_id.data is not None and booking.organizer_id != form.organizer_id.data:
-                        current_app.logger.info("EXECUTING organizer change logic")
+                        current_app.logger.debug("EXECUTING organizer change logic")
                         old_organizer_id = booking.organizer_id
                         old_organizer_name = f"Member {old_organizer_id}" if old_organizer_id else "None"
                         if old_organizer_id:
@@ -1752,28 +2104,28 @@ def admin_manage_booking(booking_id):
                         series_context = f" (affects entire series {booking.series_id})" if booking.series_id else ""
                         current_app.logger.info(f"Changed organizer for booking {booking.id} from {old_organizer_name} to {new_organizer_name}{series_context}")
                     else:
-                        current_app.logger.info("SKIPPING organizer change logic")
+                        current_app.logger.debug("SKIPPING organizer change logic")
                     
                     # Handle series name changes (only for primary bookings)
-                    current_app.logger.info(f"Checking series name changes: series_id={booking.series_id}, is_primary={is_primary}, form.series_name.data='{form.series_name.data}', booking.series_name='{booking.series_name}'")
+                    current_app.logger.debug(f"Checking series name changes: series_id={booking.series_id}, is_primary={is_primary}, form.series_name.data='{form.series_name.data}', booking.series_name='{booking.series_name}'")
                     if booking.series_id and is_primary:
-                        current_app.logger.info("EXECUTING series name change logic")
+                        current_app.logger.debug("EXECUTING series name change logic")
                         new_series_name = form.series_name.data.strip() if form.series_name.data else None
-                        current_app.logger.info(f"Comparing: new='{new_series_name}' vs current='{booking.series_name}'")
+                        current_app.logger.debug(f"Comparing: new='{new_series_name}' vs current='{booking.series_name}'")
                         if new_series_name != booking.series_name:
-                            current_app.logger.info("UPDATING series name in database")
+                            current_app.logger.debug("UPDATING series name in database")
                             old_series_name = booking.series_name or "(No name set)"
                             booking.series_name = new_series_name
                             changes['series_name'] = {'old': old_series_name, 'new': new_series_name or "(Cleared)"}
                             current_app.logger.info(f"Updated series name from '{old_series_name}' to '{new_series_name or '(Cleared)'}' for primary booking {booking.id}")
                         else:
-                            current_app.logger.info("Series name unchanged")
+                            current_app.logger.debug("Series name unchanged")
                     else:
-                        current_app.logger.info("SKIPPING series name change logic")
+                        current_app.logger.debug("SKIPPING series name change logic")
                     
                     # Handle series changes based on action selection
                     series_action = form.series_action.data
-                    current_app.logger.info(f"Processing series action: {series_action}")
+                    current_app.logger.debug(f"Processing series action: {series_action}")
                     
                     if series_action == 'remove_series':
                         # Remove from any series
@@ -1805,9 +2157,9 @@ def admin_manage_booking(booking_id):
                         # Do nothing - keep current series configuration
                         current_app.logger.info(f"No change requested for series configuration of booking {booking.id}")
                     
-                    current_app.logger.info("ABOUT TO COMMIT TO DATABASE")
+                    current_app.logger.debug("ABOUT TO COMMIT TO DATABASE")
                     db.session.commit()
-                    current_app.logger.info("DATABASE COMMIT COMPLETED")
+                    current_app.logger.debug("DATABASE COMMIT COMPLETED")
                     
                     # Audit log changes
                     if changes:
@@ -1901,48 +2253,13 @@ def league_list():
     List all league series with status overview
     """
     try:
-        # Get all league bookings grouped by series
-        league_bookings = db.session.scalars(
-            sa.select(Booking)
-            .where(Booking.series_id.isnot(None))
-            .order_by(Booking.series_id, Booking.booking_date)
-        ).all()
+        from app.bookings.utils import get_series_summaries
         
-        # Group by series
-        series_groups = {}
-        for booking in league_bookings:
-            if booking.series_id not in series_groups:
-                series_groups[booking.series_id] = {
-                    'series_id': booking.series_id,
-                    'series_name': booking.get_series_name(),
-                    'bookings': [],
-                    'total_games': 0,
-                    'completed_games': 0,
-                    'next_game': None,
-                    'primary_booking': None
-                }
-            
-            series_groups[booking.series_id]['bookings'].append(booking)
-            series_groups[booking.series_id]['total_games'] += 1
-            
-            # Set primary booking (first in series)
-            if not series_groups[booking.series_id]['primary_booking']:
-                series_groups[booking.series_id]['primary_booking'] = booking
-            
-            # Check if completed (has teams assigned)
-            if booking.teams:
-                series_groups[booking.series_id]['completed_games'] += 1
-        
-        # After processing all bookings, find the next game for each series
-        today = date.today()
-        for series_data in series_groups.values():
-            # Find the earliest upcoming game
-            future_games = [b for b in series_data['bookings'] if b.booking_date >= today]
-            if future_games:
-                series_data['next_game'] = min(future_games, key=lambda x: x.booking_date)
+        # One aggregate row per series: games, games with teams, next date, pool size
+        series_groups = get_series_summaries()
         
         return render_template('league_list.html', 
-                             series_groups=series_groups.values())
+                             series_groups=series_groups)
     
     except Exception as e:
         current_app.logger.error(f"Error in league_list: {str(e)}")
@@ -1993,7 +2310,7 @@ def league_schedule():
     try:
         from flask import session
         from app.bookings.forms import LeagueScheduleForm
-        from app.bookings.utils import create_booking_with_defaults
+        from app.bookings.utils import booking_values_with_defaults
         import uuid
         
         # Check if we have league details from step 1
@@ -2003,6 +2320,7 @@ def league_schedule():
         
         league_details = session['league_details']
         form = LeagueScheduleForm()
+        form.rink_count = league_details['rink_count']
         
         # Handle adding rows
         if form.add_row.data:
@@ -2017,11 +2335,11 @@ def league_schedule():
             # Generate unique series ID
             series_id = str(uuid.uuid4())[:8]
             
-            # Create bookings for all scheduled games
-            bookings_created = []
+            # Build every fixture up front; capacity was checked for the whole schedule during validation
+            fixtures = []
             for i, game_data in enumerate(form.games.data):
                 if game_data['date']:  # Only create if date is provided
-                    booking = create_booking_with_defaults(
+                    fixtures.append(booking_values_with_defaults(
                         name=f"{league_details['league_name']} - Round {i+1}",
                         booking_date=game_data['date'],
                         session=game_data['session'],
@@ -2033,46 +2351,49 @@ def league_schedule():
                         scoring=league_details['scoring'],
                         vs=game_data.get('opponent', ''),
                         home_away=game_data.get('venue', 'home'),
-                        has_pool=(i == 0),  # Only first booking gets pool
+                        has_pool=not fixtures,  # Only first booking gets pool
                         series_commitment_required=True
-                    )
-                    
-                    # Set series name only on the first (primary) booking
-                    if i == 0:
-                        booking.series_name = league_details['league_name']
-                    
-                    db.session.add(booking)
-                    bookings_created.append(booking)
+                    ))
             
-            if bookings_created:
-                db.session.commit()
-                
-                # Refresh bookings to ensure they have the latest data
-                for booking in bookings_created:
-                    db.session.refresh(booking)
+            if fixtures:
+                # Re-check every fixture under the slot locks so a concurrent booking cannot slip in
+                try:
+                    reserve_rinks([(f['booking_date'], f['session'], f['rink_count'], f['home_away']) for f in fixtures])
+                except RinkCapacityError as e:
+                    db.session.rollback()
+                    flash(str(e), 'error')
+                    return render_template('league_schedule.html', 
+                                         form=form, 
+                                         league_details=league_details,
+                                         sessions=current_app.config.get('DAILY_SESSIONS', {}))
                 
-                # Debug: Log series IDs to verify they're the same
-                current_app.logger.info(f"League created with series_id: {series_id}")
-                for i, booking in enumerate(bookings_created):
-                    current_app.logger.info(f"Booking {i+1}: {booking.name}, series_id: {booking.series_id}")
+                # Primary booking carries the series name and the pool
+                first_booking = Booking(**fixtures[0], series_name=league_details['league_name'])
+                db.session.add(first_booking)
+                db.session.flush()
                 
-                # Create pool for the first booking (has_pool=True)
                 from app.pools.utils import create_pool_for_booking
-                first_booking = bookings_created[0]
-                if first_booking.has_pool:
-                    pool = create_pool_for_booking(first_booking, is_open=True)
-                    db.session.add(pool)
-                    db.session.commit()
-                    first_booking.pool = pool
+                first_booking.pool = create_pool_for_booking(first_booking, is_open=True)
+                
+                # Remaining fixtures in one executemany, all in a single transaction
+                if len(fixtures) > 1:
+                    db.session.execute(sa.insert(Booking), fixtures[1:])
+                
+                from app.audit_events import label_audit_batch
+                description = f'Created league: {league_details["league_name"]} with {len(fixtures)} games'
+                batched = label_audit_batch(db.session, description)
+                db.session.commit()
                 
-                # Audit log bulk operation
-                audit_log_bulk_operation('LEAGUE_CREATE', 'Booking', len(bookings_created),
-                                       f'Created league: {league_details["league_name"]} with {len(bookings_created)} games')
+                current_app.logger.info(f"League created with series_id: {series_id} ({len(fixtures)} games)")
+                
+                # Without session-event auditing, log a summary of the league
+                if not batched:
+                    audit_log_bulk_operation('LEAGUE_CREATE', 'Booking', len(fixtures), description)
                 
                 # Clear session data
                 session.pop('league_details', None)
                 
-                flash(f'League "{league_details["league_name"]}" created with {len(bookings_created)} games!', 'success')
+                flash(f'League "{league_details["league_name"]}" created with {len(fixtures)} games!', 'success')
                 return redirect(url_for('bookings.league_manage', series_id=series_id))
             else:
                 flash('No games were scheduled. Please add at least one game date.', 'error')
@@ -2117,35 +2438,34 @@ def league_manage(series_id):
     League series dashboard and overview
     """
     try:
-        # Get all bookings in this league series
-        bookings = db.session.scalars(
-            sa.select(Booking)
-            .where(Booking.series_id == series_id)
-            .order_by(Booking.booking_date)
-        ).all()
+        from app.bookings.utils import get_series_summaries
         
-        if not bookings:
+        summaries = get_series_summaries(series_id)
+        if not summaries:
             flash('League not found.', 'error')
             return redirect(url_for('bookings.league_list'))
+        summary = summaries[0]
         
-        # Calculate league statistics
-        primary_booking = bookings[0]
-        total_games = len(bookings)
-        completed_games = sum(1 for b in bookings if b.teams)
-        next_game = next((b for b in bookings if b.booking_date >= date.today()), None)
+        # Game rows for this league only, with their teams for the per-game status
+        bookings = db.session.scalars(
+            sa.select(Booking)
+            .where(Booking.series_id == series_id)
+            .options(so.selectinload(Booking.teams))
+            .order_by(Booking.booking_date, Booking.id)
+        ).all()
         
-        # Pool information
-        pool_info = {
-            'has_pool': primary_booking.pool is not None,
-            'pool_members': len(primary_booking.pool.registrations) if primary_booking.pool else 0
-        }
+        next_game = next((b for b in bookings if b.booking_date == summary['next_game_date']), None)
         
         league_stats = {
-            'series_name': primary_booking.get_series_name(),
-            'total_games': total_games,
-            'completed_games': completed_games,
+            'series_name': summary['series_name'],
+            'total_games': summary['total_games'],
+            'completed_games': summary['completed_games'],
             'next_game': next_game,
-            'pool_info': pool_info
+            'pool_info': {
+                'has_pool': summary['pool_id'] is not None,
+                'pool_id': summary['pool_id'],
+                'pool_members': summary['pool_members']
+            }
         }
         
         return render_template('league_manage.html', 
@@ -0,0 +1,219 @@
+"""
+Series table maintenance.
+
+Each distinct Booking.series_id has a booking_series row holding the series name,
+its primary (earliest by date, then id) booking and that booking's organizer and
+pool. A session after_flush hook re-derives the rows for every series touched by a
+flushed Booking or Pool in the same transaction, so helpers such as
+get_primary_booking_in_series resolve a series with one primary-key lookup instead
+of scanning its bookings.
+
+ORM bulk inserts (session.execute(sa.insert(Booking), rows)) are synced by a
+do_orm_execute hook after the statement runs. Bulk UPDATE/DELETE statements bypass
+both hooks; use `flask bookings series-rebuild` after any such maintenance.
+"""
+
+from typing import Iterable, List, Set
+
+import sqlalchemy as sa
+import sqlalchemy.orm as so
+
+from app import db
+from app.bookings.occupancy import bulk_insert_rows
+from app.models import Booking, Pool, Series
+
+
+def _series_ids_of(obj: Booking) -> Set[str]:
+    """Get a booking's current series ID and any it had before this flush."""
+    history = sa.inspect(obj).attrs.series_id.history
+    return {value for value in list(history.deleted) + [obj.series_id] if value}
+
+
+def derive_series_rows(connection, series_ids: Iterable[str]) -> List[dict]:
+    """
+    Work out the booking_series rows for the given series from the bookings table.
+
+    Args:
+        connection: Connection in the current transaction
+        series_ids: Series IDs to derive
+
+    Returns:
+        One dictionary per series that still has bookings (series_id, name,
+        primary_booking_id, organizer_id, pool_id)
+    """
+    series_ids = sorted(set(series_ids))
+    if not series_ids:
+        return []
+
+    ranked = (
+        sa.select(
+            Booking.series_id,
+            Booking.id,
+            Booking.organizer_id,
+            Booking.series_name,
+            sa.func.row_number().over(
+                partition_by=Booking.series_id,
+                order_by=(Booking.booking_date, Booking.id)
+            ).label('position')
+        )
+        .where(Booking.series_id.in_(series_ids))
+        .subquery()
+    )
+    primaries = connection.execute(
+        sa.select(ranked.c.series_id, ranked.c.id, ranked.c.organizer_id, ranked.c.series_name, Pool.id)
+        .outerjoin(Pool, Pool.booking_id == ranked.c.id)
+        .where(ranked.c.position == 1)
+    ).all()
+    # Name stored on any booking, for series whose primary has none
+    names = dict(connection.execute(
+        sa.select(Booking.series_id, sa.func.min(Booking.series_name))
+        .where(Booking.series_id.in_(series_ids), Booking.series_name.isnot(None))
+        .group_by(Booking.series_id)
+    ).all())
+
+    return [
+        {
+            'series_id': series_id,
+            'name': series_name or names.get(series_id),
+            'primary_booking_id': booking_id,
+            'organizer_id': organizer_id,
+            'pool_id': pool_id,
+        }
+        for series_id, booking_id, organizer_id, series_name, pool_id in primaries
+    ]
+
+
+def sync_series(connection, series_ids: Iterable[str]) -> None:
+    """
+    Re-derive the booking_series rows for the given series from the bookings table.
+
+    Args:
+        connection: Connection in the current transaction
+        series_ids: Series IDs to refresh; rows for series with no bookings are deleted
+    """
+    series_ids = sorted(set(series_ids))
+    if not series_ids:
+        return
+    rows = derive_series_rows(connection, series_ids)
+
+    table = Series.__table__
+    existing = set(connection.execute(
+        sa.select(table.c.id).where(table.c.id.in_(series_ids))
+    ).scalars())
+
+    updates = [row for row in rows if row['series_id'] in existing]
+    inserts = [row for row in rows if row['series_id'] not in existing]
+    removed = existing - {row['series_id'] for row in rows}
+
+    if updates:
+        connection.execute(
+            sa.update(table)
+            .where(table.c.id == sa.bindparam('series_id'))
+            .values(name=sa.bindparam('name'),
+                    primary_booking_id=sa.bindparam('primary_booking_id'),
+                    organizer_id=sa.bindparam('organizer_id'),
+                    pool_id=sa.bindparam('pool_id')),
+            updates
+        )
+    if inserts:
+        connection.execute(
+            sa.insert(table),
+            [{'id': row.pop('series_id'), **row} for row in inserts]
+        )
+    if removed:
+        connection.execute(sa.delete(table).where(table.c.id.in_(removed)))
+
+
+def _expire_series(session: so.Session, series_ids: Iterable[str]) -> None:
+    """Expire loaded Series objects so they reload the rows just written."""
+    mapper = sa.inspect(Series)
+    for series_id in series_ids:
+        series = session.identity_map.get(mapper.identity_key_from_primary_key((series_id,)))
+        if series is not None:
+            session.expire(series)
+
+
+@sa.event.listens_for(so.Session, 'after_flush')
+def _maintain_series(session, flush_context):
+    """Keep booking_series in step with Booking and Pool changes in the same transaction."""
+    series_ids = set()
+    pool_booking_ids = set()
+    for obj in list(session.new) + list(session.dirty) + list(session.deleted):
+        if isinstance(obj, Booking):
+            series_ids.update(_series_ids_of(obj))
+        elif isinstance(obj, Pool):
+            history = sa.inspect(obj).attrs.booking_id.history
+            pool_booking_ids.update(value for value in list(history.deleted) + [obj.booking_id] if value)
+
+    connection = session.connection()
+    if pool_booking_ids:
+        series_ids.update(connection.execute(
+            sa.select(Booking.series_id)
+            .where(Booking.id.in_(pool_booking_ids), Booking.series_id.isnot(None))
+        ).scalars())
+
+    if series_ids:
+        sync_series(connection, series_ids)
+        _expire_series(session, series_ids)
+
+
+@sa.event.listens_for(so.Session, 'do_orm_execute')
+def _maintain_series_bulk(orm_execute_state):
+    """
+    Sync the series of bookings added by ORM bulk INSERT, which skips the flush hook.
+
+    Runs the statement itself so the new rows can be ranked. invoke_statement() calls
+    the do_orm_execute listeners registered after this one first, so registration order
+    does not matter.
+    """
+    series_ids = {row.get('series_id') for row in bulk_insert_rows(orm_execute_state, Booking)} - {None}
+    if not series_ids:
+        return None
+
+    result = orm_execute_state.invoke_statement()
+    session = orm_execute_state.session
+    sync_series(session.connection(), series_ids)
+    _expire_series(session, series_ids)
+    return result
+
+
+def verify_series() -> List[str]:
+    """
+    Compare booking_series with the bookings table.
+
+    Returns:
+        Sorted series IDs whose row is missing, stale or orphaned
+    """
+    stored = {
+        series.id: (series.name, series.primary_booking_id, series.organizer_id, series.pool_id)
+        for series in db.session.scalars(sa.select(Series)).all()
+    }
+    series_ids = db.session.scalars(
+        sa.select(Booking.series_id).where(Booking.series_id.isnot(None)).distinct()
+    ).all()
+    expected = {
+        row['series_id']: (row['name'], row['primary_booking_id'], row['organizer_id'], row['pool_id'])
+        for row in derive_series_rows(db.session.connection(), series_ids)
+    }
+
+    return sorted(
+        series_id for series_id in set(stored) | set(expected)
+        if stored.get(series_id) != expected.get(series_id)
+    )
+
+
+def rebuild_series() -> int:
+    """
+    Rebuild booking_series from the bookings table and commit.
+
+    Returns:
+        Number of series written
+    """
+    series_ids = set(db.session.scalars(
+        sa.select(Booking.series_id).where(Booking.series_id.isnot(None)).distinct()
+    ))
+    connection = db.session.connection()
+    connection.execute(sa.delete(Series.__table__))
+    sync_series(connection, series_ids)
+    db.session.commit()
+    return len(series_ids)
@@ -4,9 +4,11 @@ Utilities migrated from main utils.py for booking functionality.
 Includes essential functions moved from events/utils.py during blueprint consolidation.
 """
 
-from typing import Optional, Dict, Any
+from datetime import date, timedelta
+from typing import Optional, Dict, Any, Iterable
 from flask import current_app
 import sqlalchemy as sa
+import sqlalchemy.orm as so
 
 from app import db
 from app.models import Member, Booking
@@ -59,19 +61,17 @@ def can_user_manage_booking(user: Member, booking: Booking) -> bool:
     return booking.organizer_id == user.id if booking.organizer_id else False
 
 
-def create_booking_with_defaults(name: str, **kwargs) -> Booking:
+def booking_values_with_defaults(name: str, **kwargs) -> dict:
     """
-    Create a new booking with sensible defaults.
+    Build the column values for a new booking with sensible defaults.
     
     Args:
         name: Event name
         **kwargs: Additional booking attributes
         
     Returns:
-        New Booking instance (not yet committed to database)
+        Dictionary of booking column values, suitable for Booking(**values) or a bulk insert
     """
-    from datetime import date
-    
     defaults = {
         'booking_type': 'event',  # Default booking type
         'gender': 4,  # Open gender by default
@@ -88,7 +88,21 @@ def create_booking_with_defaults(name: str, **kwargs) -> Booking:
     booking_data = {**defaults, **kwargs}
     booking_data['name'] = name
     
-    return Booking(**booking_data)
+    return booking_data
+
+
+def create_booking_with_defaults(name: str, **kwargs) -> Booking:
+    """
+    Create a new booking with sensible defaults.
+    
+    Args:
+        name: Event name
+        **kwargs: Additional booking attributes
+        
+    Returns:
+        New Booking instance (not yet committed to database)
+    """
+    return Booking(**booking_values_with_defaults(name, **kwargs))
 
 
 
@@ -166,6 +180,170 @@ def get_bookings_by_type(booking_type: Optional[str] = None) -> list[Booking]:
     return db.session.scalars(query).all()
 
 
+def get_upcoming_pool_events(member: Member, start_date: date, end_date: date,
+                             page: int = 1, per_page: int = 25,
+                             exclude_assigned: bool = False,
+                             load_managers: bool = False) -> Dict[str, Any]:
+    """
+    Get one page of bookings with a registration pool, with the member's status for each.
+
+    Registration counts come from a grouped subquery and the member's own registration
+    from a LEFT JOIN, so the page costs one count and one select however many
+    registrations exist.
+
+    Args:
+        member: Member viewing the events
+        start_date: First booking date to include
+        end_date: Last booking date to include
+        page: 1-based page number
+        per_page: Events per page
+        exclude_assigned: Leave out bookings the member is already in a team for
+        load_managers: Also load each booking's managers (one extra statement)
+
+    Returns:
+        Dictionary with 'events' (list of dicts with booking, pool_open, pool_count,
+        registration and user_can_manage) and 'total' (events across all pages)
+    """
+    from app.models import Pool, PoolRegistration, Team, TeamMember, booking_member_managers
+
+    registration_counts = (
+        sa.select(PoolRegistration.pool_id, sa.func.count(PoolRegistration.id).label('pool_count'))
+        .group_by(PoolRegistration.pool_id)
+        .subquery()
+    )
+    own_registration = so.aliased(PoolRegistration)
+    is_manager = (
+        sa.select(booking_member_managers.c.booking_id)
+        .where(
+            booking_member_managers.c.booking_id == Booking.id,
+            booking_member_managers.c.member_id == member.id
+        )
+        .exists()
+    )
+
+    filters = [Booking.booking_date >= start_date, Booking.booking_date <= end_date]
+    if exclude_assigned:
+        filters.append(~(
+            sa.select(TeamMember.id)
+            .join(TeamMember.team)
+            .where(TeamMember.member_id == member.id, Team.booking_id == Booking.id)
+            .exists()
+        ))
+
+    total = db.session.scalar(
+        sa.select(sa.func.count(Booking.id))
+        .join(Pool, Pool.booking_id == Booking.id)
+        .where(*filters)
+    )
+
+    query = (
+        sa.select(
+            Booking,
+            Pool.is_open,
+            sa.func.coalesce(registration_counts.c.pool_count, 0),
+            own_registration,
+            is_manager
+        )
+        .join(Pool, Pool.booking_id == Booking.id)
+        .outerjoin(registration_counts, registration_counts.c.pool_id == Pool.id)
+        .outerjoin(own_registration, sa.and_(
+            own_registration.pool_id == Pool.id,
+            own_registration.member_id == member.id
+        ))
+        .where(*filters)
+        .order_by(Booking.booking_date, Booking.session, Booking.id)
+        .offset((page - 1) * per_page)
+        .limit(per_page)
+    )
+    if load_managers:
+        query = query.options(so.selectinload(Booking.booking_managers))
+
+    can_manage_all = member.is_admin or member.has_role('Event Manager')
+    events = [
+        {
+            'booking': booking,
+            'pool_open': pool_open,
+            'pool_count': pool_count,
+            'registration': registration,
+            'user_can_manage': can_manage_all or managed
+        }
+        for booking, pool_open, pool_count, registration, managed in db.session.execute(query)
+    ]
+    return {'events': events, 'total': total}
+
+
+def get_booking_list_stats(bookings: list[Booking]) -> Dict[int, Dict[str, Any]]:
+    """
+    Get team and pool statistics for a page of bookings in one grouped query.
+
+    Mirrors get_effective_pool_for_booking: a booking without its own pool shares
+    the pool of its series' primary booking when its event type uses the 'event'
+    pool strategy.
+
+    Args:
+        bookings: Bookings on the page
+
+    Returns:
+        Dictionary of booking ID to stats (total_teams, has_pool, has_own_pool,
+        has_shared_pool, pool_members, pool_selected, pool_available)
+    """
+    from app.models import Pool, PoolRegistration, Series, Team
+
+    if not bookings:
+        return {}
+    booking_ids = [booking.id for booking in bookings]
+
+    team_counts = (
+        sa.select(Team.booking_id, sa.func.count(Team.id).label('team_count'))
+        .where(Team.booking_id.in_(booking_ids))
+        .group_by(Team.booking_id)
+        .subquery()
+    )
+    registration_counts = (
+        sa.select(PoolRegistration.pool_id, sa.func.count(PoolRegistration.id).label('pool_count'))
+        .group_by(PoolRegistration.pool_id)
+        .subquery()
+    )
+    own_pool = so.aliased(Pool)
+    own_counts = registration_counts.alias('own_counts')
+    shared_counts = registration_counts.alias('shared_counts')
+
+    rows = db.session.execute(
+        sa.select(
+            Booking.id,
+            sa.func.coalesce(team_counts.c.team_count, 0),
+            own_pool.id,
+            sa.func.coalesce(own_counts.c.pool_count, 0),
+            Series.pool_id,
+            sa.func.coalesce(shared_counts.c.pool_count, 0)
+        )
+        .outerjoin(team_counts, team_counts.c.booking_id == Booking.id)
+        .outerjoin(own_pool, own_pool.booking_id == Booking.id)
+        .outerjoin(own_counts, own_counts.c.pool_id == own_pool.id)
+        .outerjoin(Series, sa.and_(Series.id == Booking.series_id, Series.primary_booking_id != Booking.id))
+        .outerjoin(shared_counts, shared_counts.c.pool_id == Series.pool_id)
+        .where(Booking.id.in_(booking_ids))
+    ).all()
+
+    by_id = {booking.id: booking for booking in bookings}
+    stats = {}
+    for booking_id, team_count, own_pool_id, own_count, primary_pool_id, shared_count in rows:
+        has_own_pool = own_pool_id is not None
+        has_shared_pool = (not has_own_pool and primary_pool_id is not None
+                           and get_pool_strategy_for_booking(by_id[booking_id]) == 'event')
+        pool_members = own_count if has_own_pool else (shared_count if has_shared_pool else 0)
+        stats[booking_id] = {
+            'total_teams': team_count,
+            'has_pool': has_own_pool or has_shared_pool,
+            'has_own_pool': has_own_pool,
+            'has_shared_pool': has_shared_pool,
+            'pool_members': pool_members,
+            'pool_selected': 0,  # Simplified for now
+            'pool_available': pool_members,
+        }
+    return stats
+
+
 # Pool Strategy Functions
 
 def get_pool_strategy_for_booking(booking: Booking) -> str:
@@ -182,6 +360,23 @@ def get_pool_strategy_for_booking(booking: Booking) -> str:
     return event_pool_strategy.get(booking.event_type, 'booking')
 
 
+def get_series(series_id: Optional[str]) -> Optional['Series']:
+    """
+    Get a series by ID (primary-key lookup, usually served from the identity map).
+    
+    Args:
+        series_id: The series ID to look up
+        
+    Returns:
+        Series instance or None
+    """
+    if not series_id:
+        return None
+    
+    from app.models import Series
+    return db.session.get(Series, series_id)
+
+
 def get_primary_booking_in_series(series_id: str) -> Optional[Booking]:
     """
     Get the primary booking in a series (earliest by date).
@@ -193,24 +388,84 @@ def get_primary_booking_in_series(series_id: str) -> Optional[Booking]:
     Returns:
         Primary Booking instance or None if series not found
     """
-    if not series_id:
-        return None
-        
-    return db.session.scalar(
-        sa.select(Booking)
-        .where(Booking.series_id == series_id)
-        .order_by(Booking.booking_date.asc(), Booking.id.asc())
-        .limit(1)
+    series = get_series(series_id)
+    return series.primary_booking if series else None
+
+
+def get_series_summaries(series_id: Optional[str] = None) -> list[Dict[str, Any]]:
+    """
+    Get per-series statistics from a single GROUP BY series_id aggregate.
+
+    Args:
+        series_id: Limit to one series (default: every series)
+
+    Returns:
+        List of dicts ordered by series ID, each with series_id, series_name,
+        primary_booking_id, pool_id, total_games, completed_games (games with teams),
+        next_game_date and pool_members
+    """
+    from app.models import PoolRegistration, Series, Team
+
+    today = date.today()
+    booking_teams = (
+        sa.select(Team.booking_id)
+        .group_by(Team.booking_id)
+        .subquery()
+    )
+    registration_counts = (
+        sa.select(PoolRegistration.pool_id, sa.func.count(PoolRegistration.id).label('pool_count'))
+        .group_by(PoolRegistration.pool_id)
+        .subquery()
+    )
+    primary = so.aliased(Booking)
+
+    query = (
+        sa.select(
+            Booking.series_id,
+            Series.name,
+            primary.name,
+            Series.primary_booking_id,
+            Series.pool_id,
+            sa.func.count(Booking.id),
+            sa.func.count(booking_teams.c.booking_id),
+            sa.func.min(sa.case((Booking.booking_date >= today, Booking.booking_date))),
+            sa.func.coalesce(registration_counts.c.pool_count, 0)
+        )
+        .join(Series, Series.id == Booking.series_id)
+        .outerjoin(primary, primary.id == Series.primary_booking_id)
+        .outerjoin(booking_teams, booking_teams.c.booking_id == Booking.id)
+        .outerjoin(registration_counts, registration_counts.c.pool_id == Series.pool_id)
+        .group_by(Booking.series_id, Series.name, primary.name, Series.primary_booking_id,
+                  Series.pool_id, registration_counts.c.pool_count)
+        .order_by(Booking.series_id)
     )
+    if series_id is not None:
+        query = query.where(Booking.series_id == series_id)
+
+    return [
+        {
+            'series_id': row_series_id,
+            'series_name': name or f"{primary_name} (Series)",
+            'primary_booking_id': primary_booking_id,
+            'pool_id': pool_id,
+            'total_games': total_games,
+            'completed_games': completed_games,
+            'next_game_date': next_game_date,
+            'pool_members': pool_members,
+        }
+        for (row_series_id, name, primary_name, primary_booking_id, pool_id,
+             total_games, completed_games, next_game_date, pool_members) in db.session.execute(query)
+    ]
 
 
-def should_create_pool_for_duplication(original_booking: Booking, duplicate_booking: Booking) -> tuple[bool, Optional[str]]:
+def should_create_pool_for_duplication(original_booking: Booking,
+                                       duplicate_booking: Optional[Booking] = None) -> tuple[bool, Optional[str]]:
     """
     Determine whether to create a new pool for a duplicated booking based on EVENT_POOL_STRATEGY.
     
     Args:
         original_booking: The booking being duplicated
-        duplicate_booking: The new duplicate booking
+        duplicate_booking: The new duplicate booking (the decision currently depends only on the original)
         
     Returns:
         Tuple of (should_create_new_pool, reason)
@@ -264,10 +519,10 @@ def get_effective_pool_for_booking(booking: Booking) -> Optional['Pool']:
     if strategy != 'event':
         return None
     
-    # Find the primary booking in the series
-    primary_booking = get_primary_booking_in_series(booking.series_id)
-    if primary_booking and primary_booking.id != booking.id:
-        return primary_booking.pool
+    # Use the pool of the series' primary booking
+    series = booking.series
+    if series and series.primary_booking_id != booking.id:
+        return series.pool
     
     return None
 
@@ -285,18 +540,16 @@ def get_effective_organizer_for_booking(booking: Booking) -> Optional['Member']:
     """
     # If booking has its own organizer, return it
     if booking.organizer_id:
-        from app.models import Member
-        return db.session.get(Member, booking.organizer_id)
+        return booking.organizer
     
     # If no series, no shared organizer possible
     if not booking.series_id:
         return None
     
-    # Find the primary booking in the series and get its organizer
-    primary_booking = get_primary_booking_in_series(booking.series_id)
-    if primary_booking and primary_booking.id != booking.id and primary_booking.organizer_id:
-        from app.models import Member
-        return db.session.get(Member, primary_booking.organizer_id)
+    # Use the organizer of the series' primary booking
+    series = booking.series
+    if series and series.primary_booking_id != booking.id:
+        return series.organizer
     
     return None
 
@@ -315,8 +568,107 @@ def is_primary_booking_in_series(booking: Booking) -> bool:
     if not booking.series_id:
         return False
         
-    primary_booking = get_primary_booking_in_series(booking.series_id)
-    return primary_booking is not None and primary_booking.id == booking.id
+    series = booking.series
+    return series is not None and series.primary_booking_id == booking.id
+
 
+# Legacy function removed - all code now uses can_user_manage_booking()
 
-# Legacy function removed - all code now uses can_user_manage_booking()
\ No newline at end of file
+
+def expand_recurrence(first_date: date, until: date, interval_days: int,
+                      skip_dates: Iterable[date] = ()) -> list[date]:
+    """
+    Expand a recurrence rule into its occurrence dates in one pass.
+    
+    Args:
+        first_date: Date of the first occurrence
+        until: Last date an occurrence may fall on (inclusive)
+        interval_days: Days between occurrences (7 weekly, 14 fortnightly)
+        skip_dates: Dates to leave out (e.g. holidays)
+        
+    Returns:
+        Sorted list of occurrence dates
+    """
+    if interval_days < 1 or until < first_date:
+        return []
+    skip = set(skip_dates)
+    count = (until - first_date).days // interval_days + 1
+    return [
+        occurrence for occurrence in (first_date + timedelta(days=interval_days * i) for i in range(count))
+        if occurrence not in skip
+    ]
+
+
+def create_recurring_bookings(source: Booking, dates: list[date], session: Optional[int] = None) -> Dict[str, Any]:
+    """
+    Create copies of a booking on many dates under its series.
+    
+    Capacity for every occurrence is reserved with one locked query before anything is written;
+    the bookings (and per-booking pools where the pool strategy needs them) are then
+    bulk-inserted. The source booking joins a new series if it is not in one yet.
+    The caller commits.
+    
+    Args:
+        source: Booking to repeat
+        dates: Occurrence dates
+        session: Session for the occurrences (defaults to the source booking's session)
+        
+    Returns:
+        Dictionary with 'created' (number of bookings added), 'booking_ids' and 'dates'
+        of the new bookings, 'series_id' and 'conflicts' (availability results for
+        occurrences without enough rinks; nothing is created when this is non-empty)
+    """
+    from app.bookings.occupancy import reserve_rinks, RinkCapacityError
+    from app.models import Pool
+    
+    session = session or source.session
+    if not dates:
+        return {'created': 0, 'booking_ids': [], 'dates': [], 'series_id': source.series_id, 'conflicts': []}
+    try:
+        # Holds the slot locks until the caller commits
+        reserve_rinks([(occurrence, session, source.rink_count, source.home_away) for occurrence in dates])
+    except RinkCapacityError as e:
+        return {'created': 0, 'booking_ids': [], 'dates': [], 'series_id': source.series_id,
+                'conflicts': e.conflicts}
+    
+    if not source.series_id:
+        import uuid
+        source.series_id = str(uuid.uuid4())
+        source.series_name = f"{source.name} Series"  # Default series name
+    
+    rows = [
+        booking_values_with_defaults(
+            name=source.name,
+            event_type=source.event_type,
+            gender=source.gender,
+            format=source.format,
+            scoring=source.scoring or None,
+            booking_date=occurrence,
+            session=session,
+            rink_count=source.rink_count,
+            vs=source.vs,
+            home_away=source.home_away,
+            organizer_id=source.organizer_id,
+            has_pool=source.has_pool,
+            series_id=source.series_id,
+            series_commitment_required=source.series_commitment_required
+        )
+        for occurrence in dates
+    ]
+    booking_ids = db.session.scalars(sa.insert(Booking).returning(Booking.id), rows).all()
+    
+    # Per-booking pool strategy: give each new occurrence its own pool
+    should_create_pool, _ = should_create_pool_for_duplication(source)
+    if should_create_pool:
+        db.session.execute(sa.insert(Pool), [
+            {'booking_id': booking_id, 'is_open': True, 'max_players': source.pool.max_players}
+            for booking_id in booking_ids
+        ])
+    
+    return {
+        'created': len(booking_ids),
+        'booking_ids': booking_ids,
+        'dates': [row['booking_date'] for row in rows],
+        'series_id': source.series_id,
+        'conflicts': []
+    }
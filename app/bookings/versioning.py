@@ -0,0 +1,172 @@
+"""
+Bookings change-version stamp and conditional GET helpers.
+
+Any flush that inserts, updates or deletes a Booking, Team, TeamMember, Pool or
+PoolRegistration bumps the 'bookings' row in data_versions inside the same
+transaction, as does any ORM bulk statement against those models. So does renaming
+a member, since payloads carry organiser, team and pool member names. JSON endpoints
+derive their ETag from that number, so a request carrying a matching If-None-Match
+can be answered with 304 after one primary-key lookup, without querying the
+bookings tables.
+
+The session also remembers the version range each transaction moved the scope
+through, so the in-process calendar cache can tell its own commits from other
+processes' writes.
+"""
+
+from typing import Optional
+
+from flask import request, make_response
+import sqlalchemy as sa
+import sqlalchemy.orm as so
+
+from app import db
+from app.models import Booking, Team, TeamMember, Pool, PoolRegistration, DataVersion, Member
+
+BOOKINGS_SCOPE = 'bookings'
+VERSION_CHANGE_KEY = 'bookings_version_change'
+
+# Models whose changes can alter calendar and booking JSON payloads
+VERSIONED_MODELS = (Booking, Team, TeamMember, Pool, PoolRegistration)
+
+# Member columns copied into those payloads
+MEMBER_NAME_ATTRIBUTES = ('firstname', 'lastname')
+
+
+def member_name_changed(member: Member) -> bool:
+    """Check whether a pending flush changes how a member's name is displayed."""
+    state = sa.inspect(member)
+    return any(state.attrs[attr].history.has_changes() for attr in MEMBER_NAME_ATTRIBUTES)
+
+
+def _has_versioned_changes(session: so.Session) -> bool:
+    """Check whether the pending flush touches any bookings-scope model."""
+    for obj in session.new:
+        if isinstance(obj, VERSIONED_MODELS):
+            return True
+    for obj in session.deleted:
+        if isinstance(obj, VERSIONED_MODELS):
+            return True
+    for obj in session.dirty:
+        if isinstance(obj, VERSIONED_MODELS) and session.is_modified(obj):
+            return True
+        if isinstance(obj, Member) and member_name_changed(obj):
+            return True
+    return False
+
+
+def bump_version(connection, scope: str = BOOKINGS_SCOPE) -> int:
+    """
+    Increment the change version for a scope on the given connection.
+
+    Args:
+        connection: Connection bound to the current transaction
+        scope: Version scope name
+
+    Returns:
+        The new version number
+    """
+    table = DataVersion.__table__
+    version = connection.execute(
+        sa.update(table)
+        .where(table.c.scope == scope)
+        .values(version=table.c.version + 1)
+        .returning(table.c.version)
+    ).scalar()
+    if version is None:
+        connection.execute(sa.insert(table).values(scope=scope, version=1))
+        version = 1
+    return version
+
+
+def _record_version_change(session: so.Session, version: int) -> None:
+    """Remember the bookings version before this transaction and the latest it reached."""
+    previous, _ = session.info.get(VERSION_CHANGE_KEY, (version - 1, None))
+    session.info[VERSION_CHANGE_KEY] = (previous, version)
+
+
+@sa.event.listens_for(so.Session, 'before_flush')
+def _bump_bookings_version(session, flush_context, instances):
+    """Bump the bookings version whenever a bookings-scope row is about to change."""
+    if _has_versioned_changes(session):
+        _record_version_change(session, bump_version(session.connection()))
+
+
+@sa.event.listens_for(so.Session, 'do_orm_execute')
+def _bump_bookings_version_bulk(orm_execute_state):
+    """Bump the bookings version for ORM bulk INSERT/UPDATE/DELETE statements, which skip the flush hook."""
+    if not (orm_execute_state.is_insert or orm_execute_state.is_update or orm_execute_state.is_delete):
+        return
+    mapper = orm_execute_state.bind_mapper
+    if mapper is not None and issubclass(mapper.class_, VERSIONED_MODELS):
+        session = orm_execute_state.session
+        _record_version_change(session, bump_version(session.connection()))
+
+
+@sa.event.listens_for(so.Session, 'after_rollback')
+def _discard_version_change(session):
+    """Rolled back bumps never reached the database."""
+    session.info.pop(VERSION_CHANGE_KEY, None)
+
+
+def get_version(scope: str = BOOKINGS_SCOPE) -> int:
+    """
+    Get the current change version for a scope.
+
+    Args:
+        scope: Version scope name
+
+    Returns:
+        Version number (0 if the scope has never changed)
+    """
+    return db.session.scalar(
+        sa.select(DataVersion.version).where(DataVersion.scope == scope)
+    ) or 0
+
+
+def bookings_etag(version: Optional[int] = None) -> str:
+    """
+    Get the ETag value for payloads derived from the bookings tables.
+
+    Args:
+        version: Bookings version already read by the caller (read here if omitted)
+
+    Returns:
+        ETag value
+    """
+    if version is None:
+        version = get_version()
+    return f"{BOOKINGS_SCOPE}-{version}"
+
+
+def not_modified_response(etag: str):
+    """
+    Return a 304 response if the request's If-None-Match matches the ETag.
+
+    Args:
+        etag: Current ETag value for the resource
+
+    Returns:
+        304 Response, or None if the client copy is stale or missing
+    """
+    if request.if_none_match and request.if_none_match.contains_weak(etag):
+        response = make_response('', 304)
+        return with_etag(response, etag)
+    return None
+
+
+def with_etag(response, etag: str):
+    """
+    Attach the ETag and revalidation headers to a JSON response.
+
+    Args:
+        response: Flask response
+        etag: ETag value
+
+    Returns:
+        The same response, for chaining
+    """
+    response.set_etag(etag)
+    # Let the browser keep a private copy but always revalidate it
+    response.headers['Cache-Control'] = 'private, no-cache'
+    return response
@@ -0,0 +1,163 @@
+"""
+Resized, metadata-free variants of post images.
+
+When an image is uploaded, a process pool renders one copy per entry in
+POST_IMAGE_VARIANTS (name -> maximum width, e.g. thumb/card/full) into
+images/variants/<name>/<filename> beside the original. Each copy is orientation-
+corrected, recompressed at POST_IMAGE_VARIANT_QUALITY, and saved without EXIF or other
+metadata. serve_post_image picks a variant by its `size` parameter and falls back to
+the original until the variant exists. A miss also queues generation, so images
+uploaded before variants existed catch up on first view.
+
+POST_IMAGE_VARIANT_WORKERS sets the pool size. With 0, variants are rendered inline
+(tests do this).
+"""
+
+import atexit
+import multiprocessing
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, Optional
+
+from flask import current_app
+from PIL import Image, ImageOps
+
+# Pool of the current process, and originals (path -> mtime) already queued in it
+_variant_pool = {'pid': None, 'executor': None}
+_scheduled: Dict[str, float] = {}
+_variant_lock = threading.Lock()
+_variant_shutdown_registered = False
+
+
+def image_variant_path(image_path: str, size: str) -> str:
+    """Get where a variant of an image is stored (size must be a POST_IMAGE_VARIANTS name)."""
+    images_dir, filename = os.path.split(image_path)
+    return os.path.join(images_dir, 'variants', size, filename)
+
+
+def render_image_variants(image_path: str, widths: Dict[str, int], quality: int) -> List[str]:
+    """
+    Write every variant of an image. Runs in a pool worker, so it uses no app state.
+
+    Args:
+        image_path: Path of the original image
+        widths: Variant name -> maximum width in pixels (images are never enlarged)
+        quality: JPEG quality
+
+    Returns:
+        Paths of the variants written
+    """
+    written = []
+    with Image.open(image_path) as original:
+        image = ImageOps.exif_transpose(original)  # Apply the orientation before EXIF is dropped
+        is_jpeg = original.format == 'JPEG'
+        if is_jpeg and image.mode not in ('RGB', 'L'):
+            image = image.convert('RGB')
+
+        for size, width in widths.items():
+            variant = image.copy()
+            variant.thumbnail((width, width * 10), Image.Resampling.LANCZOS)
+            path = image_variant_path(image_path, size)
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            temp_path = os.path.join(os.path.dirname(path), f'.{os.path.basename(path)}.tmp')
+            # Only the pixels are saved: no EXIF, ICC profile or text chunks
+            if is_jpeg:
+                variant.save(temp_path, format='JPEG', quality=quality, optimize=True, progressive=True)
+            else:
+                variant.save(temp_path, format='PNG', optimize=True)
+            os.replace(temp_path, path)
+            written.append(path)
+    return written
+
+
+def _executor() -> ProcessPoolExecutor:
+    """Get this process's variant pool, starting it on first use (and again after a fork)."""
+    global _variant_shutdown_registered
+    with _variant_lock:
+        if _variant_pool['pid'] != os.getpid():
+            # Spawned, not forked: the app process runs background threads (audit writer, last_seen)
+            executor = ProcessPoolExecutor(
+                max_workers=current_app.config.get('POST_IMAGE_VARIANT_WORKERS', 2),
+                mp_context=multiprocessing.get_context('spawn')
+            )
+            if not _variant_shutdown_registered:
+                atexit.register(shutdown_image_variant_pool)
+                _variant_shutdown_registered = True
+            _variant_pool.update(pid=os.getpid(), executor=executor)
+            _scheduled.clear()
+        return _variant_pool['executor']
+
+
+def shutdown_image_variant_pool():
+    """Finish queued variants and stop the pool's worker processes."""
+    with _variant_lock:
+        if _variant_pool['pid'] == os.getpid():
+            _variant_pool['executor'].shutdown(wait=True)
+        _variant_pool.update(pid=None, executor=None)
+
+
+def schedule_image_variants(image_path: str, force: bool = False) -> bool:
+    """
+    Queue generation of an image's variants without waiting for it.
+
+    Args:
+        image_path: Path of the original image
+        force: Queue even if this version of the image was queued before (e.g. re-upload)
+
+    Returns:
+        True if generation was queued (or done inline), False if already queued
+    """
+    try:
+        mtime = os.path.getmtime(image_path)
+    except OSError:
+        return False
+    with _variant_lock:
+        if not force and _scheduled.get(image_path) == mtime:
+            return False
+        _scheduled[image_path] = mtime
+
+    widths = dict(current_app.config.get('POST_IMAGE_VARIANTS', {}))
+    quality = current_app.config.get('POST_IMAGE_VARIANT_QUALITY', 82)
+    logger = current_app.logger
+
+    if current_app.config.get('POST_IMAGE_VARIANT_WORKERS', 2) <= 0:
+        try:
+            render_image_variants(image_path, widths, quality)
+        except Exception as e:
+            logger.error(f"Error creating variants of {image_path}: {str(e)}")
+        return True
+
+    def log_failure(future):
+        if future.exception() is not None:
+            logger.error(f"Error creating variants of {image_path}: {str(future.exception())}")
+
+    _executor().submit(render_image_variants, image_path, widths, quality).add_done_callback(log_failure)
+    return True
+
+
+def get_image_variant_path(image_path: str, size: Optional[str] = None) -> Optional[str]:
+    """
+    Get the variant of an image to serve.
+
+    Args:
+        image_path: Validated path of the original image
+        size: Variant name; unknown or missing names mean POST_IMAGE_DEFAULT_VARIANT
+
+    Returns:
+        Path of an up-to-date variant, or None to serve the original (generation is queued)
+    """
+    variants = current_app.config.get('POST_IMAGE_VARIANTS', {})
+    if size not in variants:
+        size = current_app.config.get('POST_IMAGE_DEFAULT_VARIANT', 'full')
+    if size not in variants:
+        return None
+
+    path = image_variant_path(image_path, size)
+    try:
+        if os.path.getmtime(path) >= os.path.getmtime(image_path):
+            return path
+    except OSError:
+        pass
+    schedule_image_variants(image_path)
+    return None
@@ -13,8 +13,10 @@ from app.content.forms import WritePostForm, PolicyPageForm
 from app.content.utils import (
     create_post_directory, get_post_file_path, get_post_image_path, rename_post_directory,
     get_post_existing_images, sanitize_html_content, get_secure_policy_page_path, get_secure_archive_path, 
-    parse_metadata_from_markdown, find_orphaned_policy_pages, recover_orphaned_policy_page
+    parse_metadata_from_markdown, find_orphaned_policy_pages, recover_orphaned_policy_page,
+    invalidate_footer_policy_pages, write_sanitized_html, read_sanitized_html, send_post_image
 )
+from app.content.images import get_image_variant_path, schedule_image_variants
 from app.routes import role_required, admin_required
 from app.forms import FlaskForm
 
@@ -120,6 +122,9 @@ def handle_image_uploads(image_files, post):
                             'size': file_size_on_disk
                         })
                         current_app.logger.info(f"Added image to uploaded_images: {secure_filename}")
+                        
+                        # Resized, metadata-free copies are rendered in the worker pool
+                        schedule_image_variants(file_path, force=True)
                     else:
                         current_app.logger.error(f"File does not exist after save: {file_path}")
                         continue
@@ -302,8 +307,7 @@ def admin_write_post():
                         with open(markdown_path, 'w', encoding='utf-8') as f:
                             f.write('---\ntitle: Draft\nsummary: Draft post\n---\n\n')
                         current_app.logger.info("Writing HTML file")
-                        with open(html_path, 'w', encoding='utf-8') as f:
-                            f.write('')
+                        write_sanitized_html(html_path, '')
                         current_app.logger.info("Draft files created successfully")
                     else:
                         current_app.logger.warning("Could not get secure paths for draft files")
@@ -427,9 +431,7 @@ tags: {tags}
                         # Convert markdown to HTML and save
                         import markdown2
                         html_content = markdown2.markdown(content, extras=['fenced-code-blocks', 'tables', 'header-ids', 'code-friendly'])
-                        html_content = sanitize_html_content(html_content)
-                        with open(html_path, 'w', encoding='utf-8') as f:
-                            f.write(html_content)
+                        write_sanitized_html(html_path, html_content)
                     
                     db.session.commit()
                     current_app.logger.info("Preview: Draft saved successfully")
@@ -626,10 +628,7 @@ tags: {tags}
                 # Convert markdown to HTML and save
                 import markdown2
                 html_content = markdown2.markdown(content, extras=['fenced-code-blocks', 'tables', 'header-ids', 'code-friendly'])
-                sanitized_html = sanitize_html_content(html_content)
-                
-                with open(html_path, 'w', encoding='utf-8') as html_file:
-                    html_file.write(sanitized_html)
+                write_sanitized_html(html_path, html_content)
                 
                 # Audit log the post creation/update
                 if draft_post:
@@ -734,13 +733,15 @@ def admin_manage_posts():
                     # Delete post from database
                     db.session.delete(post)
             
+            from app.audit_events import label_audit_batch
+            description = f'Deleted {len(deleted_posts)} posts: {", ".join(deleted_posts)}'
+            batched = deleted_posts and label_audit_batch(db.session, description)
             db.session.commit()
             
-            # Audit log the post deletions
-            if deleted_posts:
+            # Without session-event auditing, log a summary of the post deletions
+            if deleted_posts and not batched:
                 from app.audit import audit_log_bulk_operation
-                audit_log_bulk_operation('BULK_DELETE', 'Post', len(deleted_posts), 
-                                       f'Deleted {len(deleted_posts)} posts: {", ".join(deleted_posts)}')
+                audit_log_bulk_operation('BULK_DELETE', 'Post', len(deleted_posts), description)
             flash(f"{len(post_ids)} post(s) deleted successfully!", "success")
             return redirect(url_for('content.admin_manage_posts'))
 
@@ -957,8 +958,7 @@ def admin_edit_post(post_id):
             # Convert the updated Markdown to HTML and overwrite the HTML file
             import markdown2
             updated_html = markdown2.markdown(form.content.data, extras=['fenced-code-blocks', 'tables', 'header-ids', 'code-friendly'])
-            with open(html_path, 'w') as file:
-                file.write(updated_html)
+            write_sanitized_html(html_path, updated_html)
 
             # Save changes to the database
             db.session.commit()
@@ -1152,6 +1152,7 @@ def admin_create_policy_page():
             )
             db.session.add(policy_page)
             db.session.commit()
+            invalidate_footer_policy_pages()
             
             # Audit log the policy page creation
             audit_log_create('PolicyPage', policy_page.id, f'Created policy page: {policy_page.title}',
@@ -1187,9 +1188,7 @@ def admin_create_policy_page():
             # Convert to HTML and write HTML file
             import markdown2
             html_content = markdown2.markdown(form.content.data, extras=['fenced-code-blocks', 'tables', 'header-ids', 'code-friendly'])
-            sanitized_html = sanitize_html_content(html_content)
-            with open(html_path, 'w', encoding='utf-8') as f:
-                f.write(sanitized_html)
+            write_sanitized_html(html_path, html_content)
             
             flash('Policy page created successfully!', 'success')
             return redirect(url_for('content.admin_manage_policy_pages'))
@@ -1250,6 +1249,7 @@ def admin_edit_policy_page(policy_page_id):
             policy_page.sort_order = form.sort_order.data or 0
             
             db.session.commit()
+            invalidate_footer_policy_pages()
             
             # Audit log the policy page update
             audit_log_update('PolicyPage', policy_page.id, f'Updated policy page: {policy_page.title}', changes)
@@ -1279,9 +1279,7 @@ def admin_edit_policy_page(policy_page_id):
                     # Convert to HTML and write HTML file
                     import markdown2
                     html_content = markdown2.markdown(form.content.data, extras=['fenced-code-blocks', 'tables', 'header-ids', 'code-friendly'])
-                    sanitized_html = sanitize_html_content(html_content)
-                    with open(html_path, 'w', encoding='utf-8') as f:
-                        f.write(sanitized_html)
+                    write_sanitized_html(html_path, html_content)
             
             flash('Policy page updated successfully!', 'success')
             return redirect(url_for('content.admin_manage_policy_pages'))
@@ -1334,6 +1332,7 @@ def admin_delete_policy_page(policy_page_id):
         # Delete from database
         db.session.delete(policy_page)
         db.session.commit()
+        invalidate_footer_policy_pages()
         
         # Audit log the policy page deletion
         audit_log_delete('PolicyPage', policy_page_id, f'Deleted policy page: {policy_page_info}')
@@ -1365,6 +1364,8 @@ def admin_recover_policy_page(filename):
         success, message, policy_page = recover_orphaned_policy_page(filename, current_user.id)
         
         if success and policy_page:
+            invalidate_footer_policy_pages()
+            
             # Audit log the policy page recovery
             audit_log_create('PolicyPage', policy_page.id, 
                             f'Recovered orphaned policy page: {policy_page.title}',
@@ -1424,9 +1425,11 @@ def serve_post_image(post_id, filename):
             current_app.logger.warning(f"Image file not found: {image_path}")
             abort(404)
         
-        # Serve the file
-        from flask import send_file
-        return send_file(image_path)
+        # Serve the requested size (?size=thumb|card|full) once its variant exists
+        variant_path = get_image_variant_path(image_path, request.args.get('size'))
+        
+        # Serve the file with validators, or hand it to the front-end server
+        return send_post_image(variant_path or image_path)
         
     except Exception as e:
         current_app.logger.error(f"Error serving image {filename} for post {post_id}: {str(e)}")
@@ -1471,9 +1474,9 @@ def view_post(post_id):
             current_app.logger.error(f"Could not get secure path for HTML file: {post.html_filename}")
             abort(404)
             
+        # Sanitized when the post was saved; served from the in-process cache
         try:
-            with open(html_path, 'r', encoding='utf-8') as f:
-                html_content = f.read()
+            sanitized_content = read_sanitized_html(html_path)
         except FileNotFoundError:
             current_app.logger.error(f"Post HTML file not found: {html_path}")
             abort(404)
@@ -1481,13 +1484,6 @@ def view_post(post_id):
             current_app.logger.error(f"Error reading HTML file {html_path}: {str(e)}")
             abort(500)
         
-        # Sanitize HTML content
-        try:
-            sanitized_content = sanitize_html_content(html_content)
-        except Exception as e:
-            current_app.logger.error(f"Error sanitizing HTML content: {str(e)}")
-            sanitized_content = html_content  # Fallback to unsanitized content
-        
         return render_template('view_post.html', post=post, content=sanitized_content)
         
     except Exception as e:
@@ -1518,15 +1514,12 @@ def view_policy(slug):
         if not html_path:
             abort(404)
         
+        # Sanitized when the page was saved; served from the in-process cache
         try:
-            with open(html_path, 'r', encoding='utf-8') as f:
-                html_content = f.read()
+            sanitized_content = read_sanitized_html(html_path)
         except FileNotFoundError:
             abort(404)
         
-        # Sanitize HTML content
-        sanitized_content = sanitize_html_content(html_content)
-        
         return render_template('view_policy_page.html', 
                              policy_page=policy_page, 
                              content=sanitized_content)
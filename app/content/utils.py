@@ -1,7 +1,12 @@
 # Standard library imports
+import hashlib
+import hmac
 import os
 import re
+import threading
+import time
 import uuid
+from collections import OrderedDict, namedtuple
 
 # Third-party imports
 import bleach
@@ -213,6 +218,51 @@ def get_post_image_path(post_directory, image_filename):
     # Validate and get the image file path
     return validate_secure_path(image_filename, images_dir_path)
 
+def send_post_image(image_path):
+    """
+    Build the response for an authorised post image request.
+    
+    The response carries a strong ETag and Last-Modified, answers If-None-Match /
+    If-Modified-Since with 304 and byte ranges with 206, and may be cached privately
+    for POST_IMAGE_MAX_AGE seconds. With POST_IMAGE_OFFLOAD set to 'x-sendfile' or
+    'x-accel-redirect' the body is left to the front-end server, which also handles
+    ranges; for 'x-accel-redirect' the file is addressed as POST_IMAGE_ACCEL_PREFIX
+    plus its path under POSTS_STORAGE_PATH.
+    
+    Args:
+        image_path (str): Validated path of an existing image file.
+        
+    Returns:
+        Response: The image, offload or 304 response.
+    """
+    from flask import request, send_file
+    from urllib.parse import quote
+    from werkzeug.utils import send_file as werkzeug_send_file
+    
+    max_age = current_app.config.get('POST_IMAGE_MAX_AGE', 3600)
+    offload = (current_app.config.get('POST_IMAGE_OFFLOAD') or '').lower()
+    
+    if offload in ('x-sendfile', 'x-accel-redirect'):
+        response = werkzeug_send_file(image_path, request.environ, use_x_sendfile=True,
+                                      conditional=False, max_age=max_age)
+        response.make_conditional(request.environ)  # No ranges here: the front-end serves them
+        sendfile_path = response.headers.pop('X-Sendfile', None)
+        if sendfile_path and response.status_code == 200:
+            if offload == 'x-sendfile':
+                response.headers['X-Sendfile'] = sendfile_path
+            else:
+                relative_path = os.path.relpath(sendfile_path, current_app.config['POSTS_STORAGE_PATH'])
+                prefix = current_app.config.get('POST_IMAGE_ACCEL_PREFIX', '/protected/posts/')
+                response.headers['X-Accel-Redirect'] = prefix.rstrip('/') + '/' + quote(relative_path.replace(os.sep, '/'))
+    else:
+        response = send_file(image_path, conditional=True, etag=True, max_age=max_age)
+    
+    # Images sit behind login, so only the member's own browser may cache them
+    response.cache_control.public = None
+    response.cache_control.private = True
+    return response
+
+
 def get_post_existing_images(post_directory):
     """
     Get a list of existing image files in a post's directory.
@@ -326,6 +376,51 @@ def get_secure_policy_page_path(filename):
     base_path = current_app.config.get('POLICY_PAGES_STORAGE_PATH')
     return validate_secure_path(filename, base_path)
 
+# Footer links are cached in process; the policy page admin routes invalidate them and
+# FOOTER_POLICY_PAGES_CACHE_SECONDS bounds how long other workers can be out of date
+FooterPolicyLink = namedtuple('FooterPolicyLink', ['slug', 'title'])
+_footer_cache = {'links': None, 'expires_at': 0.0, 'generation': 0}
+_footer_cache_lock = threading.Lock()
+
+
+def get_footer_policy_pages():
+    """
+    Get the active policy pages shown in the site footer.
+    
+    Returns:
+        tuple: FooterPolicyLink(slug, title) entries in footer order.
+    """
+    from app.models import PolicyPage
+    from app import db
+    
+    now = time.monotonic()
+    with _footer_cache_lock:
+        if _footer_cache['links'] is not None and _footer_cache['expires_at'] > now:
+            return _footer_cache['links']
+        generation = _footer_cache['generation']
+    
+    links = tuple(
+        FooterPolicyLink(slug, title) for slug, title in db.session.execute(
+            sa.select(PolicyPage.slug, PolicyPage.title)
+            .where(PolicyPage.is_active == True, PolicyPage.show_in_footer == True)
+            .order_by(PolicyPage.sort_order, PolicyPage.title)
+        )
+    )
+    
+    ttl = current_app.config.get('FOOTER_POLICY_PAGES_CACHE_SECONDS', 300)
+    with _footer_cache_lock:
+        # Skip storing if the pages were invalidated while this query ran
+        if ttl > 0 and generation == _footer_cache['generation']:
+            _footer_cache.update(links=links, expires_at=now + ttl)
+    return links
+
+
+def invalidate_footer_policy_pages():
+    """Drop the cached footer links after a policy page is created, edited, deleted or recovered."""
+    with _footer_cache_lock:
+        _footer_cache.update(links=None, expires_at=0.0, generation=_footer_cache['generation'] + 1)
+
+
 def sanitize_html_content(html_content):
     """
     Sanitize HTML content to prevent XSS while allowing safe formatting.
@@ -358,6 +453,85 @@ def sanitize_html_content(html_content):
     return bleach.clean(html_content, tags=allowed_tags, attributes=allowed_attributes)
 
 
+# Sanitized HTML is written once, when a post or policy page is saved, after a marker line
+# carrying an HMAC of the content, so files written any other way are sanitized on read
+SANITIZED_HTML_MARKER = '<!-- sanitized {} -->\n'
+
+# Served HTML cached in process by file path, checked against the file's mtime and size
+_html_cache = OrderedDict()  # path -> (mtime_ns, size, html)
+_html_cache_lock = threading.Lock()
+
+
+def _sanitized_html_digest(sanitized_html):
+    """HMAC of sanitized HTML under the app's secret key."""
+    key = str(current_app.config['SECRET_KEY']).encode('utf-8')
+    return hmac.new(key, sanitized_html.encode('utf-8'), hashlib.sha256).hexdigest()
+
+
+def write_sanitized_html(html_path, html_content):
+    """
+    Sanitize HTML and write it as the file served for a post or policy page.
+    
+    The file is replaced atomically, so a concurrent view never reads half of it.
+    
+    Args:
+        html_path (str): Path of the HTML file to write.
+        html_content (str): HTML rendered from the Markdown source.
+        
+    Returns:
+        str: The sanitized HTML written.
+    """
+    sanitized_html = sanitize_html_content(html_content)
+    temp_path = f'{html_path}.tmp'
+    with open(temp_path, 'w', encoding='utf-8', newline='') as html_file:
+        html_file.write(SANITIZED_HTML_MARKER.format(_sanitized_html_digest(sanitized_html)) + sanitized_html)
+    os.replace(temp_path, html_path)
+    return sanitized_html
+
+
+def read_sanitized_html(html_path):
+    """
+    Get the sanitized HTML to serve for a post or policy page.
+    
+    Files written by write_sanitized_html are served as stored. Older files, or any whose
+    marker does not match their content, are sanitized here, once per version of the file.
+    Either way the result is cached until the file changes.
+    
+    Args:
+        html_path (str): Path of the HTML file.
+        
+    Returns:
+        str: Sanitized HTML content safe for rendering.
+        
+    Raises:
+        FileNotFoundError: If the file does not exist.
+    """
+    stat = os.stat(html_path)
+    version = (stat.st_mtime_ns, stat.st_size)
+    with _html_cache_lock:
+        cached = _html_cache.get(html_path)
+        if cached is not None and cached[:2] == version:
+            _html_cache.move_to_end(html_path)
+            return cached[2]
+    
+    with open(html_path, 'r', encoding='utf-8', newline='') as html_file:
+        html_content = html_file.read()
+    marker, _, body = html_content.partition('\n')
+    if marker == SANITIZED_HTML_MARKER.format(_sanitized_html_digest(body)).rstrip('\n'):
+        html_content = body
+    else:
+        html_content = sanitize_html_content(html_content)
+    
+    max_entries = current_app.config.get('CONTENT_HTML_CACHE_MAX_ENTRIES', 128)
+    if max_entries > 0:
+        with _html_cache_lock:
+            _html_cache[html_path] = version + (html_content,)
+            _html_cache.move_to_end(html_path)
+            while len(_html_cache) > max_entries:
+                _html_cache.popitem(last=False)
+    return html_content
+
+
 def find_orphaned_policy_pages():
     """
     Find policy page files in secure storage that are not tracked in the database.
@@ -518,8 +692,7 @@ def recover_orphaned_policy_page(markdown_filename, current_user_id):
         if not os.path.exists(html_path):
             # Convert Markdown to HTML and save
             html_content = markdown2.markdown(markdown_content, extras=["tables"])
-            with open(html_path, 'w', encoding='utf-8') as html_file:
-                html_file.write(html_content)
+            write_sanitized_html(html_path, html_content)
         
         # Add to database
         db.session.add(policy_page)
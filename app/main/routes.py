@@ -163,86 +163,41 @@ def upcoming_events():
         # Get today's date
         today = date.today()
         
-        # Get booking IDs where user has team assignments (same logic as My Games page)
-        from app.models import TeamMember, Team
-        assigned_booking_ids = set()
-        
-        user_assignments = db.session.scalars(
-            sa.select(TeamMember)
-            .join(TeamMember.team)
-            .join(Team.booking)
-            .where(TeamMember.member_id == current_user.id)
-        ).all()
-        
-        assigned_booking_ids = {assignment.team.booking_id for assignment in user_assignments}
-        current_app.logger.info(f"Upcoming events: User {current_user.id} has team assignments for bookings: {assigned_booking_ids}")
-        
-        # Get ALL bookings (events) that have pools enabled - this is the registration interface
-        # Users should see all events they can potentially register for
-        # BUT exclude bookings where user is already assigned to a team
-        query = sa.select(Booking).where(
-            sa.or_(
-                Booking.has_pool == True,  # Bookings marked as having pools
-                sa.exists().where(  # OR bookings that actually have pool records
-                    sa.and_(
-                        Pool.booking_id == Booking.id
-                    )
-                )
-            )
-        )
+        # One page of events with pools in the date window, excluding bookings the
+        # user is already in a team for (same logic as My Games page)
+        from app.bookings.utils import get_upcoming_pool_events
+        per_page = current_app.config.get('UPCOMING_EVENTS_PER_PAGE', 25)
+        page = max(request.args.get(get_page_parameter(), 1, type=int), 1)
+        window_end = today + timedelta(days=current_app.config.get('UPCOMING_EVENTS_WINDOW_DAYS', 180))
         
-        # Exclude bookings where user is already in a team
-        if assigned_booking_ids:
-            query = query.where(~Booking.id.in_(assigned_booking_ids))
+        result = get_upcoming_pool_events(current_user, today, window_end,
+                                          page=page, per_page=per_page, exclude_assigned=True)
         
-        all_bookings = db.session.scalars(query.order_by(Booking.booking_date.asc())).all()
-        current_app.logger.info(f"Upcoming events: Found {len(all_bookings)} bookings after filtering team assignments")
-        
-        # For each booking, get the user's registration status and management permissions
         events_data = []
-        for booking in all_bookings:
-            # Check if user can manage this booking
-            user_can_manage = (current_user.is_admin or 
-                             current_user.has_role('Event Manager') or
-                             current_user in booking.booking_managers)
-            
-            # Get pool information for this booking
-            pool = booking.pool if hasattr(booking, 'pool') else None
-            has_pools = pool is not None
-            pool_open = pool.is_open if pool else False
-            pool_count = len(pool.registrations) if pool else 0
-            
-            # Skip bookings that don't actually have any pools
-            if not has_pools:
-                continue
-                
-            event_info = {
-                'event': booking,  # Keep 'event' key for template compatibility
-                'registration_status': 'not_registered',
-                'registration': None,
-                'pool_count': pool_count,
-                'pool_open': pool_open,
-                'user_can_manage': user_can_manage,
+        for event in result['events']:
+            events_data.append({
+                'event': event['booking'],  # Keep 'event' key for template compatibility
+                'registration_status': 'registered' if event['registration'] else 'not_registered',
+                'registration': event['registration'],
+                'pool_count': event['pool_count'],
+                'pool_open': event['pool_open'],
+                'user_can_manage': event['user_can_manage'],
                 'pool_info': {
-                    'has_pools': has_pools,
-                    'total_members': pool_count,
-                    'pool_status': 'open' if pool_open else 'closed'
+                    'has_pools': True,
+                    'total_members': event['pool_count'],
+                    'pool_status': 'open' if event['pool_open'] else 'closed'
                 }
-            }
-            
-            # Check if user is registered in the pool
-            user_registration = None
-            if pool:
-                user_registration = pool.get_member_registration(current_user.id)
-            
-            if user_registration:
-                event_info['registration'] = user_registration
-                event_info['registration_status'] = 'registered'
-            
-            events_data.append(event_info)
+            })
+        
+        pagination = None
+        if result['total'] > per_page:
+            pagination = Pagination(page=page, total=result['total'], per_page=per_page,
+                                    css_framework='bulma', record_name='events')
         
         return render_template('main/upcoming_events.html', 
                              events_data=events_data,
+                             total_events=result['total'],
+                             pagination=pagination,
                              today=today,
                              csrf_form=csrf_form)
                              
@@ -256,6 +211,8 @@ def upcoming_events():
         csrf_form = FlaskForm()
         return render_template('main/upcoming_events.html', 
                              events_data=[],
+                             total_events=0,
+                             pagination=None,
                              today=date.today(),
                              csrf_form=csrf_form)
 
@@ -294,13 +294,8 @@ def role_required(*required_roles):
                 flash('Please log in to access this page.', 'error')
                 return redirect(url_for('members.auth_login'))
             
-            # Admin users have access to everything
-            if current_user.is_admin:
-                return f(*args, **kwargs)
-            
-            # Check if user has any of the required roles
-            user_roles = [role.name for role in current_user.roles]
-            if not any(role in user_roles for role in required_roles):
+            # Check if user has any of the required roles (admin users have access to everything)
+            if not current_user.has_any_role(*required_roles):
                 flash('Access denied. You do not have the required permissions.', 'error')
                 return redirect(url_for('main.index'))
             
@@ -317,7 +312,7 @@ def admin_manage_members():
     Admin interface for managing members
     """
     try:
-        current_app.logger.info(f"User {current_user.id} accessing manage_members. Is admin: {current_user.is_admin}, Roles: {[role.name for role in current_user.roles]}")
+        current_app.logger.info(f"User {current_user.id} accessing manage_members. Is admin: {current_user.is_admin}, Roles: {sorted(current_user.role_names)}")
         
         # Get all members ordered by lastname, firstname
         members = db.session.scalars(
@@ -532,11 +527,14 @@ def admin_import_users():
             
             # Commit all changes
             if imported_count > 0:
+                from app.audit_events import label_audit_batch
+                description = f'Imported {imported_count} members via CSV'
+                batched = label_audit_batch(db.session, description)
                 db.session.commit()
                 
-                # Audit log bulk operation
-                audit_log_bulk_operation('BULK_CREATE', 'Member', imported_count, 
-                                       f'Imported {imported_count} members via CSV')
+                # Without session-event auditing, log a summary of the import
+                if not batched:
+                    audit_log_bulk_operation('BULK_CREATE', 'Member', imported_count, description)
             
             # Show results
             if imported_count > 0:
@@ -754,7 +752,7 @@ def directory():
     Display member directory with AJAX-powered search and pagination
     """
     try:
-        current_app.logger.info(f"User {current_user.id} accessing directory. Is admin: {current_user.is_admin}, Roles: {[role.name for role in current_user.roles]}")
+        current_app.logger.info(f"User {current_user.id} accessing directory. Is admin: {current_user.is_admin}, Roles: {sorted(current_user.role_names)}")
         
         # Template will load members via AJAX for consistent pagination behavior
         return render_template('member_directory.html')
@@ -836,10 +834,7 @@ def api_search_members():
         
         # Determine if user should see admin data and if pending members should be included
         # Admin users have access to everything, or check for User Manager role
-        show_admin_data = current_user.is_authenticated and (
-            current_user.is_admin or 
-            any(role.name == 'User Manager' for role in current_user.roles)
-        )
+        show_admin_data = current_user.is_authenticated and current_user.has_role('User Manager')
         include_pending = route_context == 'manage_members' and show_admin_data
         
         # Build base query based on route context and permissions
@@ -106,10 +106,19 @@ The Bowls Club Team
         return False
 
 
+# Filtered admin menus keyed by (id of the configured menu, frozenset of role names);
+# each entry keeps the menu it was built from so a replaced config is never matched
+_admin_menu_cache = {}
+ADMIN_MENU_CACHE_MAX_ENTRIES = 128
+
+
 def filter_admin_menu_by_roles(user):
     """
     Filter admin menu items based on user roles.
     
+    The result is memoised per distinct role set and shared between callers,
+    so it must not be modified.
+    
     Args:
         user: Current user object with roles attribute
         
@@ -127,9 +136,29 @@ def filter_admin_menu_by_roles(user):
     if not user.is_authenticated:
         return []
     
-    # Get user's role names
-    user_role_names = [role.name for role in user.roles]
+    key = (id(admin_menu), user.role_names)
+    cached = _admin_menu_cache.get(key)
+    if cached is not None and cached[0] is admin_menu:
+        return cached[1]
     
+    menu = _build_admin_menu(admin_menu, user.role_names)
+    if len(_admin_menu_cache) >= ADMIN_MENU_CACHE_MAX_ENTRIES:
+        _admin_menu_cache.clear()
+    _admin_menu_cache[key] = (admin_menu, menu)
+    return menu
+
+
+def _build_admin_menu(admin_menu, user_role_names):
+    """
+    Build the admin menu for a set of role names.
+    
+    Args:
+        admin_menu: Configured ADMIN_MENU_ITEMS (None entries are separators)
+        user_role_names: frozenset of the user's role names
+        
+    Returns:
+        List of menu items with redundant separators removed
+    """
     # Filter menu items based on roles
     filtered_menu = []
     for item in admin_menu:
@@ -145,7 +174,7 @@ def filter_admin_menu_by_roles(user):
                 continue
                 
             # Check if user has any of the required roles
-            if any(role in user_role_names for role in required_roles):
+            if not user_role_names.isdisjoint(required_roles):
                 filtered_menu.append(item)
     
     # Clean up consecutive separators and trailing separators
@@ -5,6 +5,7 @@ from typing import Optional
 # Third-party imports
 import sqlalchemy as sa
 import sqlalchemy.orm as so
+from flask import g, has_request_context
 from flask_login import UserMixin
 from sqlalchemy import Table, Column, Integer, String, ForeignKey
 from sqlalchemy.orm import relationship
@@ -65,6 +66,7 @@ class Member(UserMixin, db.Model):
     last_login: so.Mapped[Optional[datetime]] = so.mapped_column(sa.DateTime, nullable=True)  # Last successful login
     last_seen: so.Mapped[Optional[date]] = so.mapped_column(sa.Date, nullable=True)  # Last activity date (daily updates only)
     lockout: so.Mapped[bool] = so.mapped_column(sa.Boolean, default=False, nullable=False)  # User lockout status
+    calendar_token: so.Mapped[Optional[str]] = so.mapped_column(sa.String(64), unique=True, index=True, nullable=True)  # Secret for the personal .ics feed
     roles = relationship('Role', secondary=member_roles, back_populates='members')
     
     # Many-to-many relationship with events (as event manager)
@@ -83,16 +85,29 @@ class Member(UserMixin, db.Model):
             return False
         return check_password_hash(self.password_hash, password)
     
+    @property
+    def role_names(self) -> frozenset:
+        """
+        Frozen set of the member's role names.
+
+        Built once per request and held on flask.g, so repeated role checks during a
+        request are set lookups; changes to the roles collection drop the entry.
+        """
+        if not has_request_context() or self.id is None:
+            return frozenset(role.name for role in self.roles)
+        cache = g.setdefault('member_role_names', {})
+        if self.id not in cache:
+            cache[self.id] = frozenset(role.name for role in self.roles)
+        return cache[self.id]
+
     def has_role(self, role_name):
         """Check if the member has a specific role."""
         # Admin users have all roles
-        if self.is_admin:
-            return True
-        
-        for role in self.roles:
-            if role.name == role_name:
-                return True
-        return False
+        return self.is_admin or role_name in self.role_names
+
+    def has_any_role(self, *role_names):
+        """Check if the member has at least one of the given roles."""
+        return self.is_admin or not self.role_names.isdisjoint(role_names)
     
     @staticmethod
     def is_bootstrap_mode():
@@ -101,7 +116,17 @@ class Member(UserMixin, db.Model):
 
 @login.user_loader
 def load_user(id):
-    return db.session.get(Member, int(id))
+    # Roles come with the member so permission checks never lazy-load them
+    return db.session.get(Member, int(id), options=[so.joinedload(Member.roles)])
+
+
+@sa.event.listens_for(Member.roles, 'append')
+@sa.event.listens_for(Member.roles, 'remove')
+@sa.event.listens_for(Member.roles, 'bulk_replace')
+def _forget_role_names(member, *args):
+    """Drop a member's cached role names when their roles change mid-request."""
+    if has_request_context():
+        g.get('member_role_names', {}).pop(member.id, None)
 
 class Post(db.Model):
     __tablename__ = 'posts'
@@ -258,12 +283,13 @@ class Booking(db.Model):
 
     # Core booking fields
     id: so.Mapped[int] = so.mapped_column(sa.Integer, primary_key=True)
-    booking_date: so.Mapped[date] = so.mapped_column(sa.Date, nullable=False)
-    session: so.Mapped[int] = so.mapped_column(sa.Integer, nullable=False)
-    rink_count: so.Mapped[int] = so.mapped_column(sa.Integer, nullable=False, default=1)
+    # active_history on the rink-usage columns so the occupancy index sees the old values on edit
+    booking_date: so.Mapped[date] = so.mapped_column(sa.Date, nullable=False, active_history=True)
+    session: so.Mapped[int] = so.mapped_column(sa.Integer, nullable=False, active_history=True)
+    rink_count: so.Mapped[int] = so.mapped_column(sa.Integer, nullable=False, default=1, active_history=True)
     priority: so.Mapped[Optional[str]] = so.mapped_column(sa.String(50), nullable=True)
     vs: so.Mapped[Optional[str]] = so.mapped_column(sa.String(128), nullable=True)  # Opposition team name
-    home_away: so.Mapped[Optional[str]] = so.mapped_column(sa.String(10), nullable=True)  # 'home', 'away', or 'neutral'
+    home_away: so.Mapped[Optional[str]] = so.mapped_column(sa.String(10), nullable=True, active_history=True)  # 'home', 'away', or 'neutral'
     
     # Event fields (migrated from Event model)
     name: so.Mapped[str] = so.mapped_column(sa.String(256), nullable=False)
@@ -277,7 +303,7 @@ class Booking(db.Model):
     has_pool: so.Mapped[bool] = so.mapped_column(sa.Boolean, nullable=False, default=False)
     
     # Series grouping fields (new functionality)
-    series_id: so.Mapped[Optional[str]] = so.mapped_column(sa.String(36), nullable=True)  # UUID for grouping related bookings
+    series_id: so.Mapped[Optional[str]] = so.mapped_column(sa.String(36), nullable=True, index=True)  # UUID for grouping related bookings (Series.id)
     series_name: so.Mapped[Optional[str]] = so.mapped_column(sa.String(256), nullable=True)  # Display name for series (stored in primary booking)
     series_commitment_required: so.Mapped[bool] = so.mapped_column(sa.Boolean, nullable=False, default=False)
     
@@ -295,6 +321,11 @@ class Booking(db.Model):
     
     # Many-to-many relationship with booking managers (Members with Event Manager role)
     booking_managers: so.Mapped[list['Member']] = so.relationship('Member', secondary=booking_member_managers, back_populates='managed_bookings')
+    
+    # Series this booking belongs to (kept in step with series_id by app/bookings/series.py)
+    series: so.Mapped[Optional['Series']] = so.relationship(
+        'Series', primaryjoin='foreign(Booking.series_id) == Series.id', viewonly=True
+    )
 
     def __repr__(self):
         return f"<Booking id={self.id}, name='{self.name}', date={self.booking_date}, type={self.event_type}, series={self.series_id}>"
@@ -420,19 +451,9 @@ class Booking(db.Model):
         if self.series_name:
             return self.series_name
             
-        # Otherwise, find the primary booking in the series and get its series_name
-        from app import db
-        import sqlalchemy as sa
-        
-        primary_booking = db.session.scalar(
-            sa.select(Booking)
-            .where(Booking.series_id == self.series_id)
-            .where(Booking.series_name.isnot(None))
-            .limit(1)
-        )
-        
-        if primary_booking and primary_booking.series_name:
-            return primary_booking.series_name
+        # Otherwise use the name held on the series
+        if self.series and self.series.name:
+            return self.series.name
             
         # Fallback to the old behavior if no series_name is set
         return f"{self.name} (Series)"
@@ -464,9 +485,78 @@ class Booking(db.Model):
         if not self.series_id:
             return True  # Single bookings are their own primary
         
-        from app.bookings.utils import get_primary_booking_in_series
-        primary = get_primary_booking_in_series(self.series_id)
-        return primary and primary.id == self.id
+        return self.series is not None and self.series.primary_booking_id == self.id
+
+
+class Series(db.Model):
+    """
+    A group of related bookings (league, recurring event) sharing Booking.series_id.
+    Holds the series name and its primary (earliest) booking, whose organizer and pool
+    the rest of the series shares. Maintained whenever a Booking or Pool is flushed
+    (see app/bookings/series.py), so series lookups are a single primary-key get.
+    """
+    __tablename__ = 'booking_series'
+
+    id: so.Mapped[str] = so.mapped_column(sa.String(36), primary_key=True)
+    name: so.Mapped[Optional[str]] = so.mapped_column(sa.String(256), nullable=True)
+    primary_booking_id: so.Mapped[Optional[int]] = so.mapped_column(sa.Integer, sa.ForeignKey('bookings.id', ondelete='SET NULL'), nullable=True)
+    organizer_id: so.Mapped[Optional[int]] = so.mapped_column(sa.Integer, sa.ForeignKey('member.id', ondelete='SET NULL'), nullable=True)
+    pool_id: so.Mapped[Optional[int]] = so.mapped_column(sa.Integer, sa.ForeignKey('pools.id', ondelete='SET NULL'), nullable=True)
+
+    primary_booking: so.Mapped[Optional['Booking']] = so.relationship('Booking', foreign_keys=[primary_booking_id], viewonly=True)
+    organizer: so.Mapped[Optional['Member']] = so.relationship('Member', foreign_keys=[organizer_id], viewonly=True)
+    pool: so.Mapped[Optional['Pool']] = so.relationship('Pool', foreign_keys=[pool_id], viewonly=True)
+
+    def __repr__(self):
+        return f"<Series id='{self.id}', name='{self.name}', primary_booking_id={self.primary_booking_id}>"
+
+
+class RinkOccupancy(db.Model):
+    """
+    Rink occupancy index - total rinks used by home bookings per (date, session).
+    Maintained incrementally whenever a Booking is flushed (see app/bookings/occupancy.py),
+    so availability checks are a single primary-key lookup instead of a SUM over bookings.
+    """
+    __tablename__ = 'rink_occupancy'
+
+    booking_date: so.Mapped[date] = so.mapped_column(sa.Date, primary_key=True)
+    session: so.Mapped[int] = so.mapped_column(sa.Integer, primary_key=True)
+    used_rinks: so.Mapped[int] = so.mapped_column(sa.Integer, nullable=False, default=0)
+
+    def __repr__(self):
+        return f"<RinkOccupancy date={self.booking_date}, session={self.session}, used={self.used_rinks}>"
+
+
+class DataVersion(db.Model):
+    """
+    Change-version stamp for a group of tables (e.g. 'bookings').
+    Bumped in the same transaction as any mutation of the group (see app/bookings/versioning.py)
+    and used to derive ETags for conditional GETs.
+    """
+    __tablename__ = 'data_versions'
+
+    scope: so.Mapped[str] = so.mapped_column(sa.String(32), primary_key=True)
+    version: so.Mapped[int] = so.mapped_column(sa.Integer, nullable=False, default=0)
+
+    def __repr__(self):
+        return f"<DataVersion scope='{self.scope}', version={self.version}>"
+
+
+class MemberCalendarFeed(db.Model):
+    """
+    Cached iCalendar feed for one member.
+    Deleted in the same transaction as any change to the member's team assignments,
+    pool registrations or their linked bookings (see app/bookings/ical.py) and
+    rebuilt on the next feed request.
+    """
+    __tablename__ = 'member_calendar_feeds'
+
+    member_id: so.Mapped[int] = so.mapped_column(sa.Integer, sa.ForeignKey('member.id', ondelete='CASCADE'), primary_key=True)
+    body: so.Mapped[str] = so.mapped_column(sa.Text, nullable=False)
+    generated_at: so.Mapped[datetime] = so.mapped_column(sa.DateTime, default=datetime.utcnow, nullable=False)
+
+    def __repr__(self):
+        return f"<MemberCalendarFeed member_id={self.member_id}, generated_at={self.generated_at}>"
 
 
 class PolicyPage(db.Model):
@@ -25,12 +25,8 @@ def can_user_manage_pool(user: Member, pool: Pool) -> bool:
     if not user or not user.is_authenticated:
         return False
     
-    # Admin users can manage all pools
-    if user.has_role('Admin'):
-        return True
-    
-    # Event Managers can manage all pools
-    if user.has_role('Event Manager'):
+    # Admin users and Event Managers can manage all pools
+    if user.has_any_role('Admin', 'Event Manager'):
         return True
     
     # All pools are now booking-based - check if user is the organizer or can manage the booking
@@ -208,7 +204,7 @@ def get_pools_for_user(user: Member, include_managed: bool = True,
     
     if include_managed:
         # Pools for events the user manages (via Booking model)
-        if user.has_role('Event Manager') or user.has_role('Admin'):
+        if user.has_any_role('Event Manager', 'Admin'):
             # All pools
             all_pools = db.session.scalars(sa.select(Pool)).all()
             pool_ids.update(pool.id for pool in all_pools)
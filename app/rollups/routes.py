@@ -8,6 +8,7 @@ from app import db
 from app.models import Booking, Team, TeamMember, Member
 from app.forms import FlaskForm
 from app.audit import audit_log_create, audit_log_update, audit_log_delete
+from app.bookings.occupancy import reserve_rinks, RinkCapacityError
 
 
 @bp.route('/book', methods=['GET', 'POST'])
@@ -37,6 +38,14 @@ def book_rollup():
                 form.session.data = session
         
         if form.validate_on_submit():
+            # Hold the slot while checking there is a rink free
+            try:
+                reserve_rinks([(form.booking_date.data, form.session.data, 1, None)])
+            except RinkCapacityError:
+                db.session.rollback()
+                flash('No rinks are free for that session. Please choose another time.', 'error')
+                return render_template('book_rollup.html', form=form)
+            
             # Create the booking
             booking = Booking(
                 name=f"Roll-up {form.booking_date.data}",  # Required field
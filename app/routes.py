@@ -43,13 +43,9 @@ def role_required(*required_roles):
             if not current_user.is_authenticated:
                 return current_app.login_manager.unauthorized()
             
-            # Admin users bypass role checks
-            if current_user.is_admin:
-                return f(*args, **kwargs)
-            
-            # Check if user has any of the required roles
-            user_roles = [role.name for role in current_user.roles]
-            if not any(role in user_roles for role in required_roles):
+            # Check if user has any of the required roles (admin users bypass role checks)
+            if not current_user.has_any_role(*required_roles):
+                user_roles = sorted(current_user.role_names)
                 current_app.logger.warning(f"Access denied for user {current_user.username} with roles {user_roles} to resource requiring {required_roles}")
                 audit_log_security_event('ACCESS_DENIED', 
                                        f'User {current_user.username} with roles {user_roles} attempted to access resource requiring roles {required_roles}')
@@ -17,6 +17,20 @@ class Config:
     POSTS_STORAGE_PATH = os.path.join(SECURE_STORAGE_PATH, 'posts')
     ARCHIVE_STORAGE_PATH = os.path.join(SECURE_STORAGE_PATH, 'archive')
     POLICY_PAGES_STORAGE_PATH = os.path.join(SECURE_STORAGE_PATH, 'policy_pages')
+    
+    # Post images: seconds a member's browser may reuse an image without revalidating, and
+    # optional hand-off of the transfer to the front-end server after the access checks:
+    # '' (serve from Flask), 'x-sendfile' (Apache/lighttpd) or 'x-accel-redirect' (nginx,
+    # with an internal location at POST_IMAGE_ACCEL_PREFIX aliased to POSTS_STORAGE_PATH)
+    POST_IMAGE_MAX_AGE = 3600
+    POST_IMAGE_OFFLOAD = os.environ.get('POST_IMAGE_OFFLOAD', '')
+    POST_IMAGE_ACCEL_PREFIX = '/protected/posts/'
+    
+    # Post image variants rendered at upload: name -> maximum width in pixels
+    POST_IMAGE_VARIANTS = {'thumb': 320, 'card': 800, 'full': 1600}
+    POST_IMAGE_DEFAULT_VARIANT = 'full'  # Served when no ?size= is given
+    POST_IMAGE_VARIANT_QUALITY = 82  # JPEG quality of variants
+    POST_IMAGE_VARIANT_WORKERS = 2  # Worker processes rendering variants (0 = render inline)
 
     # Email configuration
     MAIL_SERVER = os.environ.get('MAIL_SERVER')
@@ -71,6 +85,10 @@ class Config:
 # How many rinks are there for booking
     RINKS = 6
 
+# Calendar JSON response cache (per process; 0 disables)
+    CALENDAR_CACHE_MAX_ENTRIES = 256  # Maximum cached date windows
+    CALENDAR_CACHE_TTL_SECONDS = 60  # Upper bound on staleness across worker processes
+
 # How many daily sessions are there 
     DAILY_SESSIONS = {
         1: "10:00am - 1:00pm", 
@@ -140,6 +158,41 @@ class Config:
         6: 'event',    # Other - default to event-level
     }
     
+    # Recurring booking generator (admin "Repeat" action)
+    BOOKING_RECURRENCE_INTERVALS = {
+        "Weekly": 7,
+        "Fortnightly": 14
+    }
+    BOOKING_RECURRENCE_MAX_OCCURRENCES = 60  # Upper bound on bookings created by one rule
+    
+    # Admin event list
+    ADMIN_BOOKINGS_PAST_DAYS = 30  # Default days of past events to include
+    ADMIN_BOOKINGS_PER_PAGE = 50
+    
+    # Upcoming events page and API
+    UPCOMING_EVENTS_WINDOW_DAYS = 180  # Default days ahead to list events with pools
+    UPCOMING_EVENTS_PER_PAGE = 25
+    
+    # Activity tracking: seconds between bulk last_seen writes (0 = only on explicit flush)
+    LAST_SEEN_FLUSH_SECONDS = 60
+    
+    # Seconds a worker may serve cached footer policy links edited in another process
+    FOOTER_POLICY_PAGES_CACHE_SECONDS = 300
+    
+    # Sanitized post and policy page HTML kept in memory per worker (0 = read the file every view)
+    CONTENT_HTML_CACHE_MAX_ENTRIES = 128
+    
+    # Audit log writer: records queued before callers block waiting for the file writer
+    AUDIT_LOG_QUEUE_SIZE = 10000
+    AUDIT_LOG_MAX_BYTES = 10 * 1024 * 1024  # Roll audit.log into a gzip archive at this size
+    AUDIT_LOG_BACKUP_COUNT = 0  # Archives to keep (0 = keep all)
+    
+    # Session-event auditing: log inserts/updates/deletes of these models once per commit
+    AUDIT_SESSION_EVENTS = os.environ.get('AUDIT_SESSION_EVENTS', 'False').lower() == 'true'
+    AUDIT_SESSION_MODELS = (
+        'Member', 'Role', 'Post', 'PolicyPage', 'Booking', 'Pool', 'PoolRegistration', 'Team', 'TeamMember'
+    )
+    
     # Rate Limiting Configuration
     RATE_LIMIT_PER_DAY = "1000 per day"
     RATE_LIMIT_PER_HOUR = "500 per hour"
@@ -174,6 +227,8 @@ class TestingConfig(Config):
     SQLALCHEMY_DATABASE_URI = 'sqlite:///:memory:'
     WTF_CSRF_ENABLED = False
     SESSION_COOKIE_SECURE = False  # Allow HTTP in testing
+    LAST_SEEN_FLUSH_SECONDS = 0  # Tests flush the activity buffer explicitly
+    POST_IMAGE_VARIANT_WORKERS = 0  # Render image variants inline
 
 
 class ProductionConfig(Config):
@@ -0,0 +1,37 @@
+"""Add rink_occupancy index table
+
+Revision ID: 5c1f9a7d2e40
+Revises: a1951ef08ab2
+Create Date: 2026-10-16 09:12:31.204118
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '5c1f9a7d2e40'
+down_revision = 'a1951ef08ab2'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table('rink_occupancy',
+    sa.Column('booking_date', sa.Date(), nullable=False),
+    sa.Column('session', sa.Integer(), nullable=False),
+    sa.Column('used_rinks', sa.Integer(), nullable=False),
+    sa.PrimaryKeyConstraint('booking_date', 'session')
+    )
+
+    # Backfill from existing bookings - away games do not occupy home rinks
+    op.execute(
+        "INSERT INTO rink_occupancy (booking_date, session, used_rinks) "
+        "SELECT booking_date, session, SUM(rink_count) FROM bookings "
+        "WHERE home_away IS NULL OR home_away != 'away' "
+        "GROUP BY booking_date, session"
+    )
+
+
+def downgrade():
+    op.drop_table('rink_occupancy')
@@ -0,0 +1,55 @@
+"""Add booking_series table and index bookings.series_id
+
+Revision ID: b6f4e2a8c710
+Revises: 3d7a0c5e9f12
+Create Date: 2026-10-16 16:21:07.532904
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'b6f4e2a8c710'
+down_revision = '3d7a0c5e9f12'
+branch_labels = None
+depends_on = '338b3af821c4'  # Backfill reads bookings.series_name, added on the other head
+
+
+def upgrade():
+    op.create_table('booking_series',
+    sa.Column('id', sa.String(length=36), nullable=False),
+    sa.Column('name', sa.String(length=256), nullable=True),
+    sa.Column('primary_booking_id', sa.Integer(), nullable=True),
+    sa.Column('organizer_id', sa.Integer(), nullable=True),
+    sa.Column('pool_id', sa.Integer(), nullable=True),
+    sa.ForeignKeyConstraint(['primary_booking_id'], ['bookings.id'], ondelete='SET NULL'),
+    sa.ForeignKeyConstraint(['organizer_id'], ['member.id'], ondelete='SET NULL'),
+    sa.ForeignKeyConstraint(['pool_id'], ['pools.id'], ondelete='SET NULL'),
+    sa.PrimaryKeyConstraint('id')
+    )
+    with op.batch_alter_table('bookings', schema=None) as batch_op:
+        batch_op.create_index(batch_op.f('ix_bookings_series_id'), ['series_id'], unique=False)
+
+    # Backfill one row per existing series - the primary booking is the earliest by
+    # date then id; the name comes from the primary, else any booking that has one
+    op.execute(
+        "INSERT INTO booking_series (id, name, primary_booking_id, organizer_id, pool_id) "
+        "SELECT ranked.series_id, "
+        "COALESCE(ranked.series_name, "
+        "(SELECT MIN(named.series_name) FROM bookings AS named "
+        "WHERE named.series_id = ranked.series_id AND named.series_name IS NOT NULL)), "
+        "ranked.id, ranked.organizer_id, pools.id "
+        "FROM (SELECT id, series_id, series_name, organizer_id, "
+        "ROW_NUMBER() OVER (PARTITION BY series_id ORDER BY booking_date, id) AS position "
+        "FROM bookings WHERE series_id IS NOT NULL) AS ranked "
+        "LEFT OUTER JOIN pools ON pools.booking_id = ranked.id "
+        "WHERE ranked.position = 1"
+    )
+
+
+def downgrade():
+    with op.batch_alter_table('bookings', schema=None) as batch_op:
+        batch_op.drop_index(batch_op.f('ix_bookings_series_id'))
+
+    op.drop_table('booking_series')
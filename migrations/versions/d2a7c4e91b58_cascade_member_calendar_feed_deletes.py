@@ -0,0 +1,38 @@
+"""Delete cached calendar feeds with their member
+
+Revision ID: d2a7c4e91b58
+Revises: b6f4e2a8c710
+Create Date: 2026-10-16 22:41:18.604392
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'd2a7c4e91b58'
+down_revision = 'b6f4e2a8c710'
+branch_labels = None
+depends_on = None
+
+
+def _create_member_calendar_feeds(**foreign_key_options):
+    op.create_table('member_calendar_feeds',
+    sa.Column('member_id', sa.Integer(), nullable=False),
+    sa.Column('body', sa.Text(), nullable=False),
+    sa.Column('generated_at', sa.DateTime(), nullable=False),
+    sa.ForeignKeyConstraint(['member_id'], ['member.id'], **foreign_key_options),
+    sa.PrimaryKeyConstraint('member_id')
+    )
+
+
+def upgrade():
+    # The table only caches feed bodies that are rebuilt on the next request, so it is
+    # recreated rather than altered (its foreign key was created without a name)
+    op.drop_table('member_calendar_feeds')
+    _create_member_calendar_feeds(ondelete='CASCADE')
+
+
+def downgrade():
+    op.drop_table('member_calendar_feeds')
+    _create_member_calendar_feeds()
@@ -4,6 +4,8 @@ Test configuration and fixtures for the Bowls Club application.
 import pytest
 import tempfile
 import os
+from contextlib import contextmanager
+import sqlalchemy as sa
 from app import create_app, db
 from app.models import Member, Role, Booking, Pool, PoolRegistration, Team, TeamMember
 from tests.fixtures.factories import BookingFactory, MemberFactory, AdminMemberFactory, FullMemberFactory, PendingMemberFactory
@@ -55,6 +57,25 @@ def runner(app):
     return app.test_cli_runner()
 
 
+@pytest.fixture
+def count_queries(app):
+    """Context manager factory that records SQL statements executed inside its block."""
+    @contextmanager
+    def counter():
+        statements = []
+        
+        def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+            statements.append(statement)
+        
+        sa.event.listen(db.engine, 'before_cursor_execute', before_cursor_execute)
+        try:
+            yield statements
+        finally:
+            sa.event.remove(db.engine, 'before_cursor_execute', before_cursor_execute)
+    
+    return counter
+
+
 @pytest.fixture
 def db_session(app):
     """Create database session for testing."""
@@ -75,6 +96,9 @@ def db_session(app):
             db.session.rollback()
         finally:
             db.session.remove()
+            # Core deletes bypass the session hooks that invalidate cached calendar JSON
+            from app.bookings.cache import calendar_cache
+            calendar_cache.clear()
 
 
 @pytest.fixture
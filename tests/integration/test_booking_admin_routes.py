@@ -3,7 +3,8 @@ Integration tests for booking admin routes.
 """
 import pytest
 from datetime import date, timedelta
-from app.models import Member, Booking, Team, TeamMember
+from app.models import Member, Booking, Team, TeamMember, Pool, PoolRegistration
+from app.bookings.utils import get_booking_list_stats
 from tests.fixtures.factories import MemberFactory, BookingFactory
 
 
@@ -282,4 +283,163 @@ class TestBookingAdminRoutes:
                                   follow_redirects=True)
         
         assert response.status_code == 200
-        assert b'Booking not found.' in response.data
\ No newline at end of file
+        assert b'Booking not found.' in response.data
+    
+    def test_repeat_booking_weekly(self, admin_client, db_session, count_queries):
+        """Test the repeat action creates weekly copies in one series, honouring skip dates."""
+        from app.models import Pool, RinkOccupancy
+        import sqlalchemy as sa
+        
+        start = date.today() + timedelta(days=7)
+        booking = BookingFactory.create(name='Club Night', booking_date=start, session=4,
+                                        rink_count=2, event_type=1, has_pool=True)
+        db_session.add(Pool(booking_id=booking.id, is_open=True, max_players=16))
+        db_session.commit()
+        
+        form_data = {
+            'action': 'repeat',
+            'repeat_interval': '7',
+            'repeat_session': '4',
+            'repeat_until': (start + timedelta(weeks=10)).isoformat(),
+            'repeat_skip_dates': (start + timedelta(weeks=3)).isoformat(),
+            'csrf_token': 'dummy'
+        }
+        with count_queries() as statements:
+            response = admin_client.post(f'/bookings/admin/manage/{booking.id}', data=form_data)
+        
+        assert response.status_code == 302
+        assert len([s for s in statements if s.startswith('INSERT INTO bookings')]) == 1
+        
+        db_session.refresh(booking)
+        series = db_session.scalars(
+            sa.select(Booking).where(Booking.series_id == booking.series_id).order_by(Booking.booking_date)
+        ).all()
+        assert booking.series_id is not None
+        assert len(series) == 10
+        assert start + timedelta(weeks=3) not in [b.booking_date for b in series]
+        assert all(b.name == 'Club Night' and b.rink_count == 2 and b.session == 4 for b in series)
+        # Social events use per-booking pools
+        assert all(b.pool is not None and b.pool.max_players == 16 for b in series)
+        assert db_session.get(RinkOccupancy, (start + timedelta(weeks=10), 4)).used_rinks == 2
+    
+    def test_repeat_booking_pools_only_new_occurrences(self, admin_client, db_session):
+        """Test per-booking pools go to the inserted copies, not older series bookings on the same dates."""
+        from app.models import Pool
+        
+        start = date.today() + timedelta(days=7)
+        booking = BookingFactory.create(name='Club Night', booking_date=start, session=4, rink_count=1,
+                                        event_type=1, has_pool=True, series_id='club-night-series')
+        db_session.add(Pool(booking_id=booking.id, is_open=True, max_players=16))
+        existing = BookingFactory.create(name='Club Night', booking_date=start + timedelta(weeks=1), session=4,
+                                         rink_count=1, event_type=1, series_id='club-night-series')
+        
+        form_data = {
+            'action': 'repeat',
+            'repeat_interval': '7',
+            'repeat_session': '4',
+            'repeat_until': (start + timedelta(weeks=2)).isoformat(),
+            'csrf_token': 'dummy'
+        }
+        response = admin_client.post(f'/bookings/admin/manage/{booking.id}', data=form_data)
+        
+        assert response.status_code == 302
+        db_session.expire_all()
+        assert existing.pool is None
+        copies = db_session.query(Booking).filter(Booking.id.notin_([booking.id, existing.id])).all()
+        assert len(copies) == 2
+        assert all(copy.pool is not None for copy in copies)
+    
+    def test_repeat_booking_rejected_on_conflict(self, admin_client, db_session):
+        """Test no repeats are created when any occurrence lacks rinks."""
+        start = date.today() + timedelta(days=7)
+        booking = BookingFactory.create(booking_date=start, session=1, rink_count=3)
+        BookingFactory.create(booking_date=start + timedelta(weeks=4), session=1, rink_count=4)
+        
+        form_data = {
+            'action': 'repeat',
+            'repeat_interval': '14',
+            'repeat_session': '1',
+            'repeat_until': (start + timedelta(weeks=8)).isoformat(),
+            'csrf_token': 'dummy'
+        }
+        response = admin_client.post(f'/bookings/admin/manage/{booking.id}', data=form_data,
+                                     follow_redirects=True)
+        
+        assert b'Not enough rinks available on' in response.data
+        assert db_session.query(Booking).count() == 2
+        db_session.refresh(booking)
+        assert booking.series_id is None
+    
+    def test_list_bookings_default_window_and_pages(self, admin_client, db_session, app):
+        """Test the event list hides old events and pages the rest."""
+        BookingFactory.create(name='Ancient Fixture', booking_date=date.today() - timedelta(days=90))
+        BookingFactory.create(name='Recent Fixture', booking_date=date.today() - timedelta(days=10))
+        for i in range(3):
+            BookingFactory.create(name=f'Future Fixture {i}', booking_date=date.today() + timedelta(days=i + 1))
+        app.config['ADMIN_BOOKINGS_PER_PAGE'] = 2
+        
+        try:
+            first = admin_client.get('/bookings/admin/list')
+            last = admin_client.get('/bookings/admin/list?page=2')
+            everything = admin_client.get(f'/bookings/admin/list?from={(date.today() - timedelta(days=365)).isoformat()}&page=3')
+        finally:
+            app.config['ADMIN_BOOKINGS_PER_PAGE'] = 50
+        
+        assert first.status_code == 200
+        assert b'Ancient Fixture' not in first.data
+        assert b'Recent Fixture' in first.data and b'Future Fixture 0' in first.data
+        assert b'Future Fixture 1' in last.data and b'Future Fixture 2' in last.data
+        assert b'Future Fixture 2' in everything.data
+    
+    def test_list_booking_stats_from_one_query(self, db_session, count_queries):
+        """Test team counts and own/shared pool stats are computed in a single statement."""
+        series_id = 'series-stats'
+        primary = BookingFactory.create(booking_date=date.today() + timedelta(days=1), series_id=series_id, event_type=3)
+        follower = BookingFactory.create(booking_date=date.today() + timedelta(days=8), series_id=series_id, event_type=3)
+        friendly = BookingFactory.create(booking_date=date.today() + timedelta(days=2), series_id='series-friendly', event_type=4)
+        single = BookingFactory.create(booking_date=date.today() + timedelta(days=3))
+        pool = Pool(booking_id=primary.id, is_open=True)
+        db_session.add(pool)
+        db_session.add(Pool(booking_id=BookingFactory.create(booking_date=date.today(), series_id='series-friendly', event_type=4).id))
+        db_session.flush()
+        for member in MemberFactory.create_batch(2):
+            db_session.add(PoolRegistration(pool_id=pool.id, member_id=member.id))
+        for name in ('Rink 1', 'Rink 2'):
+            db_session.add(Team(booking_id=single.id, team_name=name, created_by=single.organizer_id))
+        db_session.commit()
+        bookings = [primary, follower, friendly, single]
+        for booking in bookings:
+            db_session.refresh(booking)
+        
+        with count_queries() as statements:
+            stats = get_booking_list_stats(bookings)
+        
+        assert len(statements) == 1
+        assert stats[primary.id]['has_own_pool'] and stats[primary.id]['pool_members'] == 2
+        assert stats[follower.id]['has_shared_pool'] and stats[follower.id]['pool_members'] == 2
+        assert not stats[friendly.id]['has_pool']  # Friendlies register per game
+        assert stats[single.id]['total_teams'] == 2 and not stats[single.id]['has_pool']
+    
+    def test_manage_booking_series_dropdown_queries_are_constant(self, admin_client, db_session, count_queries):
+        """Test the join-a-series choices are loaded without a query per series."""
+        booking = BookingFactory.create(name='Club Night', booking_date=date.today() + timedelta(days=1))
+        
+        def add_series(count, offset):
+            for i in range(offset, offset + count):
+                for week in range(3):
+                    BookingFactory.create(name=f'League {i}', booking_date=date.today() + timedelta(days=7 * week + 2),
+                                          series_id=f'series-{i}', series_name=f'League {i}' if week == 0 else None)
+        
+        def measure():
+            db_session.expire_all()
+            with count_queries() as statements:
+                response = admin_client.get(f'/bookings/admin/manage/{booking.id}')
+            assert response.status_code == 200
+            return len(statements)
+        
+        add_series(1, 0)
+        measure()  # Warm up per-client state such as the session user
+        few = measure()
+        add_series(5, 1)
+        
+        assert measure() == few
@@ -185,6 +185,23 @@ class TestBookingOrganizerPermissions:
             response = global_manager_client.get(f'/bookings/admin/manage/{booking.id}')
             assert response.status_code == 200
     
+    @pytest.mark.parametrize('path', ['/bookings/admin/manage/{booking}', '/bookings/admin/list', '/pools/manage/{pool}'])
+    def test_role_checks_do_not_query(self, global_manager_client, global_event_manager, test_bookings, test_pool,
+                                      db_session, count_queries, path):
+        """Test roles are read once with the user and every later role check is answered from memory."""
+        url = path.format(booking=test_bookings[0].id, pool=test_pool.id)
+        global_event_manager.last_seen = date.today()  # Skip the once-a-day activity write
+        db_session.commit()
+        db_session.expunge_all()  # Start from an empty identity map, as a real request does
+        
+        with count_queries() as statements:
+            response = global_manager_client.get(url)
+        
+        role_statements = [statement for statement in statements if 'member_roles' in statement]
+        assert response.status_code == 200
+        assert len(role_statements) == 1
+        assert 'FROM member LEFT OUTER JOIN' in role_statements[0]  # Loaded with the user, not lazily
+    
     def test_admin_can_access_all_bookings(self, admin_client, test_bookings):
         """Test that admin users can access all bookings."""
         booking1, booking2, booking3 = test_bookings
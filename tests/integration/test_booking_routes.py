@@ -4,7 +4,7 @@ Integration tests for main booking routes.
 import pytest
 import json
 from datetime import date, timedelta
-from app.models import Member, Booking, Team, TeamMember
+from app.models import Member, Booking, Team, TeamMember, Pool, PoolRegistration
 from tests.fixtures.factories import MemberFactory, BookingFactory
 
 
@@ -120,7 +120,207 @@ class TestBookingRoutes:
         assert date2.isoformat() in data['bookings']
         assert data['rinks'] == 6
         assert '1' in data['sessions']  # Session 1 exists in config
-    
+
+    def test_get_bookings_range_query_count_is_flat(self, authenticated_client, db_session, count_queries):
+        """Test get_bookings_range issues the same number of queries however many bookings are in range."""
+        from app.models import Team, TeamMember
+
+        start = date.today() + timedelta(days=1)
+        url = f'/bookings/get_bookings_range/{start.isoformat()}/{(start + timedelta(days=27)).isoformat()}'
+
+        def add_rollups(count, offset):
+            for i in range(count):
+                organizer = MemberFactory.create(status='Full')
+                booking = BookingFactory.create(
+                    booking_date=start + timedelta(days=offset + i),
+                    session=1, rink_count=1, organizer=organizer, booking_type='rollup'
+                )
+                team = Team(booking_id=booking.id, team_name='Roll-up', created_by=organizer.id)
+                db_session.add(team)
+                db_session.flush()
+                for _ in range(3):
+                    db_session.add(TeamMember(team_id=team.id, member_id=MemberFactory.create().id, position='Player'))
+                BookingFactory.create(booking_date=start + timedelta(days=offset + i), session=2,
+                                      organizer=MemberFactory.create())
+            db_session.commit()
+
+        # Warm-up request so per-day activity tracking does not skew the counts
+        authenticated_client.get(url)
+
+        add_rollups(2, 0)
+        with count_queries() as small:
+            response = authenticated_client.get(url)
+        assert response.status_code == 200
+
+        add_rollups(10, 2)
+        with count_queries() as large:
+            response = authenticated_client.get(url)
+        data = json.loads(response.data)
+
+        assert len(data['bookings']) == 12
+        rollups = [b for day in data['bookings'].values() for b in day['1']]
+        assert all(b['player_count'] == 3 for b in rollups)
+        assert len(large) == len(small)
+
+    def test_get_bookings_range_conditional_get(self, authenticated_client, db_session, count_queries):
+        """Test get_bookings_range answers If-None-Match with 304 until bookings change."""
+        booking_date = date.today() + timedelta(days=2)
+        booking = BookingFactory.create(booking_date=booking_date, session=1, rink_count=2)
+        url = f'/bookings/get_bookings_range/{booking_date.isoformat()}/{booking_date.isoformat()}'
+
+        response = authenticated_client.get(url)
+        assert response.status_code == 200
+        etag = response.headers['ETag']
+        assert response.headers['Cache-Control'] == 'private, no-cache'
+
+        with count_queries() as statements:
+            response = authenticated_client.get(url, headers={'If-None-Match': etag})
+        assert response.status_code == 304
+        assert response.headers['ETag'] == etag
+        assert not any('bookings' in statement or 'teams' in statement for statement in statements)
+
+        booking.rink_count = 3
+        db_session.commit()
+
+        response = authenticated_client.get(url, headers={'If-None-Match': etag})
+        assert response.status_code == 200
+        assert response.headers['ETag'] != etag
+
+    def test_get_bookings_range_cache_invalidated_by_date(self, authenticated_client, db_session, count_queries):
+        """Test cached calendar windows are dropped only when a booking inside them changes."""
+        week_start = date.today() + timedelta(days=1)
+        week_end = week_start + timedelta(days=6)
+        booking = BookingFactory.create(booking_date=week_start, session=1, rink_count=2)
+        url = f'/bookings/get_bookings_range/{week_start.isoformat()}/{week_end.isoformat()}'
+
+        first = authenticated_client.get(url)
+        with count_queries() as statements:
+            second = authenticated_client.get(url)
+        assert second.data == first.data
+        assert not any('FROM bookings' in statement for statement in statements)
+
+        # A booking outside the window leaves the cached entry in place
+        BookingFactory.create(booking_date=week_end + timedelta(days=7), session=1)
+        with count_queries() as statements:
+            authenticated_client.get(url)
+        assert not any('FROM bookings' in statement for statement in statements)
+
+        # Editing a booking inside the window drops it
+        booking.rink_count = 4
+        db_session.commit()
+        data = json.loads(authenticated_client.get(url).data)
+        assert data['bookings'][week_start.isoformat()]['1'][0]['rink_count'] == 4
+
+        # Moving it out of the window is seen through the old date too
+        booking.booking_date = week_end + timedelta(days=1)
+        db_session.commit()
+        data = json.loads(authenticated_client.get(url).data)
+        assert data['bookings'] == {}
+
+    def test_get_bookings_range_organiser_rename(self, authenticated_client, db_session):
+        """Test renaming an organiser changes the ETag and the cached calendar payload."""
+        booking_date = date.today() + timedelta(days=3)
+        booking = BookingFactory.create(booking_date=booking_date, session=1)
+        url = f'/bookings/get_bookings_range/{booking_date.isoformat()}/{booking_date.isoformat()}'
+
+        response = authenticated_client.get(url)
+        etag = response.headers['ETag']
+
+        booking.organizer.firstname = 'Renamed'
+        db_session.commit()
+
+        response = authenticated_client.get(url, headers={'If-None-Match': etag})
+        assert response.status_code == 200
+        data = json.loads(response.data)
+        assert data['bookings'][booking_date.isoformat()]['1'][0]['organizer'].startswith('Renamed ')
+
+    def test_get_utilisation_matrix(self, authenticated_client, db_session, count_queries):
+        """Test get_utilisation returns a sessions-by-days matrix of home-game rinks."""
+        start = date.today() + timedelta(days=1)
+        end = start + timedelta(days=29)
+        BookingFactory.create(booking_date=start, session=1, rink_count=2)
+        BookingFactory.create(booking_date=start, session=1, rink_count=1, home_away='home')
+        BookingFactory.create(booking_date=start, session=1, rink_count=3, home_away='away')
+        BookingFactory.create(booking_date=end, session=3, rink_count=4)
+        BookingFactory.create(booking_date=end + timedelta(days=1), session=3, rink_count=4)
+
+        url = f'/bookings/get_utilisation/{start.isoformat()}/{end.isoformat()}'
+        authenticated_client.get('/bookings/')  # Settle per-day activity tracking
+        with count_queries() as statements:
+            response = authenticated_client.get(url)
+
+        assert response.status_code == 200
+        data = json.loads(response.data)
+        assert data['dates'][0] == start.isoformat()
+        assert len(data['dates']) == 30
+        assert data['sessions'] == [1, 2, 3, 4]
+        assert data['used'][0][0] == 3
+        assert data['used'][2][29] == 4
+        assert sum(map(sum, data['used'])) == 7
+        assert len([s for s in statements if 'FROM bookings' in s]) == 1
+
+    def test_get_utilisation_rejects_bad_range(self, authenticated_client):
+        """Test get_utilisation rejects reversed and oversized ranges."""
+        today = date.today()
+        response = authenticated_client.get(
+            f'/bookings/get_utilisation/{today.isoformat()}/{(today - timedelta(days=1)).isoformat()}')
+        assert response.status_code == 400
+
+        response = authenticated_client.get(
+            f'/bookings/get_utilisation/{today.isoformat()}/{(today + timedelta(days=400)).isoformat()}')
+        assert response.status_code == 400
+
+    def test_api_check_availability_batch(self, admin_client, db_session, count_queries):
+        """Test the availability API answers a batch of slots from one occupancy query."""
+        start = date.today() + timedelta(days=7)
+        BookingFactory.create(booking_date=start, session=1, rink_count=5)
+        slots = [
+            {'date': (start + timedelta(weeks=week)).isoformat(), 'session': 1, 'rinks': 2, 'home_away': 'home'}
+            for week in range(20)
+        ]
+
+        admin_client.get('/bookings/')  # Settle per-day activity tracking
+        with count_queries() as statements:
+            response = admin_client.post('/bookings/api/v1/availability', json={'slots': slots})
+
+        assert response.status_code == 200
+        data = json.loads(response.data)
+        assert data['all_available'] is False
+        assert data['conflicts'] == [0]
+        assert len(data['slots']) == 20
+        assert len([s for s in statements if 'rink_occupancy' in s]) == 1
+
+        response = admin_client.post('/bookings/api/v1/availability',
+                                     json={'slots': [{'date': 'bad', 'session': 1}]})
+        assert response.status_code == 400
+
+    def test_calendar_cache_stats_admin(self, admin_client):
+        """Test calendar cache stats endpoint for admins."""
+        response = admin_client.get('/bookings/admin/calendar_cache_stats')
+        assert response.status_code == 200
+        data = json.loads(response.data)
+        assert data['success'] is True
+        assert {'hits', 'misses', 'entries', 'evictions'} <= set(data['cache'])
+
+    def test_calendar_cache_dropped_on_another_process_write(self, app):
+        """Test the cache keeps date-targeted entries for its own commits but drops all for foreign versions."""
+        from datetime import date
+        from app.bookings.cache import CalendarCache
+        cache = CalendarCache(max_entries=8, ttl_seconds=60)
+        monday, friday = date(2026, 10, 12), date(2026, 10, 16)
+        cache.get(('day', monday), 5)
+        cache.set(('day', monday), '{"d": 12}', monday, monday, cache.generation, 5)
+        cache.set(('day', friday), '{"d": 16}', friday, friday, cache.generation, 5)
+
+        # This process's own commit drops only the window it touched
+        cache.commit_version({friday}, 5, 6)
+        assert cache.get(('day', monday), 6) == '{"d": 12}'
+        assert cache.get(('day', friday), 6) is None
+
+        # Another worker wrote a booking: this worker's copy must not go out tagged with version 7
+        assert cache.get(('day', monday), 7) is None
+        assert cache.stats()['entries'] == 0
+
     def test_book_rollup_requires_login(self, client):
         """Test book rollup page requires authentication."""
         response = client.get('/rollups/book')
@@ -317,4 +517,61 @@ class TestBookingRoutes:
         assert response.status_code == 200
         assert b'Manage Roll-Up' in response.data
         assert b'Test rollup' in response.data
-        assert b'Test User' in response.data  # Organizer name
\ No newline at end of file
+        assert b'Test User' in response.data  # Organizer name
+    
+    def _add_games(self, db_session, member, start, count):
+        """Give a member a team game, a roll-up invitation and an open pool per day."""
+        for i in range(count):
+            game_date = start + timedelta(days=i)
+            game = BookingFactory.create(booking_date=game_date, session=1, rink_count=1)
+            rollup = BookingFactory.create(booking_date=game_date, session=2, rink_count=1, booking_type='rollup')
+            pooled = BookingFactory.create(booking_date=game_date, session=3, rink_count=1, has_pool=True)
+            for booking in (game, rollup):
+                team = Team(booking_id=booking.id, team_name=f'Team {booking.id}', created_by=booking.organizer_id)
+                db_session.add(team)
+                db_session.flush()
+                db_session.add(TeamMember(team_id=team.id, member_id=member.id, position='Lead'))
+            pool = Pool(booking_id=pooled.id, is_open=True)
+            db_session.add(pool)
+            db_session.flush()
+            db_session.add(PoolRegistration(pool_id=pool.id, member_id=member.id))
+            db_session.add(PoolRegistration(pool_id=pool.id, member_id=pooled.organizer_id))
+        db_session.commit()
+    
+    def test_my_games_queries_do_not_grow_with_history(self, authenticated_client, db_session, test_member, count_queries):
+        """Test My Games renders in the same number of statements for short and long histories."""
+        self._add_games(db_session, test_member, date.today() + timedelta(days=1), 1)
+        authenticated_client.get('/bookings/my_games')  # Settle activity tracking
+        db_session.expire_all()
+        with count_queries() as short:
+            response = authenticated_client.get('/bookings/my_games')
+        assert response.status_code == 200
+        
+        self._add_games(db_session, test_member, date.today() + timedelta(days=10), 8)
+        db_session.expire_all()
+        with count_queries() as long:
+            response = authenticated_client.get('/bookings/my_games')
+        assert response.status_code == 200
+        
+        assert len(long) == len(short)
+        assert response.data.count(b'Roll-Up</span>') == 9
+        assert response.data.count(b'Pool Event') == 9
+    
+    def test_my_games_hides_pool_once_selected(self, authenticated_client, db_session, test_member):
+        """Test a pool registration is not listed once the member is in a team for that booking."""
+        booking = BookingFactory.create(name='Selected Match', booking_date=date.today() + timedelta(days=3), has_pool=True)
+        pool = Pool(booking_id=booking.id, is_open=True)
+        db_session.add(pool)
+        db_session.flush()
+        db_session.add(PoolRegistration(pool_id=pool.id, member_id=test_member.id))
+        team = Team(booking_id=booking.id, team_name='Rink 1', created_by=booking.organizer_id)
+        db_session.add(team)
+        db_session.flush()
+        db_session.add(TeamMember(team_id=team.id, member_id=test_member.id, position='Skip'))
+        db_session.commit()
+        
+        response = authenticated_client.get('/bookings/my_games')
+        
+        assert response.status_code == 200
+        assert b'Team Game' in response.data
+        assert b'Pool Event' not in response.data
@@ -0,0 +1,96 @@
+"""
+Integration tests for per-member iCalendar feeds.
+"""
+import pytest
+import sqlalchemy as sa
+from datetime import date, timedelta
+from app.models import MemberCalendarFeed, Team, TeamMember
+from tests.fixtures.factories import BookingFactory, MemberFactory
+
+
+@pytest.mark.integration
+class TestCalendarFeedRoutes:
+    """Test cases for the tokenised .ics feed."""
+
+    @staticmethod
+    def _select(db_session, booking, member):
+        """Put a member in a team for a booking."""
+        team = Team(booking_id=booking.id, team_name='Rink 1', created_by=booking.organizer_id)
+        db_session.add(team)
+        db_session.flush()
+        db_session.add(TeamMember(team_id=team.id, member_id=member.id, position='Lead'))
+        db_session.commit()
+
+    @staticmethod
+    def _feed_url(client, member, db_session):
+        """Ask for a calendar link so the member gets a token, then build their feed path."""
+        client.post('/bookings/calendar/link')
+        db_session.refresh(member)
+        return f'/bookings/calendar/{member.calendar_token}.ics'
+
+    def test_feed_lists_member_games(self, authenticated_client, test_member, db_session):
+        """Test the feed contains the member's team booking as an event."""
+        booking = BookingFactory.create(name='County Cup', vs='Rivals', session=2,
+                                        booking_date=date.today() + timedelta(days=4))
+        self._select(db_session, booking, test_member)
+
+        url = self._feed_url(authenticated_client, test_member, db_session)
+        response = authenticated_client.get(url)
+
+        assert response.status_code == 200
+        assert response.mimetype == 'text/calendar'
+        body = response.get_data(as_text=True)
+        assert body.startswith('BEGIN:VCALENDAR\r\n')
+        assert f'UID:booking-{booking.id}@' in body
+        assert 'SUMMARY:County Cup vs Rivals' in body
+
+        # The next poll is answered from the stored feed
+        assert authenticated_client.get(url, headers={'If-None-Match': response.headers['ETag']}).status_code == 304
+
+    def test_booking_change_only_invalidates_linked_members(self, authenticated_client, test_member, db_session):
+        """Test editing a booking drops the feeds of its members and leaves others alone."""
+        booking = BookingFactory.create(name='Friendly', booking_date=date.today() + timedelta(days=6))
+        self._select(db_session, booking, test_member)
+        bystander = MemberFactory.create()
+
+        url = self._feed_url(authenticated_client, test_member, db_session)
+        assert authenticated_client.get(url).status_code == 200
+        db_session.add(MemberCalendarFeed(member_id=bystander.id, body='stored'))
+        db_session.commit()
+
+        booking.name = 'Friendly (moved)'
+        db_session.commit()
+
+        stored = set(db_session.scalars(sa.select(MemberCalendarFeed.member_id)))
+        assert stored == {bystander.id}
+        assert 'SUMMARY:Friendly (moved)' in authenticated_client.get(url).get_data(as_text=True)
+
+    def test_unknown_or_reset_token_is_not_found(self, authenticated_client, test_member, db_session):
+        """Test a bad token 404s and resetting the token retires the old URL."""
+        assert authenticated_client.get('/bookings/calendar/not-a-token.ics').status_code == 404
+
+        old_url = self._feed_url(authenticated_client, test_member, db_session)
+        response = authenticated_client.post('/bookings/calendar/reset')
+
+        assert response.status_code == 302
+        db_session.refresh(test_member)
+        assert authenticated_client.get(old_url).status_code == 404
+        assert authenticated_client.get(f'/bookings/calendar/{test_member.calendar_token}.ics').status_code == 200
+
+    def test_my_games_does_not_create_token(self, authenticated_client, test_member, db_session):
+        """Test viewing My Games offers a link without issuing a token until asked."""
+        response = authenticated_client.get('/bookings/my_games')
+        assert response.status_code == 200
+        assert b'Get Calendar Link' in response.data
+        db_session.refresh(test_member)
+        assert test_member.calendar_token is None
+
+        url = self._feed_url(authenticated_client, test_member, db_session)
+        token = test_member.calendar_token
+        assert token
+        assert url.encode() in authenticated_client.get('/bookings/my_games').data
+
+        # Asking again keeps the existing link
+        authenticated_client.post('/bookings/calendar/link')
+        db_session.refresh(test_member)
+        assert test_member.calendar_token == token
@@ -110,6 +110,109 @@ class TestContentAdminRoutes:
         """Test create policy page requires Content Manager role."""
         response = authenticated_client.get('/content/admin/create_policy_page')
         assert response.status_code == 403
+    
+    def test_footer_policy_links_cached_until_page_deleted(self, admin_client, admin_member, db_session, count_queries):
+        """Test footer links are read once and dropped when a policy page is deleted."""
+        from app.content.utils import invalidate_footer_policy_pages
+        policy = PolicyPage(
+            title="Privacy Notice",
+            slug="privacy-notice",
+            description="How we use your data",
+            is_active=True,
+            show_in_footer=True,
+            sort_order=1,
+            markdown_filename="privacy-notice.md",
+            html_filename="privacy-notice.html",
+            author_id=admin_member.id
+        )
+        db_session.add(policy)
+        db_session.commit()
+        invalidate_footer_policy_pages()  # Added outside the admin routes
+        
+        admin_client.get('/')
+        with count_queries() as statements:
+            response = admin_client.get('/')
+        
+        assert b'Privacy Notice' in response.data
+        assert not [statement for statement in statements if 'policy_pages' in statement]
+        
+        admin_client.post(f'/content/admin/delete_policy_page/{policy.id}')
+        assert b'Privacy Notice' not in admin_client.get('/').data
+
+
+@pytest.mark.integration
+class TestPostImageServing:
+    """Test cases for HTTP caching of post images."""
+    
+    @pytest.fixture
+    def post_image(self, app, admin_member, db_session, tmp_path, monkeypatch):
+        """A published post with one image in a temporary posts directory."""
+        monkeypatch.setitem(app.config, 'POSTS_STORAGE_PATH', str(tmp_path))
+        directory_name = '1-0123abcd-club-news'
+        images_dir = tmp_path / directory_name / 'images'
+        images_dir.mkdir(parents=True)
+        (images_dir / 'hero.png').write_bytes(b'\x89PNG0123456789')
+        post = Post(
+            title="Club News",
+            summary="News",
+            publish_on=date.today(),
+            expires_on=date.today() + timedelta(days=30),
+            markdown_filename="post.md",
+            html_filename="post.html",
+            directory_name=directory_name,
+            hero_image='hero.png',
+            author_id=admin_member.id
+        )
+        db_session.add(post)
+        db_session.commit()
+        return f'/content/image/{post.id}/hero.png', directory_name
+    
+    def test_image_validators_304_and_range(self, admin_client, post_image):
+        """Test images carry validators and private caching, and honour conditional and range requests."""
+        url, _ = post_image
+        response = admin_client.get(url)
+        assert response.status_code == 200
+        assert response.data == b'\x89PNG0123456789'
+        etag, weak = response.get_etag()
+        assert etag and not weak
+        assert response.last_modified is not None
+        assert response.cache_control.private and not response.cache_control.public
+        assert response.cache_control.max_age == 3600
+        
+        assert admin_client.get(url, headers={'If-None-Match': f'"{etag}"'}).status_code == 304
+        
+        partial = admin_client.get(url, headers={'Range': 'bytes=0-3'})
+        assert partial.status_code == 206
+        assert partial.data == b'\x89PNG'
+    
+    def test_hero_image_rendered_as_thumbnail(self, admin_client, post_image):
+        """Test the home page and post admin list render the hero image's thumbnail URL."""
+        url, _ = post_image
+        thumbnail_url = f'{url}?size=thumb'.encode()
+        
+        home = admin_client.get('/')
+        assert home.status_code == 200
+        assert thumbnail_url in home.data
+        
+        manage = admin_client.get('/content/admin/manage_posts')
+        assert manage.status_code == 200
+        assert thumbnail_url in manage.data
+    
+    def test_image_offloaded_with_x_accel_redirect(self, app, admin_client, post_image, monkeypatch):
+        """Test the transfer is handed to the front-end server after the access checks."""
+        url, directory_name = post_image
+        monkeypatch.setitem(app.config, 'POST_IMAGE_OFFLOAD', 'x-accel-redirect')
+        
+        response = admin_client.get(url)
+        assert response.status_code == 200
+        assert response.headers['X-Accel-Redirect'] == f'/protected/posts/{directory_name}/images/hero.png'
+        assert 'X-Sendfile' not in response.headers
+        assert response.data == b''
+        
+        etag, _ = response.get_etag()
+        not_modified = admin_client.get(url, headers={'If-None-Match': f'"{etag}"'})
+        assert not_modified.status_code == 304
+        assert 'X-Accel-Redirect' not in not_modified.headers
 
 
 @pytest.mark.integration 
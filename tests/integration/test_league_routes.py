@@ -0,0 +1,141 @@
+"""
+Integration tests for league scheduling routes.
+"""
+import pytest
+import sqlalchemy as sa
+from datetime import date, timedelta
+from app.models import Booking, Pool, PoolRegistration, RinkOccupancy, Team
+from app.bookings.utils import get_series_summaries
+from tests.fixtures.factories import BookingFactory, MemberFactory
+
+
+LEAGUE_DETAILS = {
+    'league_name': 'Summer League',
+    'format': 5,
+    'event_type': 3,
+    'gender': 4,
+    'rink_count': 2,
+    'scoring': '21 Up'
+}
+
+
+@pytest.mark.integration
+class TestLeagueScheduleRoutes:
+    """Test cases for creating a league from the schedule table."""
+
+    @staticmethod
+    def _schedule(client, start, fixtures):
+        """Post a schedule with one weekly home fixture per row."""
+        with client.session_transaction() as sess:
+            sess['league_details'] = dict(LEAGUE_DETAILS)
+        form_data = {'create_all': 'true'}
+        for i in range(fixtures):
+            form_data[f'games-{i}-date'] = (start + timedelta(weeks=i)).isoformat()
+            form_data[f'games-{i}-session'] = '2'
+            form_data[f'games-{i}-venue'] = 'home'
+            form_data[f'games-{i}-opponent'] = f'Opponent {i}'
+        return client.post('/bookings/league/schedule', data=form_data)
+
+    def test_league_created_in_constant_statements(self, admin_client, db_session, count_queries):
+        """Test creating a league costs the same statements for short and long fixture lists."""
+        BookingFactory.create(booking_date=date.today() + timedelta(days=1), session=4, rink_count=1)
+        admin_client.get('/bookings/')  # Settle per-day activity tracking and role loading
+        with count_queries() as short:
+            response = self._schedule(admin_client, date.today() + timedelta(days=7), 3)
+        assert response.status_code == 302
+
+        with count_queries() as long:
+            response = self._schedule(admin_client, date.today() + timedelta(days=400), 15)
+        assert response.status_code == 302
+
+        assert len(long) == len(short)
+        assert db_session.scalar(sa.select(sa.func.count(Booking.id))) == 19
+
+        series_ids = db_session.scalars(sa.select(Booking.series_id).where(Booking.series_id != None).distinct()).all()
+        assert len(series_ids) == 2
+        primaries = db_session.scalars(sa.select(Booking).where(Booking.has_pool == True)).all()
+        assert len(primaries) == 2
+        assert all(b.pool is not None and b.series_name == 'Summer League' for b in primaries)
+        assert db_session.scalar(sa.select(sa.func.count(Pool.id))) == 2
+        assert db_session.scalar(sa.select(sa.func.sum(RinkOccupancy.used_rinks))) == 37
+
+    def test_league_rejected_when_any_fixture_is_full(self, admin_client, db_session):
+        """Test no fixtures are created when one of them lacks rinks."""
+        start = date.today() + timedelta(days=7)
+        BookingFactory.create(booking_date=start + timedelta(weeks=2), session=2, rink_count=5)
+
+        response = self._schedule(admin_client, start, 4)
+
+        assert response.status_code == 200
+        assert b'Not enough rinks available' in response.data
+        assert db_session.scalar(sa.select(sa.func.count(Booking.id))) == 1
+
+
+@pytest.mark.integration
+class TestLeagueOverview:
+    """Test cases for the league list and dashboard statistics."""
+
+    @staticmethod
+    def _league(db_session, series_id, name, start, games, teams=0, registrants=0):
+        """Create a weekly league with teams on its first games and a pool on the primary."""
+        bookings = [
+            BookingFactory.create(name=f'{name} R{i + 1}', booking_date=start + timedelta(weeks=i),
+                                  series_id=series_id, series_name=name if i == 0 else None, event_type=3)
+            for i in range(games)
+        ]
+        for booking in bookings[:teams]:
+            db_session.add(Team(booking_id=booking.id, team_name='Rink 1', created_by=booking.organizer_id))
+            db_session.add(Team(booking_id=booking.id, team_name='Rink 2', created_by=booking.organizer_id))
+        pool = Pool(booking_id=bookings[0].id, is_open=True)
+        db_session.add(pool)
+        db_session.flush()
+        for member in MemberFactory.create_batch(registrants):
+            db_session.add(PoolRegistration(pool_id=pool.id, member_id=member.id))
+        db_session.commit()
+        return bookings
+
+    def test_series_summaries(self, db_session):
+        """Test the aggregate counts games, games with teams, the next date and pool size."""
+        past = date.today() - timedelta(weeks=2)
+        self._league(db_session, 'league-a', 'Spring League', past, 5, teams=2, registrants=3)
+        self._league(db_session, 'league-b', 'Autumn League', date.today() + timedelta(days=3), 2)
+
+        summaries = {s['series_id']: s for s in get_series_summaries()}
+
+        spring = summaries['league-a']
+        assert spring['series_name'] == 'Spring League'
+        assert (spring['total_games'], spring['completed_games'], spring['pool_members']) == (5, 2, 3)
+        assert spring['next_game_date'] == past + timedelta(weeks=2)
+        assert summaries['league-b']['completed_games'] == 0
+        assert summaries['league-b']['next_game_date'] == date.today() + timedelta(days=3)
+
+    def test_league_list_statements_do_not_grow(self, admin_client, db_session, count_queries):
+        """Test the league list costs the same statements for one league or many."""
+        self._league(db_session, 'league-0', 'League 0', date.today(), 3, teams=1, registrants=2)
+        admin_client.get('/bookings/league/')  # Settle activity tracking and role loading
+        db_session.expire_all()
+        with count_queries() as few:
+            response = admin_client.get('/bookings/league/')
+        assert response.status_code == 200
+
+        for i in range(1, 6):
+            self._league(db_session, f'league-{i}', f'League {i}', date.today(), 4, teams=2, registrants=2)
+        db_session.expire_all()
+        with count_queries() as many:
+            response = admin_client.get('/bookings/league/')
+
+        assert response.status_code == 200
+        assert b'League 5' in response.data
+        assert len(many) == len(few)
+
+    def test_league_manage_shows_one_series(self, admin_client, db_session):
+        """Test the dashboard shows the selected league's stats and games only."""
+        self._league(db_session, 'league-x', 'Premier', date.today() + timedelta(days=1), 3, teams=1, registrants=4)
+        self._league(db_session, 'league-y', 'Division Two', date.today() + timedelta(days=1), 2)
+
+        response = admin_client.get('/bookings/league/league-x/manage')
+
+        assert response.status_code == 200
+        assert b'Premier' in response.data
+        assert b'Division Two' not in response.data
+        assert admin_client.get('/bookings/league/missing/manage').status_code == 302
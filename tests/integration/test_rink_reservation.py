@@ -0,0 +1,114 @@
+"""
+Integration tests for concurrency-safe rink reservation.
+"""
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, timedelta
+
+import pytest
+import sqlalchemy as sa
+
+from app import create_app, db
+from app.bookings.occupancy import reserve_rinks, RinkCapacityError, verify_rink_occupancy
+from app.bookings.utils import create_booking_with_defaults
+from app.models import Booking, Member, RinkOccupancy
+
+
+@pytest.fixture
+def file_app(tmp_path, monkeypatch):
+    """Create an app on a file-backed SQLite database so threads get their own connections."""
+    from config import config, TestingConfig
+
+    class FileTestingConfig(TestingConfig):
+        SQLALCHEMY_DATABASE_URI = f"sqlite:///{tmp_path / 'reservations.db'}"
+
+    monkeypatch.setitem(config, 'file_testing', FileTestingConfig)
+    app = create_app('file_testing')
+    with app.app_context():
+        db.create_all()
+    yield app
+    with app.app_context():
+        db.session.remove()
+        db.engine.dispose()
+
+
+@pytest.mark.integration
+class TestRinkReservation:
+    """Test cases for serialised capacity checks."""
+
+    def test_reserve_rinks_rejects_full_slot(self, app, db_session):
+        """Test a reservation beyond the free rinks raises with the conflicting slot."""
+        slot_date = date.today() + timedelta(days=5)
+        db_session.add(create_booking_with_defaults('Existing', booking_date=slot_date, session=2, rink_count=5))
+        db_session.commit()
+
+        reserve_rinks([(slot_date, 2, 1, 'home')])
+        db_session.rollback()
+
+        with pytest.raises(RinkCapacityError) as excinfo:
+            reserve_rinks([(slot_date, 2, 2, 'home')])
+        db_session.rollback()
+        assert excinfo.value.conflicts[0]['available'] == 1
+
+        # Away games never need a home rink
+        reserve_rinks([(slot_date, 2, 4, 'away')])
+        db_session.rollback()
+
+    def test_book_rollup_refuses_full_session(self, authenticated_client, db_session):
+        """Test roll-ups can no longer be booked into a session with no free rinks."""
+        slot_date = date.today() + timedelta(days=2)
+        db_session.add(create_booking_with_defaults('Full House', booking_date=slot_date, session=3, rink_count=6))
+        db_session.commit()
+
+        response = authenticated_client.post('/rollups/book', data={
+            'booking_date': slot_date.isoformat(),
+            'session': '3',
+            'organizer_notes': '',
+            'invited_players': ''
+        })
+
+        assert response.status_code == 200
+        assert b'No rinks are free for that session' in response.data
+        assert db_session.query(Booking).count() == 1
+
+    def test_concurrent_reservations_never_overbook(self, file_app):
+        """Test many threads racing for one slot fill it exactly to capacity."""
+        slot_date = date.today() + timedelta(days=3)
+        threads = 16
+        rinks = file_app.config['RINKS']
+
+        with file_app.app_context():
+            member = Member(username='racer', firstname='Race', lastname='Tester',
+                            email='racer@example.com', status='Full', joined_date=date.today())
+            member.set_password('password123')
+            db.session.add(member)
+            db.session.commit()
+            member_id = member.id
+
+        start = threading.Barrier(threads)
+
+        def book(index):
+            with file_app.app_context():
+                try:
+                    start.wait()
+                    reserve_rinks([(slot_date, 1, 1, 'home')])
+                    db.session.add(create_booking_with_defaults(
+                        f'Racer {index}', booking_date=slot_date, session=1,
+                        rink_count=1, organizer_id=member_id
+                    ))
+                    db.session.commit()
+                    return True
+                except RinkCapacityError:
+                    db.session.rollback()
+                    return False
+                finally:
+                    db.session.remove()
+
+        with ThreadPoolExecutor(max_workers=threads) as pool:
+            outcomes = list(pool.map(book, range(threads)))
+
+        assert outcomes.count(True) == rinks
+        with file_app.app_context():
+            assert db.session.scalar(sa.select(sa.func.sum(Booking.rink_count))) == rinks
+            assert db.session.get(RinkOccupancy, (slot_date, 1)).used_rinks == rinks
+            assert verify_rink_occupancy() == []
@@ -0,0 +1,77 @@
+"""
+Integration tests for the upcoming events page and API.
+"""
+import pytest
+import json
+from datetime import date, timedelta
+from app.models import Pool, PoolRegistration, Team, TeamMember
+from tests.fixtures.factories import MemberFactory, BookingFactory
+
+
+@pytest.mark.integration
+class TestUpcomingEvents:
+    """Test cases for listing events with registration pools."""
+
+    @staticmethod
+    def _pool_event(db_session, name, days_ahead, registrants=()):
+        """Create a booking with an open pool and the given registrations."""
+        booking = BookingFactory.create(name=name, booking_date=date.today() + timedelta(days=days_ahead), has_pool=True)
+        pool = Pool(booking_id=booking.id, is_open=True)
+        db_session.add(pool)
+        db_session.flush()
+        for member in registrants:
+            db_session.add(PoolRegistration(pool_id=pool.id, member_id=member.id))
+        db_session.commit()
+        return booking
+
+    def test_api_counts_and_own_registration(self, authenticated_client, db_session, test_member):
+        """Test the API returns counts, the user's status and only events in the window."""
+        others = MemberFactory.create_batch(3)
+        joined = self._pool_event(db_session, 'Joined Event', 3, [test_member] + others)
+        self._pool_event(db_session, 'Open Event', 5, others[:1])
+        self._pool_event(db_session, 'Past Event', -5, others)
+        self._pool_event(db_session, 'Far Event', 400)
+
+        response = authenticated_client.get('/api/events/upcoming')
+
+        assert response.status_code == 200
+        data = json.loads(response.data)
+        assert [e['name'] for e in data['events']] == ['Joined Event', 'Open Event']
+        assert data['events'][0]['id'] == joined.id
+        assert data['events'][0]['pool_count'] == 4
+        assert data['events'][0]['registration_status'] == 'registered'
+        assert data['events'][1]['pool_count'] == 1
+        assert data['events'][1]['registration_status'] == 'not_registered'
+        assert data['pagination']['total'] == 2
+
+    def test_api_pagination(self, authenticated_client, db_session):
+        """Test events are paged in date order."""
+        for i in range(5):
+            self._pool_event(db_session, f'Event {i}', i + 1)
+
+        data = json.loads(authenticated_client.get('/api/events/upcoming?page=2&per_page=2').data)
+
+        assert [e['name'] for e in data['events']] == ['Event 2', 'Event 3']
+        assert data['pagination']['total_pages'] == 3
+        assert data['pagination']['has_next'] is True
+
+    def test_api_rejects_bad_dates(self, authenticated_client):
+        """Test an invalid date window is a 400."""
+        response = authenticated_client.get('/api/events/upcoming?start_date=soon')
+        assert response.status_code == 400
+
+    def test_page_hides_events_already_in_a_team(self, authenticated_client, db_session, test_member):
+        """Test the page lists pool events but not ones the user has been selected for."""
+        self._pool_event(db_session, 'Open Social', 4)
+        selected = self._pool_event(db_session, 'Selected Friendly', 6, [test_member])
+        team = Team(booking_id=selected.id, team_name='Rink 1', created_by=selected.organizer_id)
+        db_session.add(team)
+        db_session.flush()
+        db_session.add(TeamMember(team_id=team.id, member_id=test_member.id, position='Lead'))
+        db_session.commit()
+
+        response = authenticated_client.get('/upcoming_events')
+
+        assert response.status_code == 200
+        assert b'Open Social' in response.data
+        assert b'Selected Friendly' not in response.data
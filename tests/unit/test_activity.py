@@ -0,0 +1,54 @@
+"""
+Unit tests for the last_seen write-behind buffer.
+"""
+import pytest
+from datetime import date, timedelta
+from app.activity import last_seen_buffer
+from tests.fixtures.factories import MemberFactory
+
+
+@pytest.mark.unit
+class TestLastSeenBuffer:
+    """Test cases for buffering and bulk-writing member activity dates."""
+
+    @pytest.fixture(autouse=True)
+    def empty_buffer(self, app):
+        """Start and finish each test with an empty buffer."""
+        last_seen_buffer.init_app(app)
+        yield
+        last_seen_buffer.init_app(app)
+
+    def test_first_request_of_day_does_not_write(self, authenticated_client, test_member, db_session, count_queries):
+        """Test the day's first request only buffers the date and later requests skip it."""
+        with count_queries() as statements:
+            authenticated_client.get('/')
+            authenticated_client.get('/')
+
+        assert not [statement for statement in statements if statement.startswith('UPDATE member')]
+        assert last_seen_buffer.pending() == {test_member.id: date.today()}
+
+    def test_flush_writes_all_members_in_one_statement(self, db_session, count_queries):
+        """Test buffered dates are written with one UPDATE per date."""
+        members = MemberFactory.create_batch(3)
+        for member in members:
+            last_seen_buffer.record(member.id, date.today())
+
+        with count_queries() as statements:
+            written = last_seen_buffer.flush()
+
+        assert written == 3
+        assert len([statement for statement in statements if statement.startswith('UPDATE member')]) == 1
+        for member in members:
+            db_session.refresh(member)
+            assert member.last_seen == date.today()
+        assert last_seen_buffer.pending() == {}
+
+    def test_flush_never_moves_last_seen_backwards(self, db_session):
+        """Test a stale buffered date leaves a newer stored date alone."""
+        member = MemberFactory.create(last_seen=date.today())
+        last_seen_buffer.record(member.id, date.today() - timedelta(days=1))
+
+        last_seen_buffer.flush()
+
+        db_session.refresh(member)
+        assert member.last_seen == date.today()
@@ -0,0 +1,72 @@
+"""
+Unit tests for the audit log index and search commands.
+"""
+import json
+import logging
+import pytest
+from unittest.mock import patch
+from app.audit import GzipRotatingFileHandler, JsonLinesFormatter
+from app.audit_index import update_audit_index, search_audit_log
+
+
+@pytest.mark.unit
+class TestAuditIndex:
+    """Test cases for indexing rotated JSON-lines audit segments."""
+
+    @pytest.fixture
+    def writer(self, tmp_path):
+        """A rotating JSON-lines handler writing into a temporary log directory."""
+        handler = GzipRotatingFileHandler(str(tmp_path / 'audit.log'), encoding='utf-8', maxBytes=10 ** 9)
+        handler.setFormatter(JsonLinesFormatter())
+        yield handler
+        handler.close()
+
+    @staticmethod
+    def _write(handler, model, record_id, user='alice', user_id=7):
+        record = logging.LogRecord('audit', logging.INFO, __file__, 1, f'UPDATE | {model} | ID: {record_id}', None, None)
+        record.audit = {'event': 'UPDATE', 'model': model, 'record_id': str(record_id), 'user': user, 'user_id': user_id}
+        handler.handle(record)
+        handler.flush()
+
+    def test_lookup_spans_archives_and_live_segment(self, writer, tmp_path):
+        """Test entries for a record are found in archives and the live file, oldest first."""
+        self._write(writer, 'Booking', 123)
+        self._write(writer, 'Booking', 124)
+        writer.doRollover()
+        self._write(writer, 'Member', 5, user='bob', user_id=8)
+        self._write(writer, 'Booking', 123, user='bob', user_id=8)
+
+        result = update_audit_index(str(tmp_path))
+        entries = search_audit_log(str(tmp_path), model='Booking', record_id=123)
+
+        assert result == {'segments_read': 2, 'entries': 4}
+        assert len(list(tmp_path.glob('audit-*.log.gz'))) == 1
+        assert [entry['user'] for entry in entries] == ['alice', 'bob']
+        assert [entry['model'] for entry in search_audit_log(str(tmp_path), user='8')] == ['Member', 'Booking']
+
+    def test_incremental_update_keeps_entries_across_rollover(self, writer, tmp_path):
+        """Test a rolled live segment is recognised as its archive and not indexed twice."""
+        self._write(writer, 'Booking', 1)
+        update_audit_index(str(tmp_path))
+        self._write(writer, 'Booking', 2)
+        writer.doRollover()
+        self._write(writer, 'Booking', 3)
+
+        result = update_audit_index(str(tmp_path))
+        entries = search_audit_log(str(tmp_path), model='Booking')
+
+        assert result['entries'] == 3
+        assert [entry['record_id'] for entry in entries] == ['1', '2', '3']
+        assert update_audit_index(str(tmp_path))['segments_read'] == 1  # Only the live file is re-checked
+
+    def test_search_command(self, app, writer, tmp_path):
+        """Test `flask audit search` prints matching entries as JSON lines."""
+        self._write(writer, 'Booking', 123)
+        self._write(writer, 'Booking', 999)
+
+        with patch('app.audit_index.audit_log_dir', return_value=str(tmp_path)):
+            result = app.test_cli_runner(mix_stderr=False).invoke(
+                args=['audit', 'search', '--model', 'Booking', '--record-id', '123', '--since', '2000-01-01'])
+
+        assert result.exit_code == 0
+        assert [json.loads(line)['record_id'] for line in result.stdout.splitlines()] == ['123']
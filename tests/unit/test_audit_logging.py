@@ -6,6 +6,7 @@ security requirements in CLAUDE.md. No application code is modified.
 """
 
 import pytest
+import json
 import logging
 from datetime import datetime
 from unittest.mock import patch, MagicMock
@@ -324,4 +325,150 @@ class TestAuditLogIntegration:
                 mock_logger.info.assert_called_once()
                 # Should not raise serialization errors
                 log_message = mock_logger.info.call_args[0][0]
-                assert 'Member' in log_message
\ No newline at end of file
+                assert 'Member' in log_message
+
+class TestAuditLogWriter:
+    """Test the queue-backed audit log writer."""
+
+    @staticmethod
+    def _log_lines(app):
+        """JSON lines in audit.log (older plain-text lines are skipped)."""
+        import os
+        with open(os.path.join(app.instance_path, 'logs', 'audit.log'), encoding='utf-8') as log_file:
+            return [line for line in log_file.read().splitlines() if line.startswith('{')]
+
+    def test_entries_written_in_order_by_background_writer(self, app):
+        """Test queued entries all reach audit.log, in order, once flushed."""
+        from app.audit import setup_audit_logger, flush_audit_log, BlockingQueueHandler
+        with app.test_request_context():
+            logger = setup_audit_logger()
+            assert setup_audit_logger() is logger
+            assert [type(handler) for handler in logger.handlers] == [BlockingQueueHandler]
+
+            for record_id in range(50):
+                audit_log_create('Member', record_id, f'Queued writer test {record_id}')
+            flush_audit_log()
+
+        entries = [json.loads(line) for line in self._log_lines(app) if 'Queued writer test' in line]
+        assert [entry['record_id'] for entry in entries[-50:]] == [str(i) for i in range(50)]
+        assert entries[-1]['event'] == 'CREATE' and entries[-1]['model'] == 'Member'
+        assert entries[-1]['user'] == 'SYSTEM' and entries[-1]['level'] == 'INFO'
+
+    def test_changes_and_additional_data_are_kept(self, app):
+        """Test the JSON line carries the changes and data the caller passed."""
+        from app.audit import flush_audit_log
+        with app.test_request_context():
+            audit_log_update('Booking', 123, 'Kept fields test', {'rink_count': '2'}, {'series': 'abc'})
+            flush_audit_log()
+
+        entry = json.loads([line for line in self._log_lines(app) if 'Kept fields test' in line][-1])
+        assert entry['changes'] == {'rink_count': '2'}
+        assert entry['data'] == {'series': 'abc'}
+        assert entry['record_id'] == '123'
+        assert entry['message'].startswith('UPDATE | Booking | ID: 123 | User: SYSTEM')
+
+    def test_full_queue_writes_in_caller_instead_of_dropping(self, app):
+        """Test a record that cannot be queued is written directly."""
+        from app.audit import BlockingQueueHandler
+        from queue import Queue
+        fallback = MagicMock()
+        full_queue = Queue(maxsize=1)
+        full_queue.put('pending')
+        handler = BlockingQueueHandler(full_queue, fallback)
+        record = logging.LogRecord('audit', logging.INFO, __file__, 1, 'Overflow entry', None, None)
+
+        with patch('app.audit.AUDIT_QUEUE_PUT_TIMEOUT', 0.01):
+            handler.handle(record)
+
+        fallback.handle.assert_called_once()
+        assert full_queue.qsize() == 1
+
+
+class TestSessionAuditEvents:
+    """Test audit batches captured from session flush and commit events."""
+
+    @staticmethod
+    def _log_path(app):
+        import os
+        return os.path.join(app.instance_path, 'logs', 'audit.log')
+
+    def _log_offset(self, app):
+        """Current end of audit.log, so a test only reads what it wrote."""
+        import os
+        from app.audit import flush_audit_log
+        flush_audit_log()
+        return os.path.getsize(self._log_path(app)) if os.path.exists(self._log_path(app)) else 0
+
+    def _entries_since(self, app, offset):
+        import os
+        from app.audit import flush_audit_log
+        flush_audit_log()
+        if not os.path.exists(self._log_path(app)):
+            return []
+        with open(self._log_path(app), 'rb') as log_file:
+            log_file.seek(offset)
+            lines = log_file.read().decode('utf-8').splitlines()
+        return [json.loads(line) for line in lines if line.startswith('{')]
+
+    def test_transaction_written_as_one_batch(self, app, db_session, monkeypatch):
+        """Test inserts, updates and deletes in one commit share a transaction ID."""
+        monkeypatch.setitem(app.config, 'AUDIT_SESSION_EVENTS', True)
+        with app.test_request_context():
+            offset = self._log_offset(app)
+            keep = Role(name='Batch Keep Role')
+            drop = Role(name='Batch Drop Role')
+            db_session.add_all([keep, drop])
+            db_session.commit()
+
+            keep.name = 'Batch Renamed Role'
+            db_session.delete(drop)
+            db_session.commit()
+
+            entries = self._entries_since(app, offset)
+
+        creates, changes = entries[:2], entries[2:]
+        assert [entry['event'] for entry in creates] == ['CREATE', 'CREATE']
+        assert {entry['data']['name'] for entry in creates} == {'Batch Keep Role', 'Batch Drop Role'}
+        assert sorted(entry['event'] for entry in changes) == ['DELETE', 'UPDATE']
+        assert len({entry['txn'] for entry in changes}) == 1
+        update = next(entry for entry in changes if entry['event'] == 'UPDATE')
+        assert update['record_id'] == str(keep.id)
+        assert update['changes'] == {'name': {'old': 'Batch Keep Role', 'new': 'Batch Renamed Role'}}
+        delete = next(entry for entry in changes if entry['event'] == 'DELETE')
+        assert delete['data']['name'] == 'Batch Drop Role'
+
+    def test_rollback_and_disabled_write_nothing(self, app, db_session, monkeypatch):
+        """Test rolled back changes and the default (disabled) setting are not logged."""
+        with app.test_request_context():
+            offset = self._log_offset(app)
+            db_session.add(Role(name='Unaudited Default Role'))
+            db_session.commit()
+
+            monkeypatch.setitem(app.config, 'AUDIT_SESSION_EVENTS', True)
+            db_session.add(Role(name='Unaudited Rolled Back Role'))
+            db_session.flush()
+            db_session.rollback()
+
+            assert self._entries_since(app, offset) == []
+
+    def test_secrets_redacted_and_bulk_inserts_captured(self, app, db_session, monkeypatch):
+        """Test password hashes are redacted and ORM bulk insert rows are recorded."""
+        import sqlalchemy as sa
+        monkeypatch.setitem(app.config, 'AUDIT_SESSION_EVENTS', True)
+        with app.test_request_context():
+            offset = self._log_offset(app)
+            member = Member(username='batchsecret', firstname='Batch', lastname='Secret',
+                            email='batchsecret@example.com', joined_date=datetime(2024, 1, 1).date())
+            member.set_password('hunter22')
+            db_session.add(member)
+            db_session.execute(sa.insert(Role), [{'name': 'Bulk Batch Role A'}, {'name': 'Bulk Batch Role B'}])
+            db_session.commit()
+
+            entries = self._entries_since(app, offset)
+
+        member_entry = next(entry for entry in entries if entry['model'] == 'Member')
+        assert member_entry['data']['password_hash'] == '[redacted]'
+        bulk = [entry for entry in entries if entry['model'] == 'Role']
+        assert [entry['data']['name'] for entry in bulk] == ['Bulk Batch Role A', 'Bulk Batch Role B']
+        assert 'record_id' not in bulk[0]
+        assert len({entry['txn'] for entry in entries}) == 1
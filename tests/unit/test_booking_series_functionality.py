@@ -356,4 +356,80 @@ class TestBookingSeriesIntegration:
             # Test series bookings retrieval
             series_bookings = booking2.get_series_bookings()
             assert len(series_bookings) == 3
-            assert series_bookings[0].id == booking1.id  # Earliest date first
\ No newline at end of file
+            assert series_bookings[0].id == booking1.id  # Earliest date first
+
+class TestSeriesTable:
+    """Test cases for the booking_series table maintained from booking flushes."""
+    
+    def test_series_row_follows_bookings(self, app, db_session):
+        """Test the primary, name, organizer and pool move with booking and pool changes."""
+        from app.models import Pool, Series
+        from app.bookings.series import verify_series
+        from tests.fixtures.factories import BookingFactory
+        
+        series_id = str(uuid.uuid4())
+        later = BookingFactory.create(booking_date=date.today() + timedelta(days=8), series_id=series_id,
+                                      series_name='Winter League', event_type=3)
+        series = db_session.get(Series, series_id)
+        assert series.primary_booking_id == later.id and series.name == 'Winter League'
+        
+        earlier = BookingFactory.create(booking_date=date.today() + timedelta(days=1), series_id=series_id, event_type=3)
+        db_session.add(Pool(booking_id=earlier.id, is_open=True))
+        db_session.commit()
+        assert series.primary_booking_id == earlier.id
+        assert series.organizer_id == earlier.organizer_id
+        assert series.pool_id == earlier.pool.id
+        assert series.name == 'Winter League'  # Taken from the other booking until the primary has one
+        assert later.get_effective_pool() is earlier.pool
+        
+        db_session.delete(earlier)
+        db_session.commit()
+        assert series.primary_booking_id == later.id and series.pool_id is None
+        
+        db_session.delete(later)
+        db_session.commit()
+        assert db_session.get(Series, series_id) is None
+        assert verify_series() == []
+    
+    def test_bulk_insert_syncs_series(self, app, db_session):
+        """Test bookings added by ORM bulk insert create and update their series."""
+        import sqlalchemy as sa
+        from app.models import Booking, Series
+        from app.bookings.utils import booking_values_with_defaults
+        
+        series_id = str(uuid.uuid4())
+        rows = [booking_values_with_defaults(f'Fixture {i}', series_id=series_id,
+                                             booking_date=date.today() + timedelta(days=10 - i))
+                for i in range(3)]
+        rows[1]['series_name'] = 'Bulk League'
+        db_session.execute(sa.insert(Booking), rows)
+        db_session.commit()
+        
+        series = db_session.get(Series, series_id)
+        earliest = db_session.scalar(sa.select(Booking).where(Booking.name == 'Fixture 2'))
+        assert series.primary_booking_id == earliest.id
+        assert series.name == 'Bulk League'
+        assert db_session.scalar(sa.select(sa.func.count(Booking.id))) == 3
+    
+    def test_series_helpers_use_one_lookup(self, app, db_session, count_queries):
+        """Test series helpers resolve a non-primary booking with a single primary-key get."""
+        from app.bookings.utils import get_effective_organizer_for_booking, get_primary_booking_in_series
+        from tests.fixtures.factories import BookingFactory
+        
+        series_id = str(uuid.uuid4())
+        primary = BookingFactory.create(booking_date=date.today() + timedelta(days=1), series_id=series_id,
+                                        series_name='Cup Run')
+        follower = BookingFactory.create(booking_date=date.today() + timedelta(days=8), series_id=series_id,
+                                         organizer=None)
+        db_session.expire_all()
+        follower = db_session.get(type(follower), follower.id)
+        primary = db_session.get(type(primary), primary.id)
+        organizer = primary.organizer
+        
+        with count_queries() as statements:
+            assert follower.get_series_name() == 'Cup Run'
+            assert get_primary_booking_in_series(series_id) is primary
+            assert follower.is_primary_booking_in_series() is False
+            assert get_effective_organizer_for_booking(follower) is organizer
+        
+        assert len(statements) == 1
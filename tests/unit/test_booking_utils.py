@@ -3,7 +3,7 @@ Unit tests for booking utility functions.
 """
 import pytest
 import sqlalchemy as sa
-from app.bookings.utils import add_home_games_filter
+from app.bookings.utils import add_home_games_filter, expand_recurrence
 from app.models import Booking, Member
 from tests.fixtures.factories import MemberFactory, BookingFactory
 
@@ -229,4 +229,17 @@ class TestBookingUtils:
             # Should only return the January home booking
             assert len(results) == 1
             assert results[0].home_away == 'home'
-            assert results[0].rink_count == 2
\ No newline at end of file
+            assert results[0].rink_count == 2
+
+    def test_expand_recurrence(self):
+        """Test weekly and fortnightly rules expand with end date and skip dates."""
+        from datetime import date
+
+        start = date(2025, 4, 1)
+        weekly = expand_recurrence(start, date(2025, 4, 29), 7, skip_dates=[date(2025, 4, 15)])
+        assert weekly == [date(2025, 4, 1), date(2025, 4, 8), date(2025, 4, 22), date(2025, 4, 29)]
+
+        fortnightly = expand_recurrence(start, date(2025, 4, 28), 14)
+        assert fortnightly == [date(2025, 4, 1), date(2025, 4, 15)]
+
+        assert expand_recurrence(start, date(2025, 3, 1), 7) == []
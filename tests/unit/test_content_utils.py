@@ -155,4 +155,34 @@ This is the content of the post."""
             # Test with empty filename
             success, message, policy = recover_orphaned_policy_page("", 1)
             assert not success
-            assert policy is None
\ No newline at end of file
+            assert policy is None
+    
+    def test_sanitized_html_written_once_and_cached(self, app, tmp_path):
+        """Test saved HTML is served without sanitizing again, and reloaded when the file changes."""
+        with app.app_context():
+            from app.content.utils import write_sanitized_html, read_sanitized_html
+            html_path = str(tmp_path / 'post.html')
+            
+            written = write_sanitized_html(html_path, "<p>Hello</p><script>alert('bad')</script>")
+            assert "<script>" not in written
+            
+            with patch('app.content.utils.sanitize_html_content') as mock_sanitize:
+                assert read_sanitized_html(html_path) == written
+                assert read_sanitized_html(html_path) == written
+                mock_sanitize.assert_not_called()
+            
+            write_sanitized_html(html_path, "<p>Edited announcement</p>")
+            assert read_sanitized_html(html_path) == "<p>Edited announcement</p>"
+    
+    def test_unmarked_html_is_sanitized_on_read(self, app, tmp_path):
+        """Test HTML files written before sanitize-on-save are still sanitized when served."""
+        with app.app_context():
+            from app.content.utils import read_sanitized_html
+            html_path = tmp_path / 'legacy.html'
+            html_path.write_text("<!-- sanitized -->\n<script>alert('bad')</script>", encoding='utf-8')
+            
+            result = read_sanitized_html(str(html_path))
+            assert "<script>" not in result
+            
+            with pytest.raises(FileNotFoundError):
+                read_sanitized_html(str(tmp_path / 'missing.html'))
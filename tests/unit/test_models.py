@@ -82,6 +82,23 @@ class TestMember:
         assert member.has_role('Test Role 2') is True
         assert member.has_role('Nonexistent Role') is False
     
+    def test_member_role_names_cached_per_request(self, app, db_session):
+        """Test role names are frozen for the request and refreshed when roles change."""
+        member = MemberFactory.create()
+        role = RoleFactory.create(name='Test Role 1')
+        db_session.commit()
+        
+        with app.test_request_context():
+            assert member.role_names == frozenset()
+            assert member.role_names is member.role_names
+            
+            member.roles.append(role)
+            assert member.has_role('Test Role 1') is True
+            assert member.has_any_role('Other Role', 'Test Role 1') is True
+            
+            member.roles = []
+            assert member.has_any_role('Test Role 1') is False
+    
     def test_member_repr(self, db_session):
         """Test member string representation."""
         member = MemberFactory.create(
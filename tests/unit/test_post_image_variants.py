@@ -0,0 +1,49 @@
+"""
+Unit tests for resized post image variants.
+"""
+import pytest
+from PIL import Image
+
+
+@pytest.mark.unit
+class TestPostImageVariants:
+    """Test cases for upload-time image variants."""
+
+    @staticmethod
+    def _photo(path, size=(2400, 1200)):
+        """Save a JPEG carrying EXIF metadata, as a phone would."""
+        exif = Image.Exif()
+        exif[0x010F] = 'PhoneMaker'  # Make
+        Image.new('RGB', size, (30, 120, 60)).save(path, format='JPEG', exif=exif.tobytes())
+        return str(path)
+
+    def test_variants_resized_and_stripped(self, app, tmp_path):
+        """Test each variant is width-limited, never enlarged and has no EXIF."""
+        with app.app_context():
+            from app.content.images import schedule_image_variants, image_variant_path
+            image_path = self._photo(tmp_path / 'hero.jpg')
+
+            assert schedule_image_variants(image_path)
+            assert not schedule_image_variants(image_path)  # Same version already done
+
+            for size, width in app.config['POST_IMAGE_VARIANTS'].items():
+                with Image.open(image_variant_path(image_path, size)) as variant:
+                    assert variant.size == (width, width // 2)
+                    assert not variant.getexif()
+
+            small_path = self._photo(tmp_path / 'small.jpg', size=(200, 100))
+            schedule_image_variants(small_path)
+            with Image.open(image_variant_path(small_path, 'full')) as variant:
+                assert variant.size == (200, 100)
+
+    def test_variant_chosen_by_size_with_fallback(self, app, tmp_path):
+        """Test the size parameter picks a variant and the original is served until one exists."""
+        with app.app_context():
+            from app.content.images import get_image_variant_path, image_variant_path
+            image_path = self._photo(tmp_path / 'news.jpg')
+
+            # First request finds no variant, serves the original and renders the variants
+            assert get_image_variant_path(image_path, 'thumb') is None
+            assert get_image_variant_path(image_path, 'thumb') == image_variant_path(image_path, 'thumb')
+            assert get_image_variant_path(image_path, 'huge') == image_variant_path(image_path, 'full')
+            assert get_image_variant_path(image_path) == image_variant_path(image_path, 'full')
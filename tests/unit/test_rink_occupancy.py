@@ -0,0 +1,101 @@
+"""
+Unit tests for the rink occupancy index.
+"""
+import pytest
+from datetime import date, timedelta
+from app.bookings.occupancy import get_used_rinks, get_occupancy_for_range, verify_rink_occupancy, rebuild_rink_occupancy
+from app.bookings.occupancy import check_slot_availability
+from app.models import RinkOccupancy
+from tests.fixtures.factories import BookingFactory
+
+
+@pytest.mark.unit
+class TestRinkOccupancy:
+    """Test cases for incremental maintenance of the rink occupancy index."""
+
+    def test_insert_updates_index(self, app, db_session):
+        """Test creating bookings adds their rinks to the slot."""
+        game_date = date.today() + timedelta(days=3)
+        BookingFactory.create(booking_date=game_date, session=2, rink_count=2)
+        BookingFactory.create(booking_date=game_date, session=2, rink_count=1)
+
+        assert get_used_rinks(game_date, 2) == 3
+        assert get_used_rinks(game_date, 1) == 0
+        assert verify_rink_occupancy() == []
+
+    def test_away_games_not_counted(self, app, db_session):
+        """Test away bookings do not occupy home rinks."""
+        game_date = date.today() + timedelta(days=3)
+        BookingFactory.create(booking_date=game_date, session=1, rink_count=4, home_away='away')
+        BookingFactory.create(booking_date=game_date, session=1, rink_count=1, home_away=None)
+
+        assert get_used_rinks(game_date, 1) == 1
+
+    def test_edit_and_move_update_index(self, app, db_session):
+        """Test editing rink count, moving a booking and switching venue."""
+        first_date = date.today() + timedelta(days=3)
+        second_date = first_date + timedelta(days=7)
+        booking = BookingFactory.create(booking_date=first_date, session=1, rink_count=2)
+
+        booking.rink_count = 3
+        db_session.commit()
+        assert get_used_rinks(first_date, 1) == 3
+
+        booking.booking_date = second_date
+        booking.session = 3
+        db_session.commit()
+        assert get_used_rinks(first_date, 1) == 0
+        assert get_used_rinks(second_date, 3) == 3
+
+        booking.home_away = 'away'
+        db_session.commit()
+        assert get_used_rinks(second_date, 3) == 0
+        assert verify_rink_occupancy() == []
+
+    def test_delete_updates_index(self, app, db_session):
+        """Test deleting a booking frees its rinks."""
+        game_date = date.today() + timedelta(days=3)
+        booking = BookingFactory.create(booking_date=game_date, session=1, rink_count=2)
+        BookingFactory.create(booking_date=game_date, session=1, rink_count=1)
+
+        db_session.delete(booking)
+        db_session.commit()
+
+        assert get_used_rinks(game_date, 1) == 1
+        assert get_occupancy_for_range(game_date, game_date) == {game_date.isoformat(): {1: 1}}
+
+    def test_verify_and_rebuild(self, app, db_session, runner):
+        """Test verify detects drift and rebuild repairs it."""
+        game_date = date.today() + timedelta(days=3)
+        BookingFactory.create(booking_date=game_date, session=1, rink_count=2)
+
+        row = db_session.get(RinkOccupancy, (game_date, 1))
+        row.used_rinks = 5
+        db_session.commit()
+        assert verify_rink_occupancy() == [(game_date, 1, 5, 2)]
+
+        result = runner.invoke(args=['bookings', 'occupancy-verify'])
+        assert result.exit_code == 1
+
+        assert rebuild_rink_occupancy() == 1
+        assert get_used_rinks(game_date, 1) == 2
+
+        result = runner.invoke(args=['bookings', 'occupancy-verify'])
+        assert result.exit_code == 0
+        assert 'consistent' in result.output
+
+    def test_check_slot_availability_batch(self, app, db_session):
+        """Test a batch of slots is checked against occupancy and against itself."""
+        game_date = date.today() + timedelta(days=3)
+        BookingFactory.create(booking_date=game_date, session=1, rink_count=4)
+
+        results = check_slot_availability([
+            (game_date, 1, 2, 'home'),
+            (game_date, 1, 1, 'home'),
+            (game_date, 1, 3, 'away'),
+            (game_date, 2, 6, None),
+        ], total_rinks=6)
+
+        assert [r['ok'] for r in results] == [True, False, True, True]
+        assert results[0]['available'] == 2
+        assert results[1]['available'] == 0
@@ -163,6 +163,33 @@ class TestAdminMenuUtils:
         
         # Admin should see all menu items
         assert len(filtered_menu) == 2
+    
+    @patch('app.members.utils.current_app')
+    @patch.object(Member, 'is_authenticated', new_callable=lambda: True)
+    def test_filter_admin_menu_memoised_per_role_set(self, mock_authenticated, mock_app, db_session):
+        """Test members with the same roles share one filtered menu and others get their own."""
+        user_manager_role = Role(name='User Manager')
+        content_manager_role = Role(name='Content Manager')
+        first, second, other = MemberFactory.create_batch(3)
+        first.roles = [user_manager_role]
+        second.roles = [user_manager_role]
+        other.roles = [content_manager_role]
+        db_session.commit()
+        
+        test_menu_items = [
+            {'name': 'Manage Members', 'link': 'members.admin_manage_members', 'roles': ['User Manager']},
+            None,
+            {'name': 'Manage Posts', 'link': 'admin.manage_posts', 'roles': ['Content Manager']},
+        ]
+        mock_config = MagicMock()
+        mock_config.get.return_value = test_menu_items
+        mock_app.config = mock_config
+        
+        menu = filter_admin_menu_by_roles(first)
+        
+        assert filter_admin_menu_by_roles(second) is menu
+        assert [item['name'] for item in menu] == ['Manage Members']
+        assert [item['name'] for item in filter_admin_menu_by_roles(other)] == ['Manage Posts']
 
 
 @pytest.mark.unit